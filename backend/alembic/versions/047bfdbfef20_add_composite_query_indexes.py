@@ -0,0 +1,50 @@
+"""add composite query indexes
+
+Revision ID: 047bfdbfef20
+Revises: faf544a4233e
+Create Date: 2026-10-17 07:52:07.738620
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "047bfdbfef20"
+down_revision: str | Sequence[str] | None = "faf544a4233e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, table, columns) for every index added here
+INDEXES = [
+    (
+        "ix_applications_user_applied",
+        "applications",
+        ["user_id", "applied_at", "created_at", "id"],
+    ),
+    ("ix_applications_user_job_url", "applications", ["user_id", "job_url"]),
+    ("ix_applications_status_id", "applications", ["status_id"]),
+    ("ix_job_leads_user_scraped", "job_leads", ["user_id", "scraped_at", "id"]),
+    ("ix_job_leads_user_url", "job_leads", ["user_id", "url"]),
+    (
+        "ix_application_status_history_application_changed",
+        "application_status_history",
+        ["application_id", "changed_at"],
+    ),
+    ("ix_rounds_round_type_id", "rounds", ["round_type_id"]),
+    ("ix_round_media_round_id", "round_media", ["round_id"]),
+    ("ix_users_api_token", "users", ["api_token"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,73 @@
+"""hash api tokens
+
+Revision ID: 1de0133a0156
+Revises: 047bfdbfef20
+Create Date: 2026-10-17 08:04:58.333964
+
+"""
+
+import hashlib
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1de0133a0156"
+down_revision: str | Sequence[str] | None = "047bfdbfef20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.core.security.API_TOKEN_PREFIX_LENGTH at the time of writing
+PREFIX_LENGTH = 8
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users", sa.Column("api_token_prefix", sa.String(length=16), nullable=True)
+    )
+    op.add_column(
+        "users", sa.Column("api_token_hash", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        "ix_users_api_token_prefix", "users", ["api_token_prefix"], unique=False
+    )
+
+    # Existing tokens are stored in clear; keep them working by hashing them
+    bind = op.get_bind()
+    users = sa.table(
+        "users",
+        sa.column("id", sa.String()),
+        sa.column("api_token", sa.String()),
+        sa.column("api_token_prefix", sa.String()),
+        sa.column("api_token_hash", sa.String()),
+    )
+    rows = bind.execute(
+        sa.select(users.c.id, users.c.api_token).where(users.c.api_token.is_not(None))
+    ).all()
+    for user_id, token in rows:
+        bind.execute(
+            users.update()
+            .where(users.c.id == user_id)
+            .values(
+                api_token_prefix=token[:PREFIX_LENGTH],
+                api_token_hash=hashlib.sha256(token.encode()).hexdigest(),
+            )
+        )
+
+    op.drop_index("ix_users_api_token", table_name="users")
+    op.drop_column("users", "api_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Tokens cannot be recovered from their hashes, so users have to
+    regenerate their API keys after a downgrade.
+    """
+    op.add_column("users", sa.Column("api_token", sa.String(length=255), nullable=True))
+    op.create_index("ix_users_api_token", "users", ["api_token"], unique=False)
+    op.drop_index("ix_users_api_token_prefix", table_name="users")
+    op.drop_column("users", "api_token_hash")
+    op.drop_column("users", "api_token_prefix")
@@ -0,0 +1,46 @@
+"""add extraction cache table
+
+Revision ID: 4b8e2f1c9a07
+Revises: 0d7e13252286
+Create Date: 2026-10-17 09:12:03.418220
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e2f1c9a07"
+down_revision: str | Sequence[str] | None = "0d7e13252286"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "extraction_cache",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    op.create_index(
+        op.f("ix_extraction_cache_last_accessed_at"),
+        "extraction_cache",
+        ["last_accessed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_extraction_cache_last_accessed_at"), table_name="extraction_cache"
+    )
+    op.drop_table("extraction_cache")
@@ -0,0 +1,98 @@
+"""add daily application stats rollup
+
+Revision ID: 7c3d9a1e5b42
+Revises: 4b8e2f1c9a07
+Create Date: 2026-10-17 11:40:27.905113
+
+"""
+
+from collections import defaultdict
+from datetime import UTC
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3d9a1e5b42"
+down_revision: str | Sequence[str] | None = "4b8e2f1c9a07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    stats = op.create_table(
+        "daily_application_stats",
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status_id", sa.String(length=36), nullable=False),
+        sa.Column("applications", sa.Integer(), nullable=False),
+        sa.Column("transitions", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["status_id"], ["application_statuses.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id", "day", "status_id"),
+    )
+
+    # Backfill from existing applications and status history
+    applications = sa.table(
+        "applications",
+        sa.column("id", sa.String()),
+        sa.column("user_id", sa.String()),
+        sa.column("status_id", sa.String()),
+        sa.column("applied_at", sa.Date()),
+    )
+    history = sa.table(
+        "application_status_history",
+        sa.column("application_id", sa.String()),
+        sa.column("to_status_id", sa.String()),
+        sa.column("changed_at", sa.DateTime(timezone=True)),
+    )
+    bind = op.get_bind()
+    counts = defaultdict(lambda: [0, 0])
+
+    for user_id, day, status_id, count in bind.execute(
+        sa.select(
+            applications.c.user_id,
+            applications.c.applied_at,
+            applications.c.status_id,
+            sa.func.count(applications.c.id),
+        ).group_by(
+            applications.c.user_id, applications.c.applied_at, applications.c.status_id
+        )
+    ):
+        if day is not None:
+            counts[(user_id, day, status_id)][0] += count
+
+    for user_id, changed_at, status_id in bind.execute(
+        sa.select(
+            applications.c.user_id, history.c.changed_at, history.c.to_status_id
+        ).join(applications, history.c.application_id == applications.c.id)
+    ):
+        if changed_at is None:
+            continue
+        if changed_at.tzinfo is not None:
+            changed_at = changed_at.astimezone(UTC)
+        counts[(user_id, changed_at.date(), status_id)][1] += 1
+
+    if counts:
+        op.bulk_insert(
+            stats,
+            [
+                {
+                    "user_id": user_id,
+                    "day": day,
+                    "status_id": status_id,
+                    "applications": applied,
+                    "transitions": transitions,
+                }
+                for (user_id, day, status_id), (applied, transitions) in counts.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_application_stats")
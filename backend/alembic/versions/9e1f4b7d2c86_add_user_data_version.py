@@ -0,0 +1,31 @@
+"""add user data version
+
+Revision ID: 9e1f4b7d2c86
+Revises: 7c3d9a1e5b42
+Create Date: 2026-10-17 13:05:51.274390
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e1f4b7d2c86"
+down_revision: str | Sequence[str] | None = "7c3d9a1e5b42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("data_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "data_version")
@@ -0,0 +1,35 @@
+"""add status history reached index
+
+Revision ID: b2a6c8e4f153
+Revises: 9e1f4b7d2c86
+Create Date: 2026-10-17 14:22:08.561743
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2a6c8e4f153"
+down_revision: str | Sequence[str] | None = "9e1f4b7d2c86"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_application_status_history_to_status_application",
+        "application_status_history",
+        ["to_status_id", "application_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_application_status_history_to_status_application",
+        table_name="application_status_history",
+    )
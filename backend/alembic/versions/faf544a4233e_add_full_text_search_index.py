@@ -0,0 +1,137 @@
+"""add full text search index
+
+Revision ID: faf544a4233e
+Revises: b2a6c8e4f153
+Create Date: 2026-10-17 07:45:13.582113
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "faf544a4233e"
+down_revision: str | Sequence[str] | None = "b2a6c8e4f153"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE search_fts USING fts5("
+    "title, body, content='search_documents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    "INSERT INTO search_fts(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    "INSERT INTO search_fts(search_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    "INSERT INTO search_fts(search_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO search_fts(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+]
+
+POSTGRESQL_DDL = [
+    "CREATE INDEX ix_search_documents_document ON search_documents USING gin (("
+    "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, body), 'B')))",
+]
+
+
+def _join(parts) -> str:
+    return "\n".join(part for part in parts if part)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    documents = op.create_table(
+        "search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("doc_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("kind", "doc_id", name="uq_search_documents_kind_doc_id"),
+    )
+
+    bind = op.get_bind()
+    ddl = {"sqlite": SQLITE_DDL, "postgresql": POSTGRESQL_DDL}
+    for statement in ddl.get(bind.dialect.name, []):
+        op.execute(statement)
+
+    # Backfill from existing applications and job leads
+    applications = sa.table(
+        "applications",
+        sa.column("id", sa.String()),
+        sa.column("user_id", sa.String()),
+        sa.column("company", sa.String()),
+        sa.column("job_title", sa.String()),
+        sa.column("job_description", sa.Text()),
+        sa.column("description", sa.Text()),
+        sa.column("skills", sa.JSON()),
+        sa.column("recruiter_name", sa.String()),
+        sa.column("recruiter_title", sa.String()),
+    )
+    job_leads = sa.table(
+        "job_leads",
+        sa.column("id", sa.String()),
+        sa.column("user_id", sa.String()),
+        sa.column("company", sa.String()),
+        sa.column("title", sa.String()),
+        sa.column("description", sa.Text()),
+        sa.column("skills", sa.JSON()),
+        sa.column("recruiter_name", sa.String()),
+        sa.column("recruiter_title", sa.String()),
+    )
+
+    rows = []
+    for row in bind.execute(sa.select(applications)):
+        rows.append(
+            {
+                "kind": "application",
+                "doc_id": row.id,
+                "user_id": row.user_id,
+                "title": _join([row.company, row.job_title]),
+                "body": _join(
+                    [
+                        row.job_description,
+                        row.description,
+                        " ".join(row.skills or []),
+                        row.recruiter_name,
+                        row.recruiter_title,
+                    ]
+                ),
+            }
+        )
+    for row in bind.execute(sa.select(job_leads)):
+        rows.append(
+            {
+                "kind": "job_lead",
+                "doc_id": row.id,
+                "user_id": row.user_id,
+                "title": _join([row.company, row.title]),
+                "body": _join(
+                    [
+                        row.description,
+                        " ".join(row.skills or []),
+                        row.recruiter_name,
+                        row.recruiter_title,
+                    ]
+                ),
+            }
+        )
+    if rows:
+        op.bulk_insert(documents, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS search_fts")
+    op.drop_table("search_documents")
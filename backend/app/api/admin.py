@@ -8,7 +8,13 @@ from sqlalchemy.orm import selectinload
 from app.core.database import get_db
 from app.core.deps import get_current_admin
 from app.core.security import get_password_hash
-from app.models import Application, ApplicationStatus, RoundType, User
+from app.models import (
+    Application,
+    ApplicationStatus,
+    ExtractionCacheEntry,
+    RoundType,
+    User,
+)
 from app.schemas.admin import (
     AdminRoundTypeUpdate,
     AdminStatsResponse,
@@ -17,8 +23,13 @@ from app.schemas.admin import (
     AdminUserListResponse,
     AdminUserResponse,
     AdminUserUpdate,
+    StageTimingStats,
 )
 from app.schemas.application import ApplicationListResponse
+from app.services.analytics_cache import analytics_cache
+from app.services.extraction import preprocess_metrics
+from app.services.extraction_cache import cache_stats
+from app.services.user_cache import user_cache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -201,11 +212,37 @@ async def get_stats(
         )
     )
 
+    cache_entries = await db.execute(
+        select(func.count()).select_from(ExtractionCacheEntry)
+    )
+
     return AdminStatsResponse(
         total_users=total_users.scalar() or 0,
         active_users=active_users.scalar() or 0,
         total_applications=total_apps.scalar() or 0,
         applications_this_month=month_apps.scalar() or 0,
+        extraction_cache_entries=cache_entries.scalar() or 0,
+        extraction_cache_hits=cache_stats.hits,
+        extraction_cache_misses=cache_stats.misses,
+        html_preprocess_documents=preprocess_metrics.documents,
+        html_preprocess_timeouts=preprocess_metrics.timeouts,
+        html_preprocess_stages={
+            stage: StageTimingStats(
+                count=timing.count,
+                avg_ms=(
+                    timing.total_seconds / timing.count * 1000 if timing.count else 0
+                ),
+                max_ms=timing.max_seconds * 1000,
+            )
+            for stage, timing in preprocess_metrics.stages.items()
+        },
+        analytics_cache_entries=len(analytics_cache),
+        analytics_cache_hits=analytics_cache.stats.hits,
+        analytics_cache_misses=analytics_cache.stats.misses,
+        analytics_cache_not_modified=analytics_cache.stats.not_modified,
+        user_cache_entries=len(user_cache),
+        user_cache_hits=user_cache.stats.hits,
+        user_cache_misses=user_cache.stats.misses,
     )
 
 
@@ -1,6 +1,6 @@
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,7 +9,7 @@ from app.core.deps import get_current_user
 from app.models import (
     Application,
     ApplicationStatus,
-    ApplicationStatusHistory,
+    DailyApplicationStats,
     Round,
     RoundType,
     User,
@@ -24,18 +24,27 @@ from app.schemas.analytics import (
     OutcomeData,
     RoundProgress,
     SankeyData,
-    SankeyLink,
-    SankeyNode,
+    StageFunnelResponse,
+    StageFunnelStage,
+    StageFunnelWeek,
     TimelineData,
 )
+from app.services.analytics_cache import cached_response
+from app.services.funnel import compute_stage_funnel, compute_weekly_stage_reach
+from app.services.kpis import FAR_PAST_DATE, compute_kpis, period_start_date
+from app.services.sankey import get_sankey
+from app.services.week_buckets import (
+    WEEK_START_PATTERN,
+    resolve_today,
+    week_index,
+    weekly_window,
+)
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
-# Node colors are now handled by the frontend using theme-aware colors
-FAR_PAST_DATE = date(2000, 1, 1)
-
 
 @router.get("/sankey", response_model=SankeyData)
+@cached_response("analytics.sankey", SankeyData)
 async def get_sankey_data(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -44,170 +53,11 @@ async def get_sankey_data(
     Build Sankey diagram from actual application status transitions.
     Shows all unique trajectories/journeys applications have taken.
     """
-    from sqlalchemy.orm import aliased
-
-    # Get all history entries with status details for this user
-    from_status = aliased(ApplicationStatus)
-    to_status = aliased(ApplicationStatus)
-
-    result = await db.execute(
-        select(
-            ApplicationStatusHistory.application_id,
-            ApplicationStatusHistory.from_status_id,
-            ApplicationStatusHistory.to_status_id,
-            from_status.name.label("from_status_name"),
-            from_status.color.label("from_status_color"),
-            to_status.name.label("to_status_name"),
-            to_status.color.label("to_status_color"),
-        )
-        .select_from(ApplicationStatusHistory)
-        .join(Application, ApplicationStatusHistory.application_id == Application.id)
-        .join(to_status, ApplicationStatusHistory.to_status_id == to_status.id)
-        .outerjoin(
-            from_status, ApplicationStatusHistory.from_status_id == from_status.id
-        )
-        .where(Application.user_id == user.id)
-        .order_by(
-            ApplicationStatusHistory.application_id, ApplicationStatusHistory.changed_at
-        )
-    )
-    all_transitions = result.all()
-
-    if not all_transitions:
-        return SankeyData(nodes=[], links=[])
-
-    # Build unique paths per application
-    # Group transitions by application
-    from collections import defaultdict
-
-    app_transitions = defaultdict(list)
-    for transition in all_transitions:
-        app_transitions[transition.application_id].append(
-            {
-                "from_status": transition.from_status_name,
-                "to_status": transition.to_status_name,
-                "to_color": transition.to_status_color,
-            }
-        )
-
-    # Terminal statuses that get stage-specific nodes
-    TERMINAL_STATUSES = {"Rejected", "Withdrawn"}
-
-    # Collect all unique statuses and track transitions to terminal statuses
-    seen_statuses = set()
-    terminal_transitions = defaultdict(
-        set
-    )  # {terminal_status: {from_status1, from_status2, ...}}
-
-    for transitions in app_transitions.values():
-        for t in transitions:
-            if t["from_status"]:
-                seen_statuses.add(t["from_status"])
-            seen_statuses.add(t["to_status"])
-
-            # Track which stages lead to terminal statuses
-            if t["to_status"] in TERMINAL_STATUSES and t["from_status"]:
-                terminal_transitions[t["to_status"]].add(t["from_status"])
-
-    # Build nodes: start with Applications source, then each unique status
-    # Note: Frontend handles actual colors using theme-aware mapping
-    nodes = [
-        SankeyNode(id="applications", name="Applications", color="#8ec07c")
-    ]  # Placeholder, frontend uses theme
-    status_name_to_node_id = {}
-    status_name_to_color = {}
-
-    for status_name in sorted(seen_statuses):
-        # Find the color for this status
-        for transitions in app_transitions.values():
-            for t in transitions:
-                if t["to_status"] == status_name:
-                    status_name_to_color[status_name] = t["to_color"]
-                    break
-            if status_name in status_name_to_color:
-                break
-
-        # For terminal statuses, create stage-specific nodes
-        if status_name in terminal_transitions:
-            # Create one node per source stage that leads to this terminal status
-            for from_stage in sorted(terminal_transitions[status_name]):
-                node_id = f"terminal_{status_name.lower()}_{from_stage.lower().replace(' ', '_').replace('/', '_')}"
-                status_name_to_node_id[(from_stage, status_name)] = node_id
-                nodes.append(
-                    SankeyNode(
-                        id=node_id,
-                        name=status_name,  # Label is just "Rejected" or "Withdrawn"
-                        color=status_name_to_color.get(
-                            status_name, "#8ec07c"
-                        ),  # Fallback, frontend uses theme
-                    )
-                )
-        else:
-            # Non-terminal statuses get single node
-            node_id = (
-                f"status_{status_name.lower().replace(' ', '_').replace('/', '_')}"
-            )
-            status_name_to_node_id[status_name] = node_id
-            nodes.append(
-                SankeyNode(
-                    id=node_id,
-                    name=status_name,
-                    color=status_name_to_color.get(
-                        status_name, "#8ec07c"
-                    ),  # Fallback, frontend uses theme
-                )
-            )
-
-    # Count how many applications took each path segment
-    # Prevent cycles by tracking visited statuses per application
-    link_counts = {}  # {(source_id, target_id): count}
-
-    for _app_id, transitions in app_transitions.items():
-        visited_statuses = set()  # Track statuses visited in this application's journey
-
-        for i, t in enumerate(transitions):
-            # Determine source node
-            if i == 0 or t["from_status"] is None:
-                # First transition comes from "Applications" node
-                source_id = "applications"
-            else:
-                source_id = status_name_to_node_id.get(t["from_status"])
-                if not source_id:
-                    # Status not in our tracked statuses, skip
-                    continue
-
-            # Determine target node - use stage-specific for terminal statuses
-            if t["to_status"] in TERMINAL_STATUSES and t["from_status"]:
-                # Use (from_stage, to_status) tuple key for terminal statuses
-                target_id = status_name_to_node_id.get(
-                    (t["from_status"], t["to_status"])
-                )
-            else:
-                target_id = status_name_to_node_id.get(t["to_status"])
-
-            if not target_id:
-                continue
-
-            # Prevent cycles: don't link back to already visited statuses
-            if t["to_status"] in visited_statuses:
-                continue
-
-            # Mark this status as visited
-            visited_statuses.add(t["to_status"])
-
-            link_key = (source_id, target_id)
-            link_counts[link_key] = link_counts.get(link_key, 0) + 1
-
-    # Convert to Sankey links
-    links = [
-        SankeyLink(source=source, target=target, value=count)
-        for (source, target), count in link_counts.items()
-    ]
-
-    return SankeyData(nodes=nodes, links=links)
+    return await get_sankey(db, user.id)
 
 
 @router.get("/heatmap", response_model=HeatmapData)
+@cached_response("analytics.heatmap", HeatmapData)
 async def get_heatmap_data(
     year: int | None = None,
     rolling: bool = False,
@@ -225,22 +75,21 @@ async def get_heatmap_data(
         start_date = date(year, 1, 1)
         end_date = date(year, 12, 31)
 
+    applications = func.sum(DailyApplicationStats.applications)
     result = await db.execute(
-        select(Application.applied_at, func.count(Application.id))
+        select(DailyApplicationStats.day, applications)
         .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            Application.applied_at <= end_date,
+            DailyApplicationStats.user_id == user.id,
+            DailyApplicationStats.day >= start_date,
+            DailyApplicationStats.day <= end_date,
         )
-        .group_by(Application.applied_at)
-        .order_by(Application.applied_at)
+        .group_by(DailyApplicationStats.day)
+        .having(applications > 0)
+        .order_by(DailyApplicationStats.day)
     )
     daily_counts = result.all()
 
-    days = [
-        HeatmapDay(date=str(applied_at), count=count)
-        for applied_at, count in daily_counts
-    ]
+    days = [HeatmapDay(date=str(day), count=count) for day, count in daily_counts]
 
     max_count = max((d.count for d in days), default=0)
 
@@ -248,6 +97,7 @@ async def get_heatmap_data(
 
 
 @router.get("/kpis", response_model=AnalyticsKPIsResponse)
+@cached_response("analytics.kpis", AnalyticsKPIsResponse)
 async def get_analytics_kpis(
     period: str = "30d",
     user: User = Depends(get_current_user),
@@ -257,191 +107,158 @@ async def get_analytics_kpis(
     Get analytics KPIs filtered by time period.
     Period options: 7d, 30d, 3m, all
     """
-    today = date.today()
-
-    # Calculate date range based on period
-    if period == "7d":
-        start_date = today - timedelta(days=7)
-    elif period == "30d":
-        start_date = today - timedelta(days=30)
-    elif period == "3m":
-        start_date = today - timedelta(days=90)
-    elif period == "all":
-        start_date = FAR_PAST_DATE
-    else:
-        start_date = today - timedelta(days=30)  # Default to 30d
-
-    # Total applications in period
-    result = await db.execute(
-        select(func.count(Application.id)).where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-        )
-    )
-    total_applications = result.scalar() or 0
-
-    # Interviews (status_id = Interviewing)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name == "Interviewing",
-        )
-    )
-    interviews = result.scalar() or 0
-
-    # Offers (status_id = Offer)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name == "Offer",
-        )
-    )
-    offers = result.scalar() or 0
-
-    # Application to interview rate
-    application_to_interview_rate = (
-        (interviews / total_applications * 100) if total_applications > 0 else 0
-    )
-
-    # Response rate: applications that got any response (not "No Reply" status)
-    # This is applications NOT in "No Reply" status
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name != "No Reply",
-        )
-    )
-    responded = result.scalar() or 0
-    response_rate = (
-        (responded / total_applications * 100) if total_applications > 0 else 0
-    )
-
-    # Active opportunities: not Rejected or Withdrawn
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name.not_in(["Rejected", "Withdrawn"]),
-        )
-    )
-    active_opportunities = result.scalar() or 0
+    kpis = await compute_kpis(db, user.id, start_date=period_start_date(period))
 
     return AnalyticsKPIsResponse(
-        total_applications=total_applications,
-        interviews=interviews,
-        offers=offers,
-        application_to_interview_rate=round(application_to_interview_rate, 1),
-        response_rate=round(response_rate, 1),
-        active_opportunities=active_opportunities,
+        total_applications=kpis.total,
+        interviews=kpis.interviews,
+        offers=kpis.offers,
+        application_to_interview_rate=kpis.interview_rate,
+        response_rate=kpis.response_rate,
+        active_opportunities=kpis.active,
     )
 
 
 @router.get("/weekly")
+@cached_response("analytics.weekly")
 async def get_weekly_data(
     period: str = "30d",
+    week_start: str | None = Query(None, pattern=WEEK_START_PATTERN),
+    tz: str | None = None,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get weekly application trends data.
     Groups applications by week for the specified period.
-    """
-    today = date.today()
 
-    # Calculate date range and number of weeks
-    if period == "7d":
-        weeks_count = 1
-        start_date = today - timedelta(days=7)
-    elif period == "30d":
-        weeks_count = 4
-        start_date = today - timedelta(days=30)
-    elif period == "3m":
-        weeks_count = 12
-        start_date = today - timedelta(days=90)
-    elif period == "all":
-        weeks_count = 52
-        start_date = FAR_PAST_DATE
-    else:
-        weeks_count = 4
-        start_date = today - timedelta(days=30)
-
-    # Get applications in the date range
-    result = await db.execute(
-        select(Application.applied_at)
+    Weeks count back from today (Week 1 is the last seven days) unless
+    week_start names a weekday, in which case Week 1 is the current
+    calendar week starting on that day. tz is an IANA time zone used to
+    decide what "today" is for the user.
+    """
+    try:
+        today = resolve_today(tz)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    weeks_count, start_date = weekly_window(period, today)
+
+    # Bucket each rollup day into its week in SQL, then sum per week
+    applications = DailyApplicationStats.applications
+    bucketed = (
+        select(
+            week_index(
+                db.bind.dialect.name,
+                today,
+                DailyApplicationStats.day,
+                weeks_count,
+                week_start,
+            ).label("week"),
+            applications.label("applications"),
+            case(
+                (ApplicationStatus.name == "Interviewing", applications), else_=0
+            ).label("interviews"),
+        )
+        .join(
+            ApplicationStatus, DailyApplicationStats.status_id == ApplicationStatus.id
+        )
         .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
+            DailyApplicationStats.user_id == user.id,
+            DailyApplicationStats.day >= start_date,
         )
-        .order_by(Application.applied_at)
+        .subquery()
+    )
+    total = func.sum(bucketed.c.applications)
+    result = await db.execute(
+        select(bucketed.c.week, total, func.sum(bucketed.c.interviews))
+        .group_by(bucketed.c.week)
+        .having(total > 0)
+        .order_by(bucketed.c.week)
     )
-    applications = result.scalars().all()
 
-    # Group by week
-    from collections import defaultdict
+    return [
+        {
+            "week": f"Week {week_num + 1}",
+            "applications": applied,
+            "interviews": interviews,
+        }
+        for week_num, applied, interviews in result.all()
+    ]
 
-    weekly_data = defaultdict(lambda: {"applications": 0, "interviews": 0})
 
-    for app in applications:
-        # Calculate week number (weeks since start_date)
-        # Note: applications is a list of date objects (from .scalars())
-        days_diff = (today - app).days
-        week_num = min(days_diff // 7, weeks_count - 1)
+@router.get("/funnel", response_model=StageFunnelResponse)
+@cached_response("analytics.funnel", StageFunnelResponse)
+async def get_stage_funnel(
+    period: str = "all",
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get how many applications ever reached each status.
+    Uses status history, so applications that moved past a stage still
+    count towards it. Period options: 7d, 30d, 3m, all
+    """
+    total, stages = await compute_stage_funnel(
+        db, user.id, start_date=period_start_date(period)
+    )
 
-        weekly_data[week_num]["applications"] += 1
+    return StageFunnelResponse(
+        total_applications=total,
+        stages=[
+            StageFunnelStage(
+                status_id=stage.status_id,
+                name=stage.name,
+                color=stage.color,
+                reached=stage.reached,
+                rate=round(stage.reached / total * 100, 1) if total else 0,
+            )
+            for stage in stages
+        ],
+    )
 
-        # Check if this application reached interviewing stage
-        # We need to query the current status
-        # For simplicity, we'll count based on current status name
-        # A more accurate approach would use history, but that's more complex
 
-    # Now get interview counts by week
-    # Applications that are currently in "Interviewing" status
-    result = await db.execute(
-        select(Application.applied_at)
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user.id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name == "Interviewing",
-        )
-        .order_by(Application.applied_at)
+@router.get("/funnel/weekly", response_model=list[StageFunnelWeek])
+@cached_response("analytics.funnel.weekly", list[StageFunnelWeek])
+async def get_weekly_stage_funnel(
+    stage: str = "Interviewing",
+    period: str = "30d",
+    week_start: str | None = Query(None, pattern=WEEK_START_PATTERN),
+    tz: str | None = None,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get weekly application cohorts and how many of them ever reached a
+    stage (default Interviewing). Weeks and tz work as in /weekly.
+    """
+    try:
+        today = resolve_today(tz)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    weeks_count, start_date = weekly_window(period, today)
+
+    weeks = await compute_weekly_stage_reach(
+        db, user.id, stage, today, weeks_count, start_date, week_start
     )
-    interviewing_apps = result.scalars().all()
-
-    for app in interviewing_apps:
-        # Note: interviewing_apps is a list of date objects (from .scalars())
-        days_diff = (today - app).days
-        week_num = min(days_diff // 7, weeks_count - 1)
-        weekly_data[week_num]["interviews"] += 1
 
-    # Convert to list format with numeric sorting
-    data = [
-        {
-            "week": f"Week {week_num + 1}",
-            "applications": stats["applications"],
-            "interviews": stats["interviews"],
-        }
-        for week_num, stats in sorted(weekly_data.items())
+    return [
+        StageFunnelWeek(
+            week=f"Week {week.week + 1}",
+            applications=week.applications,
+            reached=week.reached,
+            rate=round(week.reached / week.applications * 100, 1),
+        )
+        for week in weeks
     ]
 
-    return data
-
 
 @router.get("/interview-rounds", response_model=InterviewRoundsResponse)
+@cached_response("analytics.interview-rounds", InterviewRoundsResponse)
 async def get_interview_rounds_analytics(
     period: str = "all",
     round_type: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -453,6 +270,8 @@ async def get_interview_rounds_analytics(
 
     Period options: 7d, 30d, 3m, all
     round_type: optional filter by round type name
+    limit/offset: optional paging of candidate_progress by application;
+        candidate_total is the unpaged number of applications
     """
     today = date.today()
 
@@ -594,71 +413,67 @@ async def get_interview_rounds_analytics(
         for round_type, days_list in sorted(timeline_dict.items())
     ]
 
-    # Candidate Progress Query: Get applications with their rounds
-    # First get applications with at least one round
-    apps_with_rounds_result = await db.execute(
-        select(Application.id, ApplicationStatus.name.label("status_name"))
-        .select_from(Application)
-        .join(ApplicationStatus, Application.status_id == ApplicationStatus.id)
+    # Candidate Progress: applications with at least one round, paged by
+    # application and fetched together with their rounds in one joined query
+    apps_with_rounds = (
+        select(Application.id)
         .join(Round, Round.application_id == Application.id)
         .where(Application.user_id == user.id)
         .distinct()
-        .order_by(Application.id)
     )
-    apps_with_rounds = apps_with_rounds_result.all()
-
-    candidate_progress = []
+    candidate_total = (
+        await db.execute(select(func.count()).select_from(apps_with_rounds.subquery()))
+    ).scalar() or 0
 
-    for app_row in apps_with_rounds:
-        app_id = app_row.id
-        status_name = app_row.status_name
+    page = apps_with_rounds.order_by(Application.id).offset(offset)
+    if limit is not None:
+        page = page.limit(limit)
 
-        # Get all rounds for this application
-        rounds_result = await db.execute(
-            select(
-                RoundType.name.label("round_type"),
-                Round.outcome,
-                Round.completed_at,
-                Round.scheduled_at,
-            )
-            .select_from(Round)
-            .join(RoundType, Round.round_type_id == RoundType.id)
-            .where(Round.application_id == app_id)
-            .order_by(Round.scheduled_at)
+    progress_rows = await db.stream(
+        select(
+            Application.id.label("application_id"),
+            Application.company,
+            Application.job_title,
+            ApplicationStatus.name.label("status_name"),
+            RoundType.name.label("round_type"),
+            Round.outcome,
+            Round.completed_at,
+            Round.scheduled_at,
         )
-        rounds = rounds_result.all()
-
-        rounds_completed = []
-        for r in rounds:
-            # Calculate days in round
-            days_in_round = None
-            if r.completed_at and r.scheduled_at:
-                days_in_round = (r.completed_at.date() - r.scheduled_at.date()).days
-
-            rounds_completed.append(
-                RoundProgress(
-                    round_type=r.round_type,
-                    outcome=r.outcome,
-                    completed_at=r.completed_at,
-                    days_in_round=days_in_round,
+        .select_from(Application)
+        .join(ApplicationStatus, Application.status_id == ApplicationStatus.id)
+        .join(Round, Round.application_id == Application.id)
+        .join(RoundType, Round.round_type_id == RoundType.id)
+        .where(Application.id.in_(page.scalar_subquery()))
+        .order_by(Application.id, Round.scheduled_at)
+    )
+
+    candidate_progress: list[CandidateProgress] = []
+    async for r in progress_rows:
+        if not candidate_progress or (
+            candidate_progress[-1].application_id != r.application_id
+        ):
+            candidate_progress.append(
+                CandidateProgress(
+                    application_id=r.application_id,
+                    candidate_name=r.company,
+                    role=r.job_title,
+                    rounds_completed=[],
+                    current_status=r.status_name,
                 )
             )
 
-        # Get application details for candidate name and role
-        app_detail_result = await db.execute(
-            select(Application.company, Application.job_title).where(
-                Application.id == app_id
-            )
-        )
-        app_detail = app_detail_result.first()
-
-        candidate_progress.append(
-            CandidateProgress(
-                application_id=app_id,
-                candidate_name=app_detail.company if app_detail else "",
-                role=app_detail.job_title if app_detail else "",
-                rounds_completed=rounds_completed,
-                current_status=status_name,
+        # Calculate days in round
+        days_in_round = None
+        if r.completed_at and r.scheduled_at:
+            days_in_round = (r.completed_at.date() - r.scheduled_at.date()).days
+
+        candidate_progress[-1].rounds_completed.append(
+            RoundProgress(
+                round_type=r.round_type,
+                outcome=r.outcome,
+                completed_at=r.completed_at,
+                days_in_round=days_in_round,
             )
         )
 
@@ -667,4 +482,5 @@ async def get_interview_rounds_analytics(
         outcome_data=outcome_data,
         timeline_data=timeline_data,
         candidate_progress=candidate_progress,
+        candidate_total=candidate_total,
     )
@@ -1,13 +1,14 @@
 import os
-from datetime import date
+from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
-from sqlalchemy import func, or_, select
+from sqlalchemy import false, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.job_leads import _fetch_html, _get_ai_settings
 from app.api.streak import record_streak_activity
+from app.api.utils.uploads import store_upload
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.deps import (
@@ -22,6 +23,7 @@ from app.models import (
     Round,
     User,
 )
+from app.models.search_index import APPLICATION
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationExtractRequest,
@@ -30,6 +32,7 @@ from app.schemas.application import (
     ApplicationResponse,
     ApplicationUpdate,
 )
+from app.services.blob_store import normalize_ext, release_file
 from app.services.extraction import (
     ExtractionError,
     ExtractionInvalidResponseError,
@@ -37,16 +40,27 @@ from app.services.extraction import (
     NoJobFoundError,
     extract_job_data,
 )
+from app.services.pagination import paginate
+from app.services.search import search_matches
 
 router = APIRouter(prefix="/api/applications", tags=["applications"])
 
+# Newest first; id breaks ties so keyset pages never skip or repeat rows
+APPLICATION_SORT_KEY = (Application.applied_at, Application.created_at, Application.id)
+
 
 @router.get("", response_model=ApplicationListResponse)
 async def list_applications(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    include_total: bool = Query(True, description="Count all matching items"),
     status_id: str | None = None,
-    search: str | None = None,
+    search: str | None = Query(
+        None, description="Full-text search, matching word prefixes"
+    ),
     url: str | None = Query(
         None, description="Filter by exact job URL (used by extension)"
     ),
@@ -68,16 +82,21 @@ async def list_applications(
     if url:
         query = query.where(Application.job_url == url)
 
-    # Partial text search (company, title, description)
-    if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            or_(
-                Application.company.ilike(search_term),
-                Application.job_title.ilike(search_term),
-                Application.job_description.ilike(search_term),
-            )
-        )
+    # Full-text search; results are ranked best match first
+    sort_key = list(APPLICATION_SORT_KEY)
+    parsers = [date.fromisoformat, datetime.fromisoformat, str]
+    matches = (
+        search_matches(db.bind.dialect.name, APPLICATION, user.id, search)
+        if search
+        else None
+    )
+    if matches is not None:
+        query = query.join(matches, matches.c.doc_id == Application.id)
+        sort_key.insert(0, matches.c.rank)
+        parsers.insert(0, float)
+    elif search:
+        # Input with no searchable words (only punctuation) matches nothing
+        query = query.where(false())
 
     if date_from:
         query = query.where(Application.applied_at >= date_from)
@@ -85,21 +104,29 @@ async def list_applications(
     if date_to:
         query = query.where(Application.applied_at <= date_to)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    query = query.order_by(Application.applied_at.desc(), Application.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    applications = result.scalars().all()
+    # Exact URL lookups return at most a handful of rows; skip the count
+    try:
+        result = await paginate(
+            db,
+            query,
+            sort_key,
+            parsers,
+            per_page=per_page,
+            page=page,
+            cursor=cursor,
+            count=include_total and not url,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
     return ApplicationListResponse(
-        items=applications,  # type: ignore[arg-type]
-        total=total,
+        items=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -205,6 +232,7 @@ async def create_application_from_url(
             model=ai_model,
             api_key=ai_api_key,
             api_base=ai_api_base,
+            db=db,
         )
     except ExtractionTimeoutError as e:
         raise HTTPException(
@@ -407,26 +435,15 @@ async def upload_cv(
             detail="File must be PDF or Word document",
         )
 
-    if application.cv_path and os.path.exists(application.cv_path):
-        os.remove(application.cv_path)
-
     settings = get_settings()
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    ext = os.path.splitext(file.filename or "")[1] or ".pdf"
-    file_name = f"cv_{application_id}{ext}"
-    file_path = os.path.join(settings.upload_dir, file_name)
-
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        max_size = settings.max_document_size_mb * 1024 * 1024
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File exceeds maximum size of {settings.max_document_size_mb}MB",
-            )
-        f.write(content)
+    ext = normalize_ext(os.path.splitext(file.filename or "")[1], ".pdf")
+    saved = await store_upload(file, ext, settings.max_document_size_mb)
 
-    application.cv_path = file_path
+    # Re-uploading the same file leaves the path unchanged
+    if application.cv_path != saved.path:
+        release_file(application.cv_path)
+
+    application.cv_path = saved.path
     await db.commit()
 
     result = await db.execute(
@@ -455,8 +472,7 @@ async def delete_cv(
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
 
-    if application.cv_path and os.path.exists(application.cv_path):
-        os.remove(application.cv_path)
+    release_file(application.cv_path)
 
     application.cv_path = None
     await db.commit()
@@ -499,26 +515,15 @@ async def upload_cover_letter(
             detail="File must be PDF or Word document",
         )
 
-    if application.cover_letter_path and os.path.exists(application.cover_letter_path):
-        os.remove(application.cover_letter_path)
-
     settings = get_settings()
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    ext = os.path.splitext(file.filename or "")[1] or ".pdf"
-    file_name = f"cover_letter_{application_id}{ext}"
-    file_path = os.path.join(settings.upload_dir, file_name)
-
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        max_size = settings.max_document_size_mb * 1024 * 1024
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File exceeds maximum size of {settings.max_document_size_mb}MB",
-            )
-        f.write(content)
+    ext = normalize_ext(os.path.splitext(file.filename or "")[1], ".pdf")
+    saved = await store_upload(file, ext, settings.max_document_size_mb)
+
+    # Re-uploading the same file leaves the path unchanged
+    if application.cover_letter_path != saved.path:
+        release_file(application.cover_letter_path)
 
-    application.cover_letter_path = file_path
+    application.cover_letter_path = saved.path
     await db.commit()
 
     result = await db.execute(
@@ -547,8 +552,7 @@ async def delete_cover_letter(
             status_code=status.HTTP_404_NOT_FOUND, detail="Application not found"
         )
 
-    if application.cover_letter_path and os.path.exists(application.cover_letter_path):
-        os.remove(application.cover_letter_path)
+    release_file(application.cover_letter_path)
 
     application.cover_letter_path = None
     await db.commit()
@@ -1,12 +1,12 @@
 import mimetypes
 import os
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.utils.file_responses import file_response, token_max_age
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_current_user_optional
 from app.core.security import (
@@ -55,6 +55,7 @@ async def get_media_signed_url(
 
 @router.get("/media/{media_id}")
 async def get_media_file(
+    request: Request,
     media_id: str,
     token: str | None = Query(None),
     disposition: str = Query("inline", pattern="^(inline|attachment)$"),
@@ -63,6 +64,7 @@ async def get_media_file(
 ):
     """Serve a media file. Accepts either auth header or signed token."""
     user_id = None
+    max_age = None
 
     # Try token-based auth first
     if token:
@@ -71,6 +73,8 @@ async def get_media_file(
             if payload.get("media_id") != media_id:
                 raise HTTPException(status_code=403, detail="Token mismatch")
             user_id = payload.get("user_id")
+            # The signed URL is only valid until the token expires
+            max_age = token_max_age(payload)
 
     # Fall back to header-based auth
     if not user_id and user:
@@ -114,10 +118,13 @@ async def get_media_file(
     else:
         headers = {"Content-Disposition": f'inline; filename="{filename}"'}
 
-    return FileResponse(
+    return await file_response(
+        request,
         media.file_path,
-        media_type=media_type,
-        headers=headers,
+        media_type,
+        headers,
+        etag=media.checksum,
+        max_age=max_age,
     )
 
 
@@ -148,6 +155,7 @@ async def get_round_transcript_signed_url(
 
 @router.get("/rounds/{round_id}/transcript")
 async def get_round_transcript_file(
+    request: Request,
     round_id: str,
     token: str | None = Query(None),
     disposition: str = Query("inline", pattern="^(inline|attachment)$"),
@@ -156,6 +164,7 @@ async def get_round_transcript_file(
 ):
     """Serve a round transcript file. Accepts either auth header or signed token."""
     user_id = None
+    max_age = None
 
     # Try token-based auth first
     if token:
@@ -164,6 +173,8 @@ async def get_round_transcript_file(
             if payload.get("round_id") != round_id:
                 raise HTTPException(status_code=403, detail="Token mismatch")
             user_id = payload.get("user_id")
+            # The signed URL is only valid until the token expires
+            max_age = token_max_age(payload)
 
     # Fall back to header-based auth
     if not user_id and user:
@@ -200,11 +211,7 @@ async def get_round_transcript_file(
     else:
         headers = {"Content-Disposition": f'inline; filename="{filename}"'}
 
-    return FileResponse(
-        file_path,
-        media_type=media_type,
-        headers=headers,
-    )
+    return await file_response(request, file_path, media_type, headers, max_age=max_age)
 
 
 # Document endpoints
@@ -246,6 +253,7 @@ async def get_signed_url(
 
 @router.get("/{application_id}/{doc_type}")
 async def get_file(
+    request: Request,
     application_id: str,
     doc_type: str,
     token: str | None = Query(None),
@@ -255,6 +263,7 @@ async def get_file(
 ):
     """Serve a file. Accepts either auth header or signed token."""
     user_id = None
+    max_age = None
 
     # Try token-based auth first
     if token:
@@ -265,6 +274,8 @@ async def get_file(
             if payload.get("doc_type") != doc_type:
                 raise HTTPException(status_code=403, detail="Token mismatch")
             user_id = payload.get("user_id")
+            # The signed URL is only valid until the token expires
+            max_age = token_max_age(payload)
 
     # Fall back to header-based auth
     if not user_id and user:
@@ -309,8 +320,4 @@ async def get_file(
     else:
         headers = {"Content-Disposition": f'inline; filename="{filename}"'}
 
-    return FileResponse(
-        file_path,
-        media_type=media_type,
-        headers=headers,
-    )
+    return await file_response(request, file_path, media_type, headers, max_age=max_age)
@@ -5,6 +5,7 @@ containing JSON data and optional media files.
 """
 
 import asyncio
+import hashlib
 import importlib
 import json
 import logging
@@ -38,6 +39,7 @@ import_schemas = importlib.import_module("app.schemas.import")
 ImportDataSchema = import_schemas.ImportDataSchema
 ImportValidationResponse = import_schemas.ImportValidationResponse
 from app.api.utils.zip_utils import validate_zip_safety
+from app.services.blob_store import incoming_path, normalize_ext, place_blob
 from app.services.export_registry import default_registry
 from app.services.import_id_mapper import IDMapper
 from app.services.import_service import ImportService
@@ -80,7 +82,6 @@ SSE_POLL_MAX_SECONDS = 300  # 5 minutes
 
 SECURE_TEMP_DIR = "/tmp/secure_imports"  # nosec B108 # Intentional secure dir with mode 0o700
 os.makedirs(SECURE_TEMP_DIR, mode=0o700, exist_ok=True)
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
 
 
 def create_secure_temp_file(original_filename: str) -> str:
@@ -169,8 +170,6 @@ class ImportProgress:
 # Helper Functions
 # ============================================================================
 
-from pathlib import Path
-
 
 async def ensure_status_exists(
     db: AsyncSession, user_id: str, status_name: str
@@ -223,34 +222,37 @@ async def ensure_round_type_exists(
     return round_type
 
 
-def extract_files_from_zip(zip_path: str, user_id: str) -> dict[str, str]:
-    """Extract files from ZIP and return mapping of old paths to new paths."""
+def extract_files_from_zip(zip_path: str) -> dict[str, str]:
+    """Move the files in an import ZIP into the blob store. Blocking.
 
-    user_upload_dir = Path(UPLOAD_DIR) / str(user_id)
-    user_upload_dir.mkdir(parents=True, exist_ok=True)
+    Each file is hashed as it is extracted and placed like an upload, so
+    imported files are deduplicated against each other and against files
+    already stored, and the rows pointing at them take references through
+    the mapper events. Files left unreferenced by a failed import are
+    removed by garbage collection.
 
+    Returns:
+        Mapping of archive names to stored paths.
+    """
     file_mapping = {}
 
     with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        for file_info in zip_ref.filelist:
-            if file_info.filename.startswith("files/") and not file_info.is_dir():
-                # Extract to user's upload directory
-                filename = Path(file_info.filename).name
-                dest_path = user_upload_dir / filename
-
-                # Avoid collisions
-                counter = 1
-                while dest_path.exists():
-                    stem = Path(file_info.filename).stem
-                    suffix = Path(file_info.filename).suffix
-                    dest_path = user_upload_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-                zip_ref.extract(file_info, str(user_upload_dir))
-
-                # Map old path (from ZIP) to new path
-                old_path = file_info.filename
-                file_mapping[old_path] = str(dest_path.relative_to(Path(UPLOAD_DIR)))
+        for file_info in zip_ref.infolist():
+            if not file_info.filename.startswith("files/") or file_info.is_dir():
+                continue
+
+            temp_path = incoming_path()
+            os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+            digest = hashlib.sha256()
+            with zip_ref.open(file_info) as src, open(temp_path, "wb") as dst:
+                while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    dst.write(chunk)
+
+            ext = normalize_ext(os.path.splitext(file_info.filename)[1], "")
+            file_mapping[file_info.filename] = place_blob(
+                temp_path, digest.hexdigest(), ext
+            )
 
     return file_mapping
 
@@ -314,7 +316,11 @@ async def import_applications(
             job_description=app_data.job_description,
             job_url=app_data.job_url,
             status_id=status.id,
-            cv_path=file_mapping.get(f"files/applications/cv_{app_data.id}.pdf")
+            cv_path=(
+                file_mapping.get(f"files/applications/cv_{app_data.id}.pdf")
+                # Stored files shared between applications are archived once
+                or file_mapping.get(f"files/blobs/{os.path.basename(app_data.cv_path)}")
+            )
             if app_data.cv_path
             else None,
             applied_at=applied_at,
@@ -376,7 +382,10 @@ async def import_applications(
 
             # Import media
             for media_data in round_data.media:
-                media_path = file_mapping.get(media_data.path or "")
+                media_name = os.path.basename(media_data.path or "")
+                media_path = file_mapping.get(
+                    media_data.path or ""
+                ) or file_mapping.get(f"files/blobs/{media_name}")
                 if media_path:
                     media = RoundMedia(
                         round_id=round.id,
@@ -604,7 +613,7 @@ async def import_data(
             import_id, stage="extracting", percent=30, message="Extracting files..."
         )
 
-        file_mapping = extract_files_from_zip(temp_path, str(user.id))
+        file_mapping = await asyncio.to_thread(extract_files_from_zip, temp_path)
 
         # Stage 4: Override if requested
         if override:
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from datetime import date, timedelta
+from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import case, create_engine, func, or_, select
@@ -25,6 +25,7 @@ from app.models import (
 )
 from app.schemas.insights import GraceInsights, InsightsRequest
 from app.services.insights import generate_insights
+from app.services.kpis import compute_kpis, period_start_date
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +39,6 @@ settings = get_settings()
 # Module-level sync engine (lazy initialization)
 _sync_engine = None
 
-# Far past date for "all time" queries
-FAR_PAST_DATE = date(2000, 1, 1)
-
 
 def _get_sync_engine():
     """Get or create the sync database engine (lazy initialization)."""
@@ -148,87 +146,15 @@ async def _get_analytics_for_insights(
     for processing. Returns structured data for the AI insights service.
     """
     today = date.today()
-
-    # Calculate date range based on period
-    if period == "7d":
-        start_date = today - timedelta(days=7)
-    elif period == "30d":
-        start_date = today - timedelta(days=30)
-    elif period == "3m":
-        start_date = today - timedelta(days=90)
-    elif period == "all":
-        start_date = FAR_PAST_DATE
-    else:
-        start_date = today - timedelta(days=30)  # Default to 30d
+    start_date = period_start_date(period, today)
 
     # Fetch all the data we need using async queries
     # Then process it synchronously for consistency
 
     # --- Pipeline Overview Data ---
-    # Total applications in period
-    result = await db.execute(
-        select(func.count(Application.id)).where(
-            Application.user_id == user_id,
-            Application.applied_at >= start_date,
-        )
-    )
-    total_applications = result.scalar() or 0
-
-    # Interviews (status = Interviewing)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user_id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name == "Interviewing",
-        )
-    )
-    interviews = result.scalar() or 0
-
-    # Offers (status = Offer)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user_id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name == "Offer",
-        )
-    )
-    offers = result.scalar() or 0
-
-    # Response rate: applications that got any response (not "No Reply" status)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user_id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name != "No Reply",
-        )
-    )
-    responded = result.scalar() or 0
-    response_rate = (
-        (responded / total_applications * 100) if total_applications > 0 else 0
-    )
-
-    # Interview rate
-    interview_rate = (
-        (interviews / total_applications * 100) if total_applications > 0 else 0
-    )
-
-    # Active applications (not Rejected or Withdrawn)
-    result = await db.execute(
-        select(func.count(Application.id))
-        .join(ApplicationStatus)
-        .where(
-            Application.user_id == user_id,
-            Application.applied_at >= start_date,
-            ApplicationStatus.name.not_in(["Rejected", "Withdrawn"]),
-        )
-    )
-    active_applications = result.scalar() or 0
+    # All headline counts in one aggregate query
+    kpis = await compute_kpis(db, user_id, start_date=start_date, today=today)
+    total_applications = kpis.total
 
     # Stage breakdown - count applications by status
     result = await db.execute(
@@ -518,11 +444,11 @@ async def _get_analytics_for_insights(
     return {
         "pipeline_overview": {
             "total_applications": total_applications,
-            "interviews": interviews,
-            "offers": offers,
-            "response_rate": round(response_rate, 1),
-            "interview_rate": round(interview_rate, 1),
-            "active_applications": active_applications,
+            "interviews": kpis.interviews,
+            "offers": kpis.offers,
+            "response_rate": kpis.response_rate,
+            "interview_rate": kpis.interview_rate,
+            "active_applications": kpis.active,
             "stage_breakdown": stage_breakdown,
         },
         "interview_analytics": {
@@ -2,6 +2,8 @@
 
 This module provides API endpoints for managing job leads, including:
 - Creating new job leads from URLs (with AI-powered extraction)
+- Background extraction with pollable status
+- Batch capture of many URLs with parallel extraction
 - Listing and filtering job leads
 - Viewing job lead details
 - Converting job leads to applications
@@ -11,15 +13,18 @@ The API supports both web app authentication (Bearer token) and
 browser extension authentication (API token).
 """
 
+import asyncio
 import logging
 from datetime import UTC, datetime
+from functools import partial
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import false, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import async_session_maker, get_db
 from app.core.deps import (
     get_current_user,
     get_current_user_by_api_token,
@@ -29,10 +34,15 @@ from app.core.security import decrypt_api_key
 from app.models import SystemSettings, User
 from app.models.application import Application
 from app.models.job_lead import JobLead
+from app.models.search_index import JOB_LEAD
 from app.models.status import ApplicationStatus
 from app.schemas.application import ApplicationListItem
 from app.schemas.job_lead import (
+    JobLeadBatchCreate,
+    JobLeadBatchResponse,
+    JobLeadBatchResult,
     JobLeadCreate,
+    JobLeadExtractionInput,
     JobLeadListResponse,
     JobLeadResponse,
 )
@@ -43,16 +53,31 @@ from app.services.extraction import (
     NoJobFoundError,
     extract_job_data,
 )
+from app.services.http_client import ResponseTooLargeError, http_client
+from app.services.pagination import paginate
+from app.services.search import search_matches
+from app.services.task_queue import BackgroundTaskQueue, TaskQueueFullError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/job-leads", tags=["job-leads"])
 
-# HTTP client settings for fetching job posting URLs
-HTTP_TIMEOUT_SECONDS = 30
-HTTP_MAX_REDIRECTS = 5
+# Newest first; id breaks ties so keyset pages never skip or repeat rows
+JOB_LEAD_SORT_KEY = (JobLead.scraped_at, JobLead.id)
+
+# User agent sent when fetching job posting URLs
 HTTP_USER_AGENT = "Mozilla/5.0 (compatible; TarnishedBot/1.0)"
 
+# Longest a client may block on GET /{id}/status?wait=N
+MAX_STATUS_WAIT_SECONDS = 30
+
+# Worker pool for background (fetch + extract) job-lead processing
+job_lead_queue = BackgroundTaskQueue(
+    "job-lead-extraction",
+    workers=get_settings().job_lead_workers,
+    maxsize=get_settings().job_lead_queue_size,
+)
+
 
 async def _get_ai_settings(
     db: AsyncSession,
@@ -91,12 +116,162 @@ async def _get_ai_settings(
     return model, api_key, api_base
 
 
+def _extraction_http_error(error: ExtractionError, url: str) -> HTTPException:
+    """Map an extraction failure to the HTTP error returned to the client.
+
+    Args:
+        error: The extraction exception.
+        url: The job posting URL (for logging).
+
+    Returns:
+        HTTPException with a user-facing detail message.
+    """
+    if isinstance(error, ExtractionTimeoutError):
+        logger.error(f"Extraction timeout for {url}: {error.message}")
+        return HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Job data extraction timed out. Please try again later.",
+        )
+    if isinstance(error, NoJobFoundError):
+        logger.warning(f"No job found at {url}: {error.message}")
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not extract job posting data from the provided URL. "
+            "Please ensure the URL points to a valid job posting.",
+        )
+    if isinstance(error, ExtractionInvalidResponseError):
+        logger.error(f"Invalid extraction response for {url}: {error.message}")
+        return HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to extract job data due to an AI service error. Please try again later.",
+        )
+    logger.error(f"Extraction error for {url}: {error.message}")
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"Failed to extract job data: {error.message}",
+    )
+
+
+def _apply_extraction(job_lead: JobLead, extracted: JobLeadExtractionInput) -> None:
+    """Copy extracted fields onto a job lead and mark it as extracted."""
+    job_lead.status = "extracted"
+    job_lead.error_message = None
+    job_lead.title = extracted.title
+    job_lead.company = extracted.company
+    job_lead.description = extracted.description
+    job_lead.location = extracted.location
+    job_lead.salary_min = extracted.salary_min
+    job_lead.salary_max = extracted.salary_max
+    job_lead.salary_currency = extracted.salary_currency
+    job_lead.recruiter_name = extracted.recruiter_name
+    job_lead.recruiter_title = extracted.recruiter_title
+    job_lead.recruiter_linkedin_url = extracted.recruiter_linkedin_url
+    job_lead.requirements_must_have = extracted.requirements_must_have
+    job_lead.requirements_nice_to_have = extracted.requirements_nice_to_have
+    job_lead.skills = extracted.skills
+    job_lead.years_experience_min = extracted.years_experience_min
+    job_lead.years_experience_max = extracted.years_experience_max
+    job_lead.source = extracted.source
+    job_lead.posted_date = extracted.posted_date
+
+
+async def _run_background_extraction(
+    job_lead_id: str, html: str | None, text: str | None
+) -> None:
+    """Fetch and extract a pending job lead outside the request cycle.
+
+    Uses short-lived sessions for the initial read and the final write so no
+    database connection is held during the fetch or the LLM call.
+
+    Args:
+        job_lead_id: The pending job lead to process.
+        html: Optional HTML content supplied by the client.
+        text: Optional plain text content supplied by the client.
+    """
+    async with async_session_maker() as db:
+        job_lead = await db.get(JobLead, job_lead_id)
+        if job_lead is None or job_lead.status != "pending":
+            return
+        url = job_lead.url
+        ai_model, ai_api_key, ai_api_base = await _get_ai_settings(db)
+
+    extracted: JobLeadExtractionInput | None = None
+    error_message: str | None = None
+    try:
+        if not text and not html:
+            html = await _fetch_html(url)
+        async with async_session_maker() as cache_db:
+            extracted = await extract_job_data(
+                html=html,
+                text=text,
+                url=url,
+                model=ai_model,
+                api_key=ai_api_key,
+                api_base=ai_api_base,
+                db=cache_db,
+            )
+    except HTTPException as e:
+        error_message = str(e.detail)
+    except ExtractionError as e:
+        error_message = str(_extraction_http_error(e, url).detail)
+    except Exception as e:
+        logger.exception(f"Unexpected error extracting job lead {job_lead_id}")
+        error_message = f"Unexpected error during extraction: {e}"
+
+    async with async_session_maker() as db:
+        job_lead = await db.get(JobLead, job_lead_id)
+        if job_lead is None:
+            # Deleted while the extraction was running
+            return
+        if extracted is not None:
+            _apply_extraction(job_lead, extracted)
+            job_lead.scraped_at = datetime.now(UTC)
+        else:
+            job_lead.status = "failed"
+            job_lead.error_message = error_message
+        await db.commit()
+
+    logger.info(f"Background extraction for job lead {job_lead_id} finished")
+
+
+async def fail_interrupted_job_leads(db: AsyncSession) -> int:
+    """Mark job leads left pending by a previous process as failed.
+
+    Background extraction state lives in process memory, so leads that were
+    still pending when the server stopped will never complete. Marking them
+    failed lets users re-run them via the retry endpoint.
+
+    Returns:
+        The number of job leads updated.
+    """
+    result = await db.execute(
+        update(JobLead)
+        .where(JobLead.status == "pending")
+        .values(
+            status="failed",
+            error_message="Extraction was interrupted by a server restart. "
+            "Please retry.",
+        )
+    )
+    await db.commit()
+    count = result.rowcount or 0  # type: ignore[attr-defined]
+    if count:
+        logger.warning(f"Marked {count} interrupted job lead(s) as failed")
+    return count
+
+
 @router.get("", response_model=JobLeadListResponse)
 async def list_job_leads(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    include_total: bool = Query(True, description="Count all matching items"),
     status_filter: str | None = Query(None, alias="status"),
-    search: str | None = Query(None, description="Search by URL (exact match)"),
+    search: str | None = Query(
+        None, description="Exact URL, or full-text search matching word prefixes"
+    ),
     user: User = Depends(get_current_user_flexible),
     db: AsyncSession = Depends(get_db),
 ):
@@ -105,40 +280,66 @@ async def list_job_leads(
     Args:
         page: Page number (1-indexed).
         per_page: Items per page (max 100).
+        cursor: Cursor from a previous page; when given, page is ignored.
+        include_total: Whether to count all matching leads.
         status_filter: Optional status filter (pending, extracted, failed).
-        search: Optional URL search (exact match, used by extension to check existing leads).
+        search: Optional search. A URL is matched exactly (used by extension to
+            check existing leads); other text is a ranked full-text search.
         user: The authenticated user.
         db: Database session.
 
     Returns:
         Paginated list of job leads.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid.
     """
     query = select(JobLead).where(JobLead.user_id == user.id)
 
     if status_filter:
         query = query.where(JobLead.status == status_filter)
 
-    # Search by exact URL match (used by extension to check for existing leads)
-    if search:
-        query = query.where(JobLead.url == search)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    sort_key = list(JOB_LEAD_SORT_KEY)
+    parsers = [datetime.fromisoformat, str]
+    is_url_lookup = bool(search) and search.startswith(("http://", "https://"))
 
-    # Order by most recent first, then apply pagination
-    query = query.order_by(JobLead.scraped_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    job_leads = result.scalars().all()
+    # A URL is matched exactly (used by extension to check for existing
+    # leads); anything else is a ranked full-text search
+    if is_url_lookup:
+        query = query.where(JobLead.url == search)
+    elif search:
+        matches = search_matches(db.bind.dialect.name, JOB_LEAD, user.id, search)
+        if matches is not None:
+            query = query.join(matches, matches.c.doc_id == JobLead.id)
+            sort_key.insert(0, matches.c.rank)
+            parsers.insert(0, float)
+        else:
+            # Input with no searchable words (only punctuation) matches nothing
+            query = query.where(false())
+
+    # Most recent first; exact URL lookups skip the count
+    try:
+        result = await paginate(
+            db,
+            query,
+            sort_key,
+            parsers,
+            per_page=per_page,
+            page=page,
+            cursor=cursor,
+            count=include_total and not is_url_lookup,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
     return JobLeadListResponse(
-        items=job_leads,  # type: ignore[arg-type]
-        total=total,
+        items=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -181,6 +382,11 @@ async def get_job_lead(
 @router.post("", response_model=JobLeadResponse, status_code=status.HTTP_201_CREATED)
 async def create_job_lead(
     data: JobLeadCreate,
+    response: Response,
+    background: bool = Query(
+        False,
+        description="Return immediately with a pending lead and extract in the background",
+    ),
     user: User = Depends(get_current_user_by_api_token),
     db: AsyncSession = Depends(get_db),
 ):
@@ -191,19 +397,27 @@ async def create_job_lead(
     2. Uses AI to extract structured job data from the HTML
     3. Creates a JobLead record in the database
 
+    With ``background=true`` the lead is created immediately with status
+    "pending" and steps 1-2 run in a worker pool. The response is 202 and
+    the client polls ``GET /api/job-leads/{id}/status`` until the status
+    becomes "extracted" or "failed".
+
     The endpoint supports both Bearer token and X-API-Key authentication
     for use with browser extensions.
 
     Args:
         data: JobLeadCreate schema with url (required) and optional html content.
+        response: Response object (used to set 202 for background requests).
+        background: Whether to extract asynchronously.
         user: The authenticated user (via API token).
         db: Database session.
 
     Returns:
-        The created JobLead record with extracted data.
+        The created JobLead record with extracted data (or pending status).
 
     Raises:
-        HTTPException: 400 for invalid/extraction failures, 502 for fetch failures.
+        HTTPException: 400 for invalid/extraction failures, 502 for fetch failures,
+                     503 if the background queue is full.
     """
     url = data.url
     logger.info(f"Creating job lead for URL: {url} (user: {user.id})")
@@ -225,6 +439,30 @@ async def create_job_lead(
             detail=f"A job lead already exists for this URL. ID: {existing.id}",
         )
 
+    if background:
+        job_lead = JobLead(user_id=user.id, url=url, status="pending")
+        db.add(job_lead)
+        await db.commit()
+        await db.refresh(job_lead)
+
+        try:
+            job_lead_queue.submit(
+                job_lead.id,
+                partial(_run_background_extraction, job_lead.id, data.html, data.text),
+            )
+        except TaskQueueFullError:
+            logger.warning(f"Extraction queue full, rejecting job lead for {url}")
+            await db.delete(job_lead)
+            await db.commit()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many extractions in progress. Please try again shortly.",
+            )
+
+        logger.info(f"Queued background extraction for job lead {job_lead.id}")
+        response.status_code = status.HTTP_202_ACCEPTED
+        return job_lead
+
     # Step 1: Get content for extraction
     # Prefer text (direct from extension), fall back to HTML, then fetch from URL
     if data.text:
@@ -252,56 +490,14 @@ async def create_job_lead(
             model=ai_model,
             api_key=ai_api_key,
             api_base=ai_api_base,
-        )
-    except ExtractionTimeoutError as e:
-        logger.error(f"Extraction timeout for {url}: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Job data extraction timed out. Please try again later.",
-        )
-    except NoJobFoundError as e:
-        logger.warning(f"No job found at {url}: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Could not extract job posting data from the provided URL. "
-            "Please ensure the URL points to a valid job posting.",
-        )
-    except ExtractionInvalidResponseError as e:
-        logger.error(f"Invalid extraction response for {url}: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to extract job data due to an AI service error. Please try again later.",
+            db=db,
         )
     except ExtractionError as e:
-        logger.error(f"Extraction error for {url}: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to extract job data: {e.message}",
-        )
+        raise _extraction_http_error(e, url)
 
     # Step 3: Create JobLead record
-    job_lead = JobLead(
-        user_id=user.id,
-        url=url,
-        status="extracted",
-        title=extracted.title,
-        company=extracted.company,
-        description=extracted.description,
-        location=extracted.location,
-        salary_min=extracted.salary_min,
-        salary_max=extracted.salary_max,
-        salary_currency=extracted.salary_currency,
-        recruiter_name=extracted.recruiter_name,
-        recruiter_title=extracted.recruiter_title,
-        recruiter_linkedin_url=extracted.recruiter_linkedin_url,
-        requirements_must_have=extracted.requirements_must_have,
-        requirements_nice_to_have=extracted.requirements_nice_to_have,
-        skills=extracted.skills,
-        years_experience_min=extracted.years_experience_min,
-        years_experience_max=extracted.years_experience_max,
-        source=extracted.source,
-        posted_date=extracted.posted_date,
-    )
+    job_lead = JobLead(user_id=user.id, url=url)
+    _apply_extraction(job_lead, extracted)
 
     db.add(job_lead)
     await db.commit()
@@ -314,6 +510,212 @@ async def create_job_lead(
     return job_lead
 
 
+@router.post("/batch", response_model=JobLeadBatchResponse)
+async def create_job_leads_batch(
+    data: JobLeadBatchCreate,
+    response: Response,
+    background: bool = Query(
+        False,
+        description="Return immediately with pending leads and extract in the background",
+    ),
+    user: User = Depends(get_current_user_by_api_token),
+    db: AsyncSession = Depends(get_db),
+):
+    """Capture many job leads in one request.
+
+    This endpoint:
+    1. Drops URLs repeated within the batch
+    2. Checks all remaining URLs against the user's existing leads in one query
+    3. Creates a pending JobLead for every new URL in one commit
+    4. Fetches and extracts the new leads concurrently, at most
+       ``settings.job_lead_batch_concurrency`` at a time
+
+    Extraction runs without holding this request's database session. With
+    ``background=true`` step 4 is handed to the background worker pool and
+    the response (202) contains the pending leads. If the queue fills up
+    partway through, the leads that did not fit are removed again and
+    reported as ``rejected`` so the client can retry just those URLs.
+
+    Args:
+        data: Batch of URLs with optional text/html content.
+        response: Response object (used to set 202 for background requests).
+        background: Whether to extract asynchronously.
+        user: The authenticated user (via API token).
+        db: Database session.
+
+    Returns:
+        Per-URL results in request order (created, duplicate, rejected, or
+        error if the lead disappeared during extraction).
+    """
+    # Step 1: Dedupe within the batch, keeping the first occurrence
+    items_by_url: dict[str, JobLeadCreate] = {}
+    for item in data.items:
+        items_by_url.setdefault(item.url, item)
+
+    # Step 2: One query for all existing leads with these URLs
+    result = await db.execute(
+        select(JobLead.url, JobLead.id).where(
+            JobLead.user_id == user.id,
+            JobLead.url.in_(list(items_by_url)),
+        )
+    )
+    existing_ids = dict(result.all())
+
+    # Step 3: Create all new leads as pending in a single commit
+    new_leads = {
+        url: JobLead(user_id=user.id, url=url, status="pending")
+        for url in items_by_url
+        if url not in existing_ids
+    }
+    db.add_all(new_leads.values())
+    await db.commit()
+
+    logger.info(
+        f"Batch capture for user {user.id}: {len(new_leads)} new, "
+        f"{len(items_by_url) - len(new_leads)} duplicate"
+    )
+
+    # Step 4: Fetch + extract the new leads
+    rejected: set[str] = set()
+    if background:
+        for url, job_lead in new_leads.items():
+            item = items_by_url[url]
+            try:
+                job_lead_queue.submit(
+                    job_lead.id,
+                    partial(
+                        _run_background_extraction, job_lead.id, item.html, item.text
+                    ),
+                )
+            except TaskQueueFullError:
+                rejected.add(url)
+        if rejected:
+            # Leads that didn't fit would stay pending with nobody to
+            # process them; the queued ones keep going
+            logger.warning(
+                f"Extraction queue full during batch capture, "
+                f"rejected {len(rejected)} of {len(new_leads)}"
+            )
+            for url in rejected:
+                await db.delete(new_leads.pop(url))
+            await db.commit()
+        response.status_code = status.HTTP_202_ACCEPTED
+    elif new_leads:
+        fan_out = asyncio.Semaphore(max(1, get_settings().job_lead_batch_concurrency))
+
+        async def _extract(job_lead_id: str, item: JobLeadCreate) -> None:
+            async with fan_out:
+                await _run_background_extraction(job_lead_id, item.html, item.text)
+
+        await asyncio.gather(
+            *(
+                _extract(job_lead.id, items_by_url[url])
+                for url, job_lead in new_leads.items()
+            )
+        )
+
+        # Reload the leads written by the extraction sessions
+        result = await db.execute(
+            select(JobLead)
+            .where(JobLead.id.in_([lead.id for lead in new_leads.values()]))
+            .execution_options(populate_existing=True)
+        )
+        new_leads = {lead.url: lead for lead in result.scalars().all()}
+
+    # Report results in request order (repeated URLs are reported once)
+    results = []
+    for url in items_by_url:
+        if url in existing_ids:
+            results.append(
+                JobLeadBatchResult(
+                    url=url, result="duplicate", existing_id=existing_ids[url]
+                )
+            )
+        elif url in rejected:
+            results.append(
+                JobLeadBatchResult(
+                    url=url,
+                    result="rejected",
+                    detail="Too many extractions in progress. Please try again shortly.",
+                )
+            )
+        elif (job_lead := new_leads.get(url)) is None:
+            # Deleted by the user while it was being extracted
+            results.append(
+                JobLeadBatchResult(
+                    url=url, result="error", detail="Job lead no longer exists"
+                )
+            )
+        else:
+            results.append(
+                JobLeadBatchResult(
+                    url=url,
+                    result="created",
+                    job_lead=JobLeadResponse.model_validate(job_lead),
+                )
+            )
+
+    return JobLeadBatchResponse(
+        results=results,
+        created=len(new_leads),
+        duplicates=len(existing_ids),
+        rejected=len(rejected),
+    )
+
+
+@router.get("/{job_lead_id}/status", response_model=JobLeadResponse)
+async def get_job_lead_status(
+    job_lead_id: str,
+    wait: int = Query(
+        0,
+        ge=0,
+        le=MAX_STATUS_WAIT_SECONDS,
+        description="Seconds to wait for a pending extraction to finish (long-poll)",
+    ),
+    user: User = Depends(get_current_user_flexible),
+    db: AsyncSession = Depends(get_db),
+):
+    """Poll a job lead's extraction status.
+
+    Supports plain polling (``wait=0``) and long-polling: with ``wait=N``
+    the request returns as soon as a background extraction finishes, or
+    after N seconds with the lead still pending.
+
+    Args:
+        job_lead_id: The UUID of the job lead.
+        wait: Maximum seconds to wait for completion.
+        user: The authenticated user (JWT or API token).
+        db: Database session.
+
+    Returns:
+        The job lead, including status and error_message.
+
+    Raises:
+        HTTPException: 404 if job lead not found or doesn't belong to user.
+    """
+    result = await db.execute(
+        select(JobLead).where(
+            JobLead.id == job_lead_id,
+            JobLead.user_id == user.id,
+        )
+    )
+    job_lead = result.scalars().first()
+
+    if not job_lead:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job lead not found",
+        )
+
+    if wait and job_lead.status == "pending" and job_lead_queue.is_pending(job_lead_id):
+        # Release the connection while waiting so long-polls don't pin the pool
+        await db.commit()
+        await job_lead_queue.wait(job_lead_id, timeout=wait)
+        await db.refresh(job_lead)
+
+    return job_lead
+
+
 async def _fetch_html(url: str) -> str:
     """Fetch HTML content from a URL.
 
@@ -332,63 +734,58 @@ async def _fetch_html(url: str) -> str:
         "Accept-Language": "en-US,en;q=0.5",
     }
 
-    async with httpx.AsyncClient(
-        timeout=HTTP_TIMEOUT_SECONDS,
-        follow_redirects=True,
-        max_redirects=HTTP_MAX_REDIRECTS,
-    ) as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-        except httpx.TimeoutException:
-            logger.warning(f"Timeout fetching URL: {url}")
-            raise HTTPException(
-                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                detail="The job posting URL timed out. Please try again later.",
-            )
-        except httpx.TooManyRedirects:
-            logger.warning(f"Too many redirects for URL: {url}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="The URL has too many redirects. Please provide a direct job posting URL.",
-            )
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            logger.warning(f"HTTP error {status_code} for URL: {url}")
-            if status_code == 404:
-                detail = (
-                    "The job posting was not found (404). It may have been removed."
-                )
-            elif status_code == 403:
-                detail = "Access to the job posting was denied (403). The page may require authentication."
-            elif status_code >= 500:
-                detail = f"The job posting server returned an error ({status_code}). Please try again later."
-            else:
-                detail = f"Failed to fetch job posting (HTTP {status_code})."
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=detail,
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Request error for URL {url}: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Failed to fetch the job posting URL: {str(e)}",
-            )
+    try:
+        result = await http_client.fetch_text(url, headers)
+    except httpx.TimeoutException:
+        logger.warning(f"Timeout fetching URL: {url}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="The job posting URL timed out. Please try again later.",
+        )
+    except httpx.TooManyRedirects:
+        logger.warning(f"Too many redirects for URL: {url}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The URL has too many redirects. Please provide a direct job posting URL.",
+        )
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        logger.warning(f"HTTP error {status_code} for URL: {url}")
+        if status_code == 404:
+            detail = "The job posting was not found (404). It may have been removed."
+        elif status_code == 403:
+            detail = "Access to the job posting was denied (403). The page may require authentication."
+        elif status_code >= 500:
+            detail = f"The job posting server returned an error ({status_code}). Please try again later."
+        else:
+            detail = f"Failed to fetch job posting (HTTP {status_code})."
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=detail,
+        )
+    except ResponseTooLargeError as e:
+        logger.warning(f"Response too large for URL {url}: limit {e.limit} bytes")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The job posting page is too large to process.",
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Request error for URL {url}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to fetch the job posting URL: {str(e)}",
+        )
 
-        # Validate content type
-        content_type = response.headers.get("content-type", "")
-        if (
-            "text/html" not in content_type
-            and "application/xhtml+xml" not in content_type
-        ):
-            logger.warning(f"Non-HTML content type for URL {url}: {content_type}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="The URL does not point to an HTML page. Please provide a job posting URL.",
-            )
+    # Validate content type
+    content_type = result.content_type
+    if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
+        logger.warning(f"Non-HTML content type for URL {url}: {content_type}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The URL does not point to an HTML page. Please provide a job posting URL.",
+        )
 
-        return response.text
+    return result.text
 
 
 @router.post("/{job_lead_id}/retry", response_model=JobLeadResponse)
@@ -456,81 +853,26 @@ async def retry_job_lead_extraction(
 
         try:
             extracted = await extract_job_data(
-                html_content,
-                job_lead.url,
+                html=html_content,
+                url=job_lead.url,
                 model=ai_model,
                 api_key=ai_api_key,
                 api_base=ai_api_base,
+                db=db,
             )
             logger.info(
                 f"Successfully re-extracted job: {extracted.title} at {extracted.company}"
             )
-        except ExtractionTimeoutError as e:
-            logger.error(f"Extraction timeout for {job_lead.url}: {e.message}")
-            # Update job lead status to failed with error
-            job_lead.status = "failed"
-            job_lead.error_message = (
-                "Job data extraction timed out. Please try again later."
-            )
-            await db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                detail="Job data extraction timed out. Please try again later.",
-            )
-        except NoJobFoundError as e:
-            logger.warning(f"No job found at {job_lead.url}: {e.message}")
-            # Update job lead status to failed with error
-            job_lead.status = "failed"
-            job_lead.error_message = "Could not extract job posting data. Please ensure the URL points to a valid job posting."
-            await db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Could not extract job posting data from the provided URL. "
-                "Please ensure the URL points to a valid job posting.",
-            )
-        except ExtractionInvalidResponseError as e:
-            logger.error(f"Invalid extraction response for {job_lead.url}: {e.message}")
-            # Update job lead status to failed with error
-            job_lead.status = "failed"
-            job_lead.error_message = "Failed to extract job data due to an AI service error. Please try again later."
-            await db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail="Failed to extract job data due to an AI service error. Please try again later.",
-            )
         except ExtractionError as e:
-            logger.error(f"Extraction error for {job_lead.url}: {e.message}")
+            http_error = _extraction_http_error(e, job_lead.url)
             # Update job lead status to failed with error
             job_lead.status = "failed"
-            job_lead.error_message = f"Failed to extract job data: {e.message}"
+            job_lead.error_message = str(http_error.detail)
             await db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Failed to extract job data: {e.message}",
-            )
+            raise http_error
 
         # Step 5: Update job lead fields with new extraction
-        job_lead.status = "extracted"
-        job_lead.error_message = None  # Clear any previous error
-
-        # Update all fields that might have changed
-        job_lead.title = extracted.title
-        job_lead.company = extracted.company
-        job_lead.description = extracted.description
-        job_lead.location = extracted.location
-        job_lead.salary_min = extracted.salary_min
-        job_lead.salary_max = extracted.salary_max
-        job_lead.salary_currency = extracted.salary_currency
-        job_lead.recruiter_name = extracted.recruiter_name
-        job_lead.recruiter_title = extracted.recruiter_title
-        job_lead.recruiter_linkedin_url = extracted.recruiter_linkedin_url
-        job_lead.requirements_must_have = extracted.requirements_must_have
-        job_lead.requirements_nice_to_have = extracted.requirements_nice_to_have
-        job_lead.skills = extracted.skills
-        job_lead.years_experience_min = extracted.years_experience_min
-        job_lead.years_experience_max = extracted.years_experience_max
-        job_lead.source = extracted.source
-        job_lead.posted_date = extracted.posted_date
+        _apply_extraction(job_lead, extracted)
         job_lead.scraped_at = datetime.now(UTC)  # Update timestamp
 
         await db.commit()
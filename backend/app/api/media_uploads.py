@@ -0,0 +1,304 @@
+"""Resumable round media uploads, following the tus 1.0 core protocol.
+
+A client announces an upload with ``POST /api/rounds/{round_id}/media/uploads``
+and an ``Upload-Length`` header, then sends the bytes with one or more
+``PATCH`` requests to the returned ``Location``. If a connection drops, a
+``HEAD`` request reports the ``Upload-Offset`` the server has, and the client
+continues from there instead of starting over. When the last byte arrives
+the file is attached to the round as a RoundMedia row, and the final
+response's ``Location`` points at the stored file.
+
+``Upload-Metadata`` must carry ``filetype`` (an audio/* or video/* MIME
+type) and may carry ``filename``, whose extension is kept.
+"""
+
+import asyncio
+import fcntl
+import os
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from typing import Annotated
+
+import aiofiles
+import aiofiles.os
+from aiofiles.threadpool.binary import AsyncBufferedIOBase
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
+
+from app.api.streak import record_streak_activity
+from app.core.config import get_settings
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.models import Application, MediaUpload, Round, RoundMedia, User
+from app.services.blob_store import normalize_ext, place_blob
+from app.services.resumable_uploads import (
+    TUS_VERSION,
+    file_sha256,
+    parse_upload_metadata,
+    partial_path,
+    remove_partial,
+    sweep_expired_uploads,
+    upload_expiry,
+)
+
+router = APIRouter(tags=["rounds"])
+
+OFFSET_CONTENT_TYPE = "application/offset+octet-stream"
+
+
+def _upload_headers(upload: MediaUpload) -> dict[str, str]:
+    """Protocol headers describing an upload's current state."""
+    expires_at = upload.expires_at
+    if expires_at.tzinfo is None:
+        # SQLite returns naive datetimes; they are stored in UTC
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return {
+        "Tus-Resumable": TUS_VERSION,
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.length),
+        "Upload-Expires": format_datetime(expires_at, usegmt=True),
+    }
+
+
+async def _get_upload(db: AsyncSession, upload_id: str, user: User) -> MediaUpload:
+    """Load an unexpired upload owned by user whose round still exists.
+
+    Raises:
+        HTTPException: 404 if there is no such upload.
+    """
+    result = await db.execute(
+        select(MediaUpload)
+        .join(Round, Round.id == MediaUpload.round_id)
+        .join(Application)
+        .where(
+            MediaUpload.id == upload_id,
+            MediaUpload.user_id == user.id,
+            MediaUpload.expires_at >= datetime.now(UTC),
+            Application.user_id == user.id,
+        )
+    )
+    upload = result.scalars().first()
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return upload
+
+
+@router.post(
+    "/api/rounds/{round_id}/media/uploads", status_code=status.HTTP_201_CREATED
+)
+async def create_media_upload(
+    round_id: str,
+    upload_length: Annotated[int | None, Header()] = None,
+    upload_metadata: Annotated[str | None, Header()] = None,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Start a resumable media upload for a round."""
+    result = await db.execute(
+        select(Round)
+        .join(Application)
+        .where(Round.id == round_id, Application.user_id == user.id)
+    )
+    if not result.scalars().first():
+        raise HTTPException(status_code=404, detail="Round not found")
+
+    if upload_length is None or upload_length < 0:
+        raise HTTPException(status_code=400, detail="Upload-Length header required")
+    settings = get_settings()
+    if upload_length > settings.max_media_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum size of {settings.max_media_size_mb}MB",
+        )
+
+    try:
+        metadata = parse_upload_metadata(upload_metadata)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    file_type = metadata.get("filetype", "")
+    if file_type.startswith("video/"):
+        media_type = "video"
+    elif file_type.startswith("audio/"):
+        media_type = "audio"
+    else:
+        raise HTTPException(status_code=400, detail="File must be video or audio")
+
+    # Creating uploads is infrequent; a good moment to drop abandoned ones
+    await sweep_expired_uploads(db)
+
+    upload = MediaUpload(
+        user_id=user.id,
+        round_id=round_id,
+        media_type=media_type,
+        file_ext=normalize_ext(
+            os.path.splitext(metadata.get("filename", ""))[1], ".bin"
+        ),
+        length=upload_length,
+        offset=0,
+        expires_at=upload_expiry(),
+    )
+    db.add(upload)
+    await db.flush()
+
+    path = partial_path(upload.id)
+    await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+    async with aiofiles.open(path, "xb"):
+        pass
+    await db.commit()
+
+    headers = _upload_headers(upload)
+    headers["Location"] = f"/api/media/uploads/{upload.id}"
+    return Response(status_code=status.HTTP_201_CREATED, headers=headers)
+
+
+@router.head("/api/media/uploads/{upload_id}")
+async def get_media_upload_offset(
+    upload_id: str,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Report how many bytes of an upload have been received."""
+    upload = await _get_upload(db, upload_id, user)
+    headers = _upload_headers(upload)
+    headers["Cache-Control"] = "no-store"
+    return Response(status_code=status.HTTP_200_OK, headers=headers)
+
+
+@router.patch("/api/media/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def append_media_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: Annotated[int | None, Header()] = None,
+    content_type: Annotated[str | None, Header()] = None,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Append the request body to an upload at the given offset.
+
+    The body is written as it arrives. If the client disconnects midway,
+    the bytes received so far are kept and reported by HEAD. The partial
+    file is locked from the offset check until the new offset is committed,
+    so a second PATCH of the same upload gets 423 instead of writing over
+    the first.
+    """
+    upload = await _get_upload(db, upload_id, user)
+
+    if content_type != OFFSET_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type must be {OFFSET_CONTENT_TYPE}",
+        )
+
+    path = partial_path(upload.id)
+    try:
+        async with aiofiles.open(path, "r+b") as f:
+            _lock_partial(f.fileno())
+            # Another request may have moved the offset since it was loaded
+            await db.refresh(upload)
+            if upload_offset != upload.offset:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Upload-Offset does not match the current offset",
+                )
+            return await _append_locked(f, upload, path, request, user, db)
+    except FileNotFoundError:
+        await db.delete(upload)
+        await db.commit()
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+
+def _lock_partial(fileno: int) -> None:
+    """Take the exclusive lock on an open partial file.
+
+    The lock is held until the file is closed. flock works across the
+    worker processes of one host; it is not reliable on network
+    filesystems.
+
+    Raises:
+        HTTPException: 423 if another request holds the lock.
+    """
+    try:
+        fcntl.flock(fileno, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        raise HTTPException(
+            status_code=status.HTTP_423_LOCKED,
+            detail="Upload is being written by another request",
+        )
+
+
+async def _append_locked(
+    f: AsyncBufferedIOBase,
+    upload: MediaUpload,
+    path: str,
+    request: Request,
+    user: User,
+    db: AsyncSession,
+) -> Response:
+    """Write a PATCH body to a locked partial file and record the new offset."""
+    start = upload.offset
+    remaining = upload.length - start
+    written = 0
+    try:
+        await f.seek(start)
+        async for chunk in request.stream():
+            if written + len(chunk) > remaining:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="Data exceeds Upload-Length",
+                )
+            await f.write(chunk)
+            written += len(chunk)
+    except ClientDisconnect:
+        pass  # keep what arrived so the client can resume from there
+    await f.flush()
+
+    await db.execute(
+        update(MediaUpload)
+        .where(MediaUpload.id == upload.id)
+        .values(offset=start + written, expires_at=upload_expiry())
+    )
+    await db.refresh(upload)
+    headers = _upload_headers(upload)
+
+    if upload.offset < upload.length:
+        await db.commit()
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
+
+    # Complete: move the file into the store and attach it to the round
+    await asyncio.to_thread(os.truncate, path, upload.length)
+    checksum = await asyncio.to_thread(file_sha256, path)
+    file_path = await asyncio.to_thread(place_blob, path, checksum, upload.file_ext)
+
+    media = RoundMedia(
+        round_id=upload.round_id,
+        file_path=file_path,
+        media_type=upload.media_type,
+        file_size=upload.length,
+        checksum=checksum,
+    )
+    db.add(media)
+    await db.delete(upload)
+    await db.commit()
+    await record_streak_activity(user=user, db=db)
+
+    headers["Location"] = f"/api/files/media/{media.id}"
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
+
+
+@router.delete("/api/media/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_media_upload(
+    upload_id: str,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Abandon an upload and discard the bytes received so far."""
+    upload = await _get_upload(db, upload_id, user)
+    await db.delete(upload)
+    await db.commit()
+    remove_partial(upload_id)
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={"Tus-Resumable": TUS_VERSION},
+    )
@@ -1,5 +1,4 @@
 import os
-import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from sqlalchemy import or_, select
@@ -7,11 +6,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.streak import record_streak_activity
+from app.api.utils.uploads import store_upload
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models import Application, Round, RoundMedia, RoundType, User
 from app.schemas.round import RoundCreate, RoundResponse, RoundUpdate
+from app.services.blob_store import normalize_ext, release_file
 
 router = APIRouter(tags=["rounds"])
 settings = get_settings()
@@ -131,8 +132,7 @@ async def delete_round(
         raise HTTPException(status_code=404, detail="Round not found")
 
     for media in round.media:
-        if os.path.exists(media.file_path):
-            os.remove(media.file_path)
+        release_file(media.file_path)
 
     await db.delete(round)
     await db.commit()
@@ -163,25 +163,15 @@ async def upload_media(
     else:
         raise HTTPException(status_code=400, detail="File must be video or audio")
 
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    ext = os.path.splitext(file.filename or "")[1] or ".bin"
-    file_name = f"{uuid.uuid4()}{ext}"
-    file_path = os.path.join(settings.upload_dir, file_name)
-
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        max_size = settings.max_media_size_mb * 1024 * 1024
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File exceeds maximum size of {settings.max_media_size_mb}MB",
-            )
-        f.write(content)
+    ext = normalize_ext(os.path.splitext(file.filename or "")[1], ".bin")
+    saved = await store_upload(file, ext, settings.max_media_size_mb)
 
     media = RoundMedia(
         round_id=round_id,
-        file_path=file_path,
+        file_path=saved.path,
         media_type=media_type,
+        file_size=saved.size,
+        checksum=saved.sha256,
     )
     db.add(media)
     await db.commit()
@@ -212,8 +202,7 @@ async def delete_media(
     if not media:
         raise HTTPException(status_code=404, detail="Media not found")
 
-    if os.path.exists(media.file_path):
-        os.remove(media.file_path)
+    release_file(media.file_path)
 
     await db.delete(media)
     await db.commit()
@@ -241,28 +230,14 @@ async def upload_transcript(
     if not (file.filename or "").lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    # Delete old transcript if exists
-    if round.transcript_path and os.path.exists(round.transcript_path):
-        os.remove(round.transcript_path)
-
-    # Create upload directory
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    file_name = f"transcript_{uuid.uuid4()}.pdf"
-    file_path = os.path.join(settings.upload_dir, file_name)
-
-    # Save file
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        max_size = settings.max_document_size_mb * 1024 * 1024
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File exceeds maximum size of {settings.max_document_size_mb}MB",
-            )
-        f.write(content)
+    saved = await store_upload(file, ".pdf", settings.max_document_size_mb)
+
+    # Drop the old transcript only once the new one is in place
+    if round.transcript_path != saved.path:
+        release_file(round.transcript_path)
 
     # Update round
-    round.transcript_path = file_path
+    round.transcript_path = saved.path
     await db.commit()
     await record_streak_activity(user=user, db=db)
 
@@ -293,8 +268,7 @@ async def delete_transcript(
     if not round:
         raise HTTPException(status_code=404, detail="Round not found")
 
-    if round.transcript_path and os.path.exists(round.transcript_path):
-        os.remove(round.transcript_path)
+    release_file(round.transcript_path)
 
     round.transcript_path = None
     round.transcript_summary = None
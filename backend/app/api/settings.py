@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_current_user_flexible
-from app.core.security import generate_api_token
+from app.core.security import generate_api_token, hash_api_token
 from app.models import ApplicationStatus, RoundType, User
 from app.schemas.settings import (
     APIKeyResponse,
@@ -18,22 +18,18 @@ from app.schemas.settings import (
 router = APIRouter(prefix="/api", tags=["settings"])
 
 
-def _mask_api_token(token: str | None) -> str | None:
-    """Mask API token, showing first 4 and last 4 characters.
+def _mask_api_token(prefix: str | None) -> str | None:
+    """Mask an API token for display, showing only its stored prefix.
 
     Args:
-        token: The API token to mask.
+        prefix: The lookup prefix stored for the token.
 
     Returns:
-        Masked token in format "abcd...wxyz" or None if no token provided.
+        Masked token in format "abcd1234..." or None if no token is set.
     """
-    if not token:
+    if not prefix:
         return None
-    if len(token) <= 8:
-        # For short tokens, show first half and last half with ellipsis
-        half = len(token) // 2
-        return f"{token[:half]}...{token[-half:]}" if half > 0 else "****"
-    return f"{token[:4]}...{token[-4:]}"
+    return f"{prefix}..."
 
 
 @router.get("/settings/api-key", response_model=APIKeyResponse)
@@ -42,16 +38,13 @@ async def get_api_key(
 ) -> APIKeyResponse:
     """Get the current user's API key status.
 
-    Returns whether the user has an API key configured, the masked version
-    for display, and the full key for clipboard copying.
+    Returns whether the user has an API key configured and the masked
+    version for display. Only a hash of the key is stored, so the full key
+    is available from the regenerate endpoint alone.
     """
-    has_api_key = bool(user.api_token)
-    api_key_masked = _mask_api_token(user.api_token)
-
     return APIKeyResponse(
-        has_api_key=has_api_key,
-        api_key_masked=api_key_masked,
-        api_key_full=user.api_token,
+        has_api_key=bool(user.api_token_hash),
+        api_key_masked=_mask_api_token(user.api_token_prefix),
     )
 
 
@@ -62,17 +55,17 @@ async def regenerate_api_key(
 ) -> APIKeyResponse:
     """Regenerate the current user's API key.
 
-    Generates a new API token for the user and saves it to the database.
+    Generates a new API token for the user and stores its prefix and hash.
     Returns the FULL token (only time it's shown) and the masked version.
     """
     new_token = generate_api_token()
-    user.api_token = new_token
+    user.api_token_prefix, user.api_token_hash = hash_api_token(new_token)
     await db.commit()
     await db.refresh(user)
 
     return APIKeyResponse(
         has_api_key=True,
-        api_key_masked=_mask_api_token(new_token),
+        api_key_masked=_mask_api_token(user.api_token_prefix),
         api_key_full=new_token,  # Return full key - only shown once!
     )
 
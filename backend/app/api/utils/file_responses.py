@@ -0,0 +1,138 @@
+import os
+from datetime import UTC, datetime
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import quote
+
+import aiofiles.os
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+from app.core.config import get_settings
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in tags
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate If-None-Match, or failing that If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP dates have one-second resolution
+    return int(mtime) <= since.timestamp()
+
+
+def _offload_response(
+    file_path: str, media_type: str, headers: dict[str, str]
+) -> Response | None:
+    """Hand the transfer of a file to the front proxy, if configured.
+
+    Only files under upload_dir are offloaded, since that is the only
+    directory the proxy is set up to serve. The proxy takes care of range
+    requests for the file it sends.
+
+    Returns:
+        An empty response carrying the redirect header, or None to stream
+        the file from Python.
+    """
+    settings = get_settings()
+    if settings.file_delivery == "direct":
+        return None
+
+    upload_dir = os.path.realpath(settings.upload_dir)
+    real_path = os.path.realpath(file_path)
+    if os.path.commonpath([upload_dir, real_path]) != upload_dir:
+        return None
+
+    if settings.file_delivery == "x-accel-redirect":
+        relative = os.path.relpath(real_path, upload_dir).replace(os.sep, "/")
+        prefix = settings.file_delivery_internal_prefix.rstrip("/")
+        redirect = {"X-Accel-Redirect": f"{prefix}/{quote(relative)}"}
+    else:
+        redirect = {"X-Sendfile": real_path}
+    return Response(media_type=media_type, headers={**headers, **redirect})
+
+
+def token_max_age(payload: dict) -> int:
+    """Seconds until a signed-URL token expires, for Cache-Control."""
+    expires_at = datetime.fromtimestamp(payload["exp"], UTC)
+    return max(0, int((expires_at - datetime.now(UTC)).total_seconds()))
+
+
+async def file_response(
+    request: Request,
+    file_path: str,
+    media_type: str,
+    headers: dict[str, str],
+    *,
+    etag: str | None = None,
+    max_age: int | None = None,
+) -> Response:
+    """Serve a stored file with validators, conditional and range support.
+
+    Sends ``ETag`` and ``Last-Modified`` and answers a matching
+    ``If-None-Match`` (or, without one, ``If-Modified-Since``) with 304.
+    Everything else goes to FileResponse, which handles ``Range`` and
+    ``If-Range`` with 206/416 responses, so seeking in a recording only
+    transfers the requested bytes. With ``file_delivery`` set to a proxy
+    mode, the bytes are sent by the proxy instead and the worker is free
+    as soon as the checks above are done.
+
+    Args:
+        request: The incoming request, for its conditional headers.
+        file_path: Path of the file to send.
+        media_type: Content-Type of the file.
+        headers: Extra response headers, e.g. Content-Disposition.
+        etag: Strong validator for the contents, such as a checksum. When
+            None one is derived from the file's size and modification time.
+        max_age: How long the response may be reused without revalidation,
+            for URLs that stop working after a known time (signed URLs).
+            When None, clients must revalidate on every use.
+
+    Returns:
+        A 304 Response, a proxy redirect Response or a FileResponse.
+    """
+    stat_result = await aiofiles.os.stat(file_path)
+    if etag is None:
+        etag = f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+    validators = {
+        "ETag": f'"{etag}"',
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        # Files belong to one user; never store them in shared caches
+        "Cache-Control": (
+            f"private, max-age={max_age}"
+            if max_age is not None
+            else "private, no-cache"
+        ),
+    }
+
+    if request.method in ("GET", "HEAD") and _not_modified(
+        request, validators["ETag"], stat_result.st_mtime
+    ):
+        return Response(status_code=304, headers=validators)
+
+    offloaded = _offload_response(file_path, media_type, {**headers, **validators})
+    if offloaded is not None:
+        return offloaded
+
+    return FileResponse(
+        file_path,
+        media_type=media_type,
+        headers={**headers, **validators},
+        stat_result=stat_result,
+    )
@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile, status
+
+from app.services.blob_store import incoming_path, place_blob
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+@dataclass
+class SavedUpload:
+    """A file written by save_upload."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+async def save_upload(
+    file: UploadFile, file_path: str, max_size_mb: int
+) -> SavedUpload:
+    """Stream an uploaded file to disk in fixed-size chunks.
+
+    The file is written to a temporary file next to file_path and renamed
+    into place only once it is complete, so readers never see a partial
+    file and an existing file at file_path is replaced atomically. The size
+    limit is enforced chunk by chunk and the SHA-256 digest is computed as
+    the data is written, so the upload is never held in memory as a whole.
+
+    Args:
+        file: The uploaded file.
+        file_path: Final destination path.
+        max_size_mb: Maximum accepted size in megabytes.
+
+    Returns:
+        The stored path, size in bytes and hex SHA-256 digest.
+
+    Raises:
+        HTTPException: 413 if the file exceeds max_size_mb. Nothing is left
+            on disk in that case.
+    """
+    max_size = max_size_mb * 1024 * 1024
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds maximum size of {max_size_mb}MB",
+    )
+    # The multipart parser already knows the size; fail before copying
+    if file.size is not None and file.size > max_size:
+        raise too_large
+
+    directory = os.path.dirname(file_path) or "."
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    # Same directory as the target so the final rename stays on one device
+    temp_path = os.path.join(directory, f".upload-{uuid.uuid4().hex}.part")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "xb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise too_large
+                digest.update(chunk)
+                await f.write(chunk)
+        await aiofiles.os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            await aiofiles.os.remove(temp_path)
+        raise
+
+    return SavedUpload(path=file_path, size=size, sha256=digest.hexdigest())
+
+
+async def store_upload(file: UploadFile, ext: str, max_size_mb: int) -> SavedUpload:
+    """Stream an uploaded file into the content-addressed file store.
+
+    The file is received as in save_upload and then moved to, or
+    deduplicated against, its path in the store (see
+    ``app.services.blob_store``). Assigning the returned path to a model's
+    path column takes a reference to the stored file.
+
+    Args:
+        file: The uploaded file.
+        ext: Normalized file extension, including the dot.
+        max_size_mb: Maximum accepted size in megabytes.
+
+    Returns:
+        The stored path, size in bytes and hex SHA-256 digest.
+
+    Raises:
+        HTTPException: 413 if the file exceeds max_size_mb.
+    """
+    saved = await save_upload(file, incoming_path(), max_size_mb)
+    saved.path = await asyncio.to_thread(place_blob, saved.path, saved.sha256, ext)
+    return saved
@@ -6,6 +6,14 @@ from pathlib import Path
 
 import aiofiles
 
+from app.models.file_blob import blob_key
+
+
+def _archive_name(source: Path, name: str) -> str:
+    """ZIP entry name for a file; stored blobs get one shared entry."""
+    key = blob_key(str(source))
+    return f"files/blobs/{key}" if key else name
+
 
 def is_path_safe(base_path: str, file_path: str) -> bool:
     """Validate a file path is within the base directory to prevent path traversal."""
@@ -121,7 +129,8 @@ async def create_zip_export(
             # Add data.json
             zipf.writestr("data.json", json_data)
 
-            # Collect all file paths from applications and rounds
+            # Collect all file paths from applications and rounds. A stored
+            # blob shared by several of them is archived once.
             file_paths = set()
 
             for app in data.get("applications", []):
@@ -132,7 +141,10 @@ async def create_zip_export(
                         file_paths.add(
                             (
                                 cv_path,
-                                f"files/applications/cv_{app['id']}{cv_path.suffix}",
+                                _archive_name(
+                                    cv_path,
+                                    f"files/applications/cv_{app['id']}{cv_path.suffix}",
+                                ),
                             )
                         )
 
@@ -147,7 +159,10 @@ async def create_zip_export(
                                 file_paths.add(
                                     (
                                         media_path,
-                                        f"files/rounds/{round_data['id']}_{media['type']}{media_path.suffix}",
+                                        _archive_name(
+                                            media_path,
+                                            f"files/rounds/{round_data['id']}_{media['type']}{media_path.suffix}",
+                                        ),
                                     )
                                 )
 
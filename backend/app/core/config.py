@@ -1,5 +1,6 @@
 import logging
 import os
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
@@ -17,8 +18,40 @@ class Settings(BaseSettings):
     admin_email: str | None = None
     max_document_size_mb: int = 10
     max_media_size_mb: int = 500
+    media_upload_expiry_hours: int = 24
+    # Unreferenced stored files are kept this long before being deleted
+    blob_gc_grace_hours: int = 1
+    # "direct" streams files from Python; "x-accel-redirect" (nginx) and
+    # "x-sendfile" (Apache, lighttpd) hand the transfer to a front proxy
+    file_delivery: Literal["direct", "x-accel-redirect", "x-sendfile"] = "direct"
+    # nginx internal location that maps onto upload_dir
+    file_delivery_internal_prefix: str = "/_protected/uploads/"
     cors_origins: str = "http://localhost:5173,http://localhost:5174"
     app_url: str = "http://localhost:5577"
+    extraction_max_concurrency: int = 4
+    job_lead_workers: int = 4
+    job_lead_queue_size: int = 100
+    job_lead_batch_concurrency: int = 8
+    extraction_cache_enabled: bool = True
+    extraction_cache_ttl_hours: int = 168
+    extraction_cache_max_entries: int = 5000
+    http_max_connections: int = 50
+    http_max_connections_per_host: int = 6
+    http_max_response_mb: int = 5
+    http_revalidation_cache_size: int = 256
+    # Total size of the page bodies kept for revalidation
+    http_revalidation_cache_mb: int = 32
+    http_enable_http2: bool = True
+    html_preprocess_workers: int = 2
+    html_preprocess_timeout_seconds: float = 10.0
+    extraction_token_budget: int = 6000
+    analytics_cache_enabled: bool = True
+    analytics_cache_max_entries: int = 2048
+    analytics_cache_ttl_seconds: int = 3600
+    analytics_cache_redis_url: str | None = None
+    user_cache_enabled: bool = True
+    user_cache_max_entries: int = 1024
+    user_cache_ttl_seconds: int = 30
 
     def model_post_init(self, __context: object) -> None:
         if self.secret_key == "change-me-in-production":
@@ -6,12 +6,48 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decode_token
+from app.core.security import decode_token, hash_api_token, verify_api_token
 from app.models import User
+from app.services.user_cache import user_cache
 
 security = HTTPBearer()
 
 
+async def _user_by_id(db: AsyncSession, user_id: str) -> User | None:
+    """Load a user by id, from the user cache when possible."""
+    user = await user_cache.get_by_id(db, user_id)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalars().first()
+        if user is not None:
+            user_cache.set(user)
+    return user
+
+
+async def _user_by_api_token(db: AsyncSession, api_token: str) -> User | None:
+    """Load the owner of an API token, from the user cache when possible.
+
+    The indexed prefix selects the candidate rows and the digest is then
+    checked in constant time, so the lookup never scans users and never
+    compares the secret part of the token with an early-exit string match.
+    """
+    user = await user_cache.get_by_token(db, api_token)
+    if user is None:
+        prefix, _ = hash_api_token(api_token)
+        result = await db.execute(select(User).where(User.api_token_prefix == prefix))
+        user = next(
+            (
+                candidate
+                for candidate in result.scalars()
+                if verify_api_token(api_token, candidate.api_token_hash)
+            ),
+            None,
+        )
+        if user is not None:
+            user_cache.set(user, token=api_token)
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -33,8 +69,7 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await _user_by_id(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -76,8 +111,7 @@ async def get_current_user_optional(
     user_id = payload.get("sub")
     if not user_id:
         return None
-    result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalars().first()
+    return await _user_by_id(db, user_id)
 
 
 async def get_current_user_by_api_token(
@@ -117,8 +151,7 @@ async def get_current_user_by_api_token(
         )
 
     # Look up user by API token
-    result = await db.execute(select(User).where(User.api_token == api_token))
-    user = result.scalars().first()
+    user = await _user_by_api_token(db, api_token)
 
     if not user:
         raise HTTPException(
@@ -171,8 +204,7 @@ async def get_current_user_flexible(
         if payload and payload.get("type") == "access":
             user_id = payload.get("sub")
             if user_id:
-                result = await db.execute(select(User).where(User.id == user_id))
-                user = result.scalars().first()
+                user = await _user_by_id(db, user_id)
                 if user:
                     if not user.is_active:
                         raise HTTPException(
@@ -189,8 +221,7 @@ async def get_current_user_flexible(
         api_token = authorization[7:]
 
     if api_token:
-        result = await db.execute(select(User).where(User.api_token == api_token))
-        user = result.scalars().first()
+        user = await _user_by_api_token(db, api_token)
         if user:
             if not user.is_active:
                 raise HTTPException(
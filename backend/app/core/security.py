@@ -180,3 +180,42 @@ def generate_api_token() -> str:
         A 32-character hexadecimal string (16 random bytes).
     """
     return secrets.token_hex(16)
+
+
+# Leading characters of an API token stored in clear as its lookup key
+API_TOKEN_PREFIX_LENGTH = 8
+
+
+def hash_api_token(token: str) -> tuple[str, str]:
+    """Derive the stored lookup prefix and digest of an API token.
+
+    Only these two values are persisted; the token itself is shown to the
+    user once and never stored. API tokens carry 128 random bits, so an
+    unsalted SHA-256 digest is enough to make a leaked table useless and
+    keeps verification cheap for high-volume extension requests.
+
+    Args:
+        token: The full API token.
+
+    Returns:
+        A (prefix, hex digest) tuple. The prefix is indexed and narrows the
+        lookup to one row in practice; the digest is then compared in
+        constant time by verify_api_token.
+    """
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    return token[:API_TOKEN_PREFIX_LENGTH], digest
+
+
+def verify_api_token(token: str, token_hash: str | None) -> bool:
+    """Check an API token against a stored digest in constant time.
+
+    Args:
+        token: The API token presented by the client.
+        token_hash: The digest stored for a candidate user, if any.
+
+    Returns:
+        True if the token hashes to token_hash.
+    """
+    if not token_hash:
+        return False
+    return secrets.compare_digest(hash_api_token(token)[1], token_hash)
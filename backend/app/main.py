@@ -22,7 +22,9 @@ from app.api.export import router as export_router
 from app.api.files import router as files_router
 from app.api.import_router import router as import_router
 from app.api.insights import router as insights_router
+from app.api.job_leads import fail_interrupted_job_leads, job_lead_queue
 from app.api.job_leads import router as job_leads_router
+from app.api.media_uploads import router as media_uploads_router
 from app.api.profile import router as profile_router
 from app.api.rounds import router as rounds_router
 from app.api.settings import router as settings_router
@@ -34,6 +36,11 @@ from app.core.database import async_session_maker
 from app.core.logging_config import setup_logging
 from app.core.rate_limit import limiter
 from app.core.seed import seed_defaults
+from app.services.analytics_cache import analytics_cache
+from app.services.blob_store import collect_garbage
+from app.services.extraction import shutdown_preprocess_pool
+from app.services.http_client import http_client
+from app.services.resumable_uploads import sweep_expired_uploads
 
 # Initialize structured logging
 setup_logging()
@@ -45,7 +52,15 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     async with async_session_maker() as db:
         await seed_defaults(db)
+        await fail_interrupted_job_leads(db)
+        await sweep_expired_uploads(db)
+        await collect_garbage(db)
+    http_client.start()
     yield
+    await job_lead_queue.stop()
+    await http_client.close()
+    await analytics_cache.close()
+    shutdown_preprocess_pool()
 
 
 app = FastAPI(title="Tarnished API", version="0.1.0", lifespan=lifespan)
@@ -90,7 +105,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition", "Content-Type", "Content-Length"],
+    expose_headers=[
+        "Content-Disposition",
+        "Content-Type",
+        "Content-Length",
+        # Media streaming (app.api.utils.file_responses)
+        "Accept-Ranges",
+        "Content-Range",
+        "ETag",
+        "Last-Modified",
+        # Resumable media uploads (app.api.media_uploads)
+        "Location",
+        "Tus-Resumable",
+        "Upload-Offset",
+        "Upload-Length",
+        "Upload-Expires",
+    ],
 )
 
 # Add TrustedHost middleware - auto-include APP_URL hostname
@@ -148,6 +178,7 @@ app.include_router(applications_router)
 app.include_router(application_history_router)
 app.include_router(profile_router)
 app.include_router(rounds_router)
+app.include_router(media_uploads_router)
 app.include_router(settings_router)
 app.include_router(analytics_router)
 app.include_router(admin_router)
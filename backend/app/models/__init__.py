@@ -1,8 +1,14 @@
+from app.models import data_version  # noqa: F401  (registers the flush listener)
 from app.models.application import Application, ApplicationStatusHistory
 from app.models.audit_log import AuditLog
+from app.models.daily_stats import DailyApplicationStats
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.models.file_blob import FileBlob
 from app.models.job_lead import JobLead
+from app.models.media_upload import MediaUpload
 from app.models.round import MediaType, Round, RoundMedia
 from app.models.round_type import RoundType
+from app.models.search_index import SearchDocument
 from app.models.status import ApplicationStatus
 from app.models.system_settings import SystemSettings
 from app.models.user import User
@@ -21,4 +27,9 @@ __all__ = [
     "JobLead",
     "UserProfile",
     "SystemSettings",
+    "ExtractionCacheEntry",
+    "DailyApplicationStats",
+    "SearchDocument",
+    "MediaUpload",
+    "FileBlob",
 ]
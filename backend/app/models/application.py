@@ -1,7 +1,16 @@
 import uuid
 from datetime import UTC, date, datetime
 
-from sqlalchemy import JSON, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -11,6 +20,20 @@ from app.services.export_registry import exportable
 @exportable(order=5)
 class ApplicationStatusHistory(Base):
     __tablename__ = "application_status_history"
+    __table_args__ = (
+        # "Ever reached status X" lookups (app.services.funnel)
+        Index(
+            "ix_application_status_history_to_status_application",
+            "to_status_id",
+            "application_id",
+        ),
+        # An application's history in order
+        Index(
+            "ix_application_status_history_application_changed",
+            "application_id",
+            "changed_at",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -43,6 +66,18 @@ class ApplicationStatusHistory(Base):
 @exportable(order=4)
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # List ordering and keyset pagination (app.api.applications)
+        Index(
+            "ix_applications_user_applied",
+            "user_id",
+            "applied_at",
+            "created_at",
+            "id",
+        ),
+        # Extension's exact-URL lookup
+        Index("ix_applications_user_job_url", "user_id", "job_url"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -55,7 +90,7 @@ class Application(Base):
     job_description: Mapped[str | None] = mapped_column(Text, nullable=True)
     job_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     status_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("application_statuses.id"), nullable=False
+        String(36), ForeignKey("application_statuses.id"), nullable=False, index=True
     )
     cv_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     cover_letter_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -0,0 +1,181 @@
+"""Per-user daily application rollup.
+
+One row per (user, day, status) holding:
+
+- ``applications``: applications applied on that day whose *current*
+  status is ``status_id``.
+- ``transitions``: status history entries into ``status_id`` recorded on
+  that day.
+
+Rows are kept up to date by mapper events on Application and
+ApplicationStatusHistory, so every ORM write path (API, import, cascading
+deletes) adjusts the counts in the same flush as the change itself. Bulk
+``UPDATE``/``DELETE`` statements bypass these events; use
+``app.services.daily_rollup.rebuild_daily_stats`` to repair after those.
+"""
+
+from datetime import UTC, date, datetime
+
+from sqlalchemy import Connection, Date, ForeignKey, Integer, String, event, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.application import Application, ApplicationStatusHistory
+
+
+class DailyApplicationStats(Base):
+    """Application and transition counts for one user, day and status."""
+
+    __tablename__ = "daily_application_stats"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("application_statuses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    applications: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    transitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+_table = DailyApplicationStats.__table__
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+
+def apply_daily_delta(
+    connection: Connection,
+    user_id: str,
+    day: date,
+    status_id: str,
+    applications: int = 0,
+    transitions: int = 0,
+) -> None:
+    """Add deltas to one rollup row, creating it if needed.
+
+    Uses a native upsert on SQLite and PostgreSQL so concurrent writers
+    cannot lose increments; other dialects fall back to update-then-insert.
+
+    Args:
+        connection: Connection of the flush or transaction to write in.
+        user_id: Owner of the counted rows.
+        day: Applied date (applications) or change date (transitions).
+        status_id: Status the delta applies to.
+        applications: Change to the application count.
+        transitions: Change to the transition count.
+    """
+    if not applications and not transitions:
+        return
+
+    key = {"user_id": user_id, "day": day, "status_id": status_id}
+    insert = _INSERTS.get(connection.dialect.name)
+    if insert is not None:
+        stmt = insert(_table).values(
+            **key, applications=applications, transitions=transitions
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key),
+            set_={
+                "applications": _table.c.applications + stmt.excluded.applications,
+                "transitions": _table.c.transitions + stmt.excluded.transitions,
+            },
+        )
+        connection.execute(stmt)
+        return
+
+    result = connection.execute(
+        _table.update()
+        .where(
+            _table.c.user_id == user_id,
+            _table.c.day == day,
+            _table.c.status_id == status_id,
+        )
+        .values(
+            applications=_table.c.applications + applications,
+            transitions=_table.c.transitions + transitions,
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            _table.insert().values(
+                **key, applications=applications, transitions=transitions
+            )
+        )
+
+
+def transition_day(changed_at: datetime | None) -> date:
+    """Rollup day of a history entry (UTC calendar date)."""
+    if changed_at is None:
+        return datetime.now(UTC).date()
+    if changed_at.tzinfo is not None:
+        changed_at = changed_at.astimezone(UTC)
+    return changed_at.date()
+
+
+@event.listens_for(Application, "after_insert")
+def _application_inserted(mapper, connection, target: Application) -> None:
+    apply_daily_delta(
+        connection, target.user_id, target.applied_at, target.status_id, 1
+    )
+
+
+@event.listens_for(Application, "after_update")
+def _application_updated(mapper, connection, target: Application) -> None:
+    state = sa_inspect(target)
+    applied = state.attrs.applied_at.history
+    status = state.attrs.status_id.history
+    if not applied.has_changes() and not status.has_changes():
+        return
+
+    old_applied = applied.deleted[0] if applied.deleted else target.applied_at
+    old_status = status.deleted[0] if status.deleted else target.status_id
+    if (old_applied, old_status) == (target.applied_at, target.status_id):
+        return
+
+    apply_daily_delta(connection, target.user_id, old_applied, old_status, -1)
+    apply_daily_delta(
+        connection, target.user_id, target.applied_at, target.status_id, 1
+    )
+
+
+@event.listens_for(Application, "before_delete")
+def _application_deleted(mapper, connection, target: Application) -> None:
+    apply_daily_delta(
+        connection, target.user_id, target.applied_at, target.status_id, -1
+    )
+
+
+def _history_owner(connection: Connection, target: ApplicationStatusHistory) -> str:
+    application = target.__dict__.get("application")
+    if application is not None:
+        return application.user_id
+    return connection.scalar(
+        select(Application.user_id).where(Application.id == target.application_id)
+    )
+
+
+@event.listens_for(ApplicationStatusHistory, "after_insert")
+def _history_inserted(mapper, connection, target: ApplicationStatusHistory) -> None:
+    apply_daily_delta(
+        connection,
+        _history_owner(connection, target),
+        transition_day(target.changed_at),
+        target.to_status_id,
+        transitions=1,
+    )
+
+
+@event.listens_for(ApplicationStatusHistory, "before_delete")
+def _history_deleted(mapper, connection, target: ApplicationStatusHistory) -> None:
+    apply_daily_delta(
+        connection,
+        _history_owner(connection, target),
+        transition_day(target.changed_at),
+        target.to_status_id,
+        transitions=-1,
+    )
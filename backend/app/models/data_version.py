@@ -0,0 +1,71 @@
+"""Per-user data version bumping.
+
+``User.data_version`` is incremented once per flush for every user whose
+applications, status history, rounds, statuses or round types the flush
+touches. Statuses and round types without a user are shared defaults
+that every user's data refers to, so changing one bumps every user.
+Readers that derive data from those tables (the analytics response cache)
+key on the version, so any write makes previously cached results
+unreachable without tracking which entries it affects.
+
+The bump runs in the flush's own transaction, so it commits or rolls back
+together with the change.
+"""
+
+from itertools import chain
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationStatusHistory
+from app.models.round import Round
+from app.models.round_type import RoundType
+from app.models.status import ApplicationStatus
+from app.models.user import User
+
+# Models with a user_id column
+_USER_OWNED = (Application, ApplicationStatus, RoundType)
+# Models owned through their application
+_APPLICATION_OWNED = (ApplicationStatusHistory, Round)
+
+
+def _touched_user_ids(session: Session) -> set[str] | None:
+    """Users whose data the pending flush changes; None means every user."""
+    user_ids: set[str] = set()
+    application_ids: set[str] = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _USER_OWNED):
+            if obj.user_id is None:
+                return None
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, _APPLICATION_OWNED):
+            application = obj.__dict__.get("application")
+            if application is not None:
+                user_ids.add(application.user_id)
+            elif obj.application_id is not None:
+                application_ids.add(obj.application_id)
+
+    if application_ids:
+        result = session.execute(
+            select(Application.user_id).where(Application.id.in_(application_ids))
+        )
+        user_ids.update(result.scalars())
+    return user_ids
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_data_versions(session: Session, flush_context, instances) -> None:
+    with session.no_autoflush:
+        user_ids = _touched_user_ids(session)
+        if user_ids is None:
+            stmt = update(User)
+        elif user_ids:
+            stmt = update(User).where(User.id.in_(user_ids))
+        else:
+            return
+        session.execute(
+            stmt.values(data_version=User.data_version + 1).execution_options(
+                synchronize_session=False
+            )
+        )
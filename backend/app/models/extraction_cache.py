@@ -0,0 +1,29 @@
+"""Extraction result cache model.
+
+Stores LLM extraction results keyed by a hash of the normalized posting
+content and the model name, so identical postings are only extracted once.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ExtractionCacheEntry(Base):
+    """A cached extraction result for one (content, model) pair."""
+
+    __tablename__ = "extraction_cache"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
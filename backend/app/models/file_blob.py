@@ -0,0 +1,162 @@
+"""Content-addressed storage of uploaded files.
+
+Uploaded CVs, cover letters, transcripts and recordings are stored once per
+distinct content, under a name derived from their SHA-256 digest::
+
+    <upload_dir>/blobs/ab/cd/abcd...ef.pdf
+
+The extension is part of the key so stored files keep a meaningful media
+type; the two directory levels keep any one directory small. The path
+columns (``Application.cv_path``, ``Application.cover_letter_path``,
+``Round.transcript_path`` and ``RoundMedia.file_path``) hold the blob's
+path, so two applications with the same CV point at the same file.
+
+``ref_count`` is kept up to date by mapper events on those models, so every
+ORM write path (API, import, cascading deletes) adjusts it in the same
+flush as the change itself. Blobs whose count has dropped to zero are
+removed by ``app.services.blob_store.collect_garbage``. Bulk
+``UPDATE``/``DELETE`` statements bypass these events; use
+``app.services.blob_store.rebuild_blob_refs`` to repair after those. Paths
+outside the blob store (files uploaded before it existed) are not counted.
+"""
+
+import os
+import re
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, Connection, DateTime, Integer, String, event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.application import Application
+from app.models.round import Round, RoundMedia
+
+BLOB_DIR = "blobs"
+
+_KEY_RE = re.compile(r"[0-9a-f]{64}(\.[a-z0-9]{1,16})?")
+
+
+class FileBlob(Base):
+    """One stored file and the number of rows referencing it."""
+
+    __tablename__ = "file_blobs"
+
+    # Hex SHA-256 of the contents plus the normalized file extension
+    key: Mapped[str] = mapped_column(String(81), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Last time a reference was added or dropped; garbage collection waits
+    # for a grace period after this
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+_table = FileBlob.__table__
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+# Columns holding paths that may point into the blob store
+BLOB_COLUMNS: dict[type, tuple[str, ...]] = {
+    Application: ("cv_path", "cover_letter_path"),
+    Round: ("transcript_path",),
+    RoundMedia: ("file_path",),
+}
+
+
+def blob_key(path: str | None) -> str | None:
+    """Key of the blob a stored path points at, or None for other paths."""
+    if not path:
+        return None
+    head, name = os.path.split(path)
+    if not _KEY_RE.fullmatch(name):
+        return None
+    head, second = os.path.split(head)
+    head, first = os.path.split(head)
+    if (first, second) != (name[:2], name[2:4]) or os.path.basename(head) != BLOB_DIR:
+        return None
+    return name
+
+
+def adjust_blob_refs(connection: Connection, path: str | None, delta: int) -> None:
+    """Add a delta to the reference count of the blob at path.
+
+    Does nothing for paths outside the blob store. A missing row is created,
+    which happens for files placed by an import or a repair.
+
+    Args:
+        connection: Connection of the flush or transaction to write in.
+        path: Stored path from one of the BLOB_COLUMNS.
+        delta: Change to the reference count.
+    """
+    key = blob_key(path)
+    if key is None or not delta:
+        return
+
+    now = datetime.now(UTC)
+    insert = _INSERTS.get(connection.dialect.name)
+    if insert is not None:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        stmt = insert(_table).values(
+            key=key, size=size, ref_count=max(delta, 0), updated_at=now
+        )
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["key"],
+                set_={"ref_count": _table.c.ref_count + delta, "updated_at": now},
+            )
+        )
+        return
+
+    result = connection.execute(
+        _table.update()
+        .where(_table.c.key == key)
+        .values(ref_count=_table.c.ref_count + delta, updated_at=now)
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            _table.insert().values(
+                key=key, size=0, ref_count=max(delta, 0), updated_at=now
+            )
+        )
+
+
+def _stored_value(target: object, column: str) -> str | None:
+    """Value of a column as last written to the database."""
+    history = sa_inspect(target).attrs[column].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, column)
+
+
+def _inserted(mapper, connection, target) -> None:
+    for column in BLOB_COLUMNS[mapper.class_]:
+        adjust_blob_refs(connection, getattr(target, column), 1)
+
+
+def _updated(mapper, connection, target) -> None:
+    attrs = sa_inspect(target).attrs
+    for column in BLOB_COLUMNS[mapper.class_]:
+        history = attrs[column].history
+        if not history.has_changes():
+            continue
+        for old in history.deleted:
+            adjust_blob_refs(connection, old, -1)
+        for new in history.added:
+            adjust_blob_refs(connection, new, 1)
+
+
+def _deleted(mapper, connection, target) -> None:
+    for column in BLOB_COLUMNS[mapper.class_]:
+        adjust_blob_refs(connection, _stored_value(target, column), -1)
+
+
+for _model in BLOB_COLUMNS:
+    event.listen(_model, "after_insert", _inserted)
+    event.listen(_model, "after_update", _updated)
+    event.listen(_model, "before_delete", _deleted)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, date, datetime
 
-from sqlalchemy import JSON, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -11,6 +11,12 @@ from app.services.export_registry import exportable
 @exportable(order=8)
 class JobLead(Base):
     __tablename__ = "job_leads"
+    __table_args__ = (
+        # List ordering and keyset pagination (app.api.job_leads)
+        Index("ix_job_leads_user_scraped", "user_id", "scraped_at", "id"),
+        # Extension's exact-URL lookup
+        Index("ix_job_leads_user_url", "user_id", "url"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
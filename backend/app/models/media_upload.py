@@ -0,0 +1,43 @@
+"""In-progress resumable media uploads.
+
+A row exists from the moment a client announces an upload until the last
+byte arrives and the file is attached to a RoundMedia row. The bytes
+received so far live in a partial file derived from the row id (see
+``app.services.resumable_uploads.partial_path``), and ``offset`` records
+how many of them are safely on disk, so a client can resume from there.
+Abandoned uploads are removed once ``expires_at`` passes.
+"""
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class MediaUpload(Base):
+    """A partially received round media file."""
+
+    __tablename__ = "media_uploads"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    round_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("rounds.id", ondelete="CASCADE"), nullable=False
+    )
+    media_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    file_ext: Mapped[str] = mapped_column(String(20), nullable=False)
+    length: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    offset: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -2,7 +2,7 @@ import uuid
 from datetime import UTC, datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -25,7 +25,7 @@ class Round(Base):
         String(36), ForeignKey("applications.id"), nullable=False, index=True
     )
     round_type_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("round_types.id"), nullable=False
+        String(36), ForeignKey("round_types.id"), nullable=False, index=True
     )
     scheduled_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -56,10 +56,15 @@ class RoundMedia(Base):
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     round_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("rounds.id"), nullable=False
+        String(36), ForeignKey("rounds.id"), nullable=False, index=True
     )
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     media_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    # Recorded while the upload is streamed to disk; NULL for older rows
+    file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    checksum: Mapped[str | None] = mapped_column(
+        String(64), nullable=True
+    )  # hex SHA-256 of the file contents
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
@@ -0,0 +1,249 @@
+"""Full-text search documents for applications and job leads.
+
+Each searchable row has one ``search_documents`` row holding its text in
+two weighted parts: ``title`` (company and job title) and ``body``
+(descriptions, skills and recruiter details). The text index on top is
+dialect specific and is created alongside the table:
+
+- SQLite: an external-content FTS5 table, ``search_fts``, kept in step
+  with ``search_documents`` by triggers and ranked with ``bm25``.
+- PostgreSQL: a GIN index over the weighted ``tsvector`` of both parts,
+  ranked with ``ts_rank``.
+
+Documents are written by mapper events on Application and JobLead, so every
+ORM write path updates the index in the same flush as the change itself.
+Bulk ``UPDATE``/``DELETE`` statements bypass these events; use
+``app.services.search.rebuild_search_index`` to repair after those.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import (
+    DDL,
+    Connection,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    delete,
+    event,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.application import Application
+from app.models.job_lead import JobLead
+
+APPLICATION = "application"
+JOB_LEAD = "job_lead"
+
+FTS_TABLE = "search_fts"
+
+# Text search configuration; "simple" does not stem, so it works for job
+# postings in any language
+TS_CONFIG = "simple"
+
+# DDL run after search_documents is created, per dialect
+SEARCH_INDEX_DDL = {
+    "sqlite": [
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+        "title, body, content='search_documents', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, title, body) "
+        "VALUES (new.id, new.title, new.body); END",
+        "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+        "VALUES ('delete', old.id, old.title, old.body); END",
+        "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+        "VALUES ('delete', old.id, old.title, old.body); "
+        f"INSERT INTO {FTS_TABLE}(rowid, title, body) "
+        "VALUES (new.id, new.title, new.body); END",
+    ],
+    "postgresql": [
+        "CREATE INDEX ix_search_documents_document ON search_documents USING gin (("
+        f"setweight(to_tsvector('{TS_CONFIG}'::regconfig, title), 'A') || "
+        f"setweight(to_tsvector('{TS_CONFIG}'::regconfig, body), 'B')))",
+    ],
+}
+
+
+class SearchDocument(Base):
+    """Searchable text of one application or job lead."""
+
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("kind", "doc_id", name="uq_search_documents_kind_doc_id"),
+    )
+
+    # Integer key, so FTS5 can use it as its rowid
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    doc_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    body: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+
+_table = SearchDocument.__table__
+_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+for _dialect, _statements in SEARCH_INDEX_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            _table, "after_create", DDL(_statement).execute_if(dialect=_dialect)
+        )
+
+
+def _join(parts: Iterable[str | None]) -> str:
+    return "\n".join(part for part in parts if part)
+
+
+def application_document(application: Application) -> tuple[str, str]:
+    """Title and body text indexed for an application."""
+    return (
+        _join([application.company, application.job_title]),
+        _join(
+            [
+                application.job_description,
+                application.description,
+                " ".join(application.skills or []),
+                application.recruiter_name,
+                application.recruiter_title,
+            ]
+        ),
+    )
+
+
+def job_lead_document(job_lead: JobLead) -> tuple[str, str]:
+    """Title and body text indexed for a job lead."""
+    return (
+        _join([job_lead.company, job_lead.title]),
+        _join(
+            [
+                job_lead.description,
+                " ".join(job_lead.skills or []),
+                job_lead.recruiter_name,
+                job_lead.recruiter_title,
+            ]
+        ),
+    )
+
+
+def upsert_search_document(
+    connection: Connection,
+    kind: str,
+    doc_id: str,
+    user_id: str,
+    title: str,
+    body: str,
+) -> None:
+    """Write the search document of one row, replacing any previous text.
+
+    Args:
+        connection: Connection of the flush or transaction to write in.
+        kind: APPLICATION or JOB_LEAD.
+        doc_id: Id of the application or job lead.
+        user_id: Owner of the row.
+        title: Heavily weighted text.
+        body: Remaining text.
+    """
+    values = {
+        "kind": kind,
+        "doc_id": doc_id,
+        "user_id": user_id,
+        "title": title,
+        "body": body,
+    }
+    insert = _INSERTS.get(connection.dialect.name)
+    if insert is not None:
+        stmt = insert(_table).values(**values)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["kind", "doc_id"],
+                set_={"title": stmt.excluded.title, "body": stmt.excluded.body},
+            )
+        )
+        return
+
+    delete_search_document(connection, kind, doc_id)
+    connection.execute(_table.insert().values(**values))
+
+
+def delete_search_document(connection: Connection, kind: str, doc_id: str) -> None:
+    """Remove the search document of one row, if any."""
+    connection.execute(
+        delete(_table).where(_table.c.kind == kind, _table.c.doc_id == doc_id)
+    )
+
+
+# Attributes whose changes require reindexing
+_APPLICATION_FIELDS = (
+    "company",
+    "job_title",
+    "job_description",
+    "description",
+    "skills",
+    "recruiter_name",
+    "recruiter_title",
+)
+_JOB_LEAD_FIELDS = (
+    "company",
+    "title",
+    "description",
+    "skills",
+    "recruiter_name",
+    "recruiter_title",
+)
+
+
+def _changed(target: object, fields: Iterable[str]) -> bool:
+    attrs = sa_inspect(target).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Application, "after_insert")
+def _application_inserted(mapper, connection, target: Application) -> None:
+    upsert_search_document(
+        connection,
+        APPLICATION,
+        target.id,
+        target.user_id,
+        *application_document(target),
+    )
+
+
+@event.listens_for(Application, "after_update")
+def _application_updated(mapper, connection, target: Application) -> None:
+    if _changed(target, _APPLICATION_FIELDS):
+        _application_inserted(mapper, connection, target)
+
+
+@event.listens_for(Application, "after_delete")
+def _application_deleted(mapper, connection, target: Application) -> None:
+    delete_search_document(connection, APPLICATION, target.id)
+
+
+@event.listens_for(JobLead, "after_insert")
+def _job_lead_inserted(mapper, connection, target: JobLead) -> None:
+    upsert_search_document(
+        connection, JOB_LEAD, target.id, target.user_id, *job_lead_document(target)
+    )
+
+
+@event.listens_for(JobLead, "after_update")
+def _job_lead_updated(mapper, connection, target: JobLead) -> None:
+    if _changed(target, _JOB_LEAD_FIELDS):
+        _job_lead_inserted(mapper, connection, target)
+
+
+@event.listens_for(JobLead, "after_delete")
+def _job_lead_deleted(mapper, connection, target: JobLead) -> None:
+    delete_search_document(connection, JOB_LEAD, target.id)
@@ -2,7 +2,7 @@ import uuid
 from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, Date, DateTime, String
+from sqlalchemy import JSON, Boolean, Date, DateTime, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -20,9 +20,12 @@ class User(Base):
         String(255), unique=True, index=True, nullable=False
     )
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    api_token: Mapped[str | None] = mapped_column(
-        String(255), nullable=True
-    )  # hashed token for extension auth
+    # Extension auth token, stored as an indexed lookup prefix plus a SHA-256
+    # digest (see app.core.security.hash_api_token)
+    api_token_prefix: Mapped[str | None] = mapped_column(
+        String(16), nullable=True, index=True
+    )
+    api_token_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -38,6 +41,11 @@ class User(Base):
     streak_exhausted_at: Mapped[date | None] = mapped_column(Date, nullable=True)
     city: Mapped[str | None] = mapped_column(String(100))
     country: Mapped[str | None] = mapped_column(String(100))
+    # Bumped on every write to the user's application data (see
+    # app.models.data_version); keys the analytics response cache
+    data_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     applications = relationship(
         "Application", back_populates="user", cascade="all, delete-orphan"
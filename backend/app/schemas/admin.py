@@ -28,11 +28,30 @@ class AdminUserCreate(BaseModel):
     is_active: bool = True
 
 
+class StageTimingStats(BaseModel):
+    count: int
+    avg_ms: float
+    max_ms: float
+
+
 class AdminStatsResponse(BaseModel):
     total_users: int
     active_users: int
     total_applications: int
     applications_this_month: int
+    extraction_cache_entries: int = 0
+    extraction_cache_hits: int = 0
+    extraction_cache_misses: int = 0
+    html_preprocess_documents: int = 0
+    html_preprocess_timeouts: int = 0
+    html_preprocess_stages: dict[str, StageTimingStats] = {}
+    analytics_cache_entries: int = 0
+    analytics_cache_hits: int = 0
+    analytics_cache_misses: int = 0
+    analytics_cache_not_modified: int = 0
+    user_cache_entries: int = 0
+    user_cache_hits: int = 0
+    user_cache_misses: int = 0
 
 
 class AdminStatusUpdate(BaseModel):
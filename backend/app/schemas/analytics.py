@@ -39,6 +39,26 @@ class AnalyticsKPIsResponse(BaseModel):
     active_opportunities: int
 
 
+class StageFunnelStage(BaseModel):
+    status_id: str
+    name: str
+    color: str | None = None
+    reached: int
+    rate: float
+
+
+class StageFunnelResponse(BaseModel):
+    total_applications: int
+    stages: list[StageFunnelStage]
+
+
+class StageFunnelWeek(BaseModel):
+    week: str
+    applications: int
+    reached: int
+    rate: float
+
+
 # Interview Rounds Analytics Schemas
 
 
@@ -82,3 +102,4 @@ class InterviewRoundsResponse(BaseModel):
     outcome_data: list[OutcomeData]
     timeline_data: list[TimelineData]
     candidate_progress: list[CandidateProgress]
+    candidate_total: int = 0
@@ -115,6 +115,7 @@ class ApplicationResponse(ApplicationListItem):
 
 class ApplicationListResponse(BaseModel):
     items: list[ApplicationListItem]
-    total: int
+    total: int | None
     page: int
     per_page: int
+    next_cursor: str | None = None
@@ -155,9 +155,45 @@ class JobLeadListResponse(BaseModel):
     """Paginated list response for job leads."""
 
     items: list[JobLeadListItem]
-    total: int
+    total: int | None
     page: int
     per_page: int
+    next_cursor: str | None = None
+
+
+class JobLeadBatchCreate(BaseModel):
+    """Request schema for capturing many job leads at once.
+
+    Each item is a URL with optional text/html content, exactly as accepted
+    by the single-lead endpoint.
+    """
+
+    items: list[JobLeadCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Job postings to capture (max 100 per request)",
+    )
+
+
+class JobLeadBatchResult(BaseModel):
+    """Outcome for a single URL in a batch capture."""
+
+    url: str
+    result: str = Field(..., pattern="^(created|duplicate|rejected|error)$")
+    job_lead: JobLeadResponse | None = None
+    existing_id: str | None = None
+    # Why a URL was rejected (queue full) or failed; retry rejected URLs
+    detail: str | None = None
+
+
+class JobLeadBatchResponse(BaseModel):
+    """Response for a batch capture, in request order."""
+
+    results: list[JobLeadBatchResult]
+    created: int
+    duplicates: int
+    rejected: int = 0
 
 
 class JobLeadExtractionInput(BaseModel):
@@ -15,6 +15,8 @@ class RoundMediaResponse(BaseModel):
     id: str
     file_path: str
     media_type: str
+    file_size: int | None = None
+    checksum: str | None = None
     uploaded_at: datetime
 
     class Config:
@@ -39,14 +39,14 @@ class APIKeyResponse(BaseModel):
     """Response schema for the user's API key status.
 
     Returns whether the user has an API token set, and if so,
-    a masked version showing only the first and last few characters.
+    a masked version showing only its first few characters.
     When regenerating, the full key is returned once.
     """
 
     has_api_key: bool = Field(description="Whether the user has an API key configured")
     api_key_masked: str | None = Field(
         default=None,
-        description="Masked API key showing first 4 and last 4 characters (e.g., 'abcd...wxyz')",
+        description="Masked API key showing its first 8 characters (e.g., 'abcd1234...')",
     )
     api_key_full: str | None = Field(
         default=None,
@@ -7,7 +7,9 @@ from app.services.extraction import (
     NoJobFoundError,
     extract_job_data,
     extract_with_llm,
+    extract_with_llm_async,
     preprocess_html,
+    preprocess_html_async,
 )
 
 __all__ = [
@@ -17,5 +19,7 @@ __all__ = [
     "NoJobFoundError",
     "extract_job_data",
     "extract_with_llm",
+    "extract_with_llm_async",
     "preprocess_html",
+    "preprocess_html_async",
 ]
@@ -0,0 +1,274 @@
+"""Per-user response cache for analytics and dashboard endpoints.
+
+Users reload the dashboard far more often than they change their data, so
+analytics responses are cached per user, endpoint and query parameters.
+Keys include ``User.data_version``, which is bumped in the same transaction
+as every write to the user's applications, rounds, status history, statuses
+and round types (see ``app.models.data_version``). A write therefore makes
+every older entry unreachable, and no explicit invalidation is needed. Keys
+also include the current date, because windows such as "last 7 days" move
+at midnight.
+
+Entries live in a bounded in-process LRU by default. Setting
+``analytics_cache_redis_url`` shares them between workers when the optional
+``redis`` package is installed.
+
+Each cached response carries an ETag derived from its key, so a client that
+already has the current version gets ``304 Not Modified`` without the
+response being rebuilt or even read from the cache.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "analytics:"
+
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass
+class AnalyticsCacheStats:
+    """Hit/miss counters for the current process."""
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+
+class _MemoryBackend:
+    """Bounded LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+class _RedisBackend:
+    """Shared backend; Redis evicts entries itself via the TTL."""
+
+    def __init__(self, url: str, ttl_seconds: int):
+        import redis.asyncio as redis
+
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis.from_url(url)
+
+    def __len__(self) -> int:
+        # Entry count is not tracked locally for the shared backend
+        return 0
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(KEY_PREFIX + key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        await self._redis.set(KEY_PREFIX + key, body, ex=self.ttl_seconds)
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=KEY_PREFIX + "*"):
+            await self._redis.delete(key)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class AnalyticsCache:
+    """Cache of serialized analytics responses."""
+
+    def __init__(self) -> None:
+        self.stats = AnalyticsCacheStats()
+        self._backend: _MemoryBackend | _RedisBackend | None = None
+
+    @property
+    def backend(self) -> _MemoryBackend | _RedisBackend:
+        if self._backend is None:
+            settings = get_settings()
+            url = settings.analytics_cache_redis_url
+            if url and importlib.util.find_spec("redis") is not None:
+                self._backend = _RedisBackend(url, settings.analytics_cache_ttl_seconds)
+            else:
+                if url:
+                    logger.warning(
+                        "analytics_cache_redis_url is set but the redis package "
+                        "is not installed; using the in-process cache"
+                    )
+                self._backend = _MemoryBackend(
+                    settings.analytics_cache_max_entries,
+                    settings.analytics_cache_ttl_seconds,
+                )
+        return self._backend
+
+    def __len__(self) -> int:
+        return len(self._backend) if self._backend is not None else 0
+
+    async def get(self, key: str) -> bytes | None:
+        """Return a cached body, or None. Backend errors count as a miss."""
+        try:
+            body = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Analytics cache read failed: {e}")
+            body = None
+        if body is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        """Store a body; backend errors are logged and ignored."""
+        try:
+            await self.backend.set(key, body)
+        except Exception as e:
+            logger.warning(f"Analytics cache write failed: {e}")
+
+    async def clear(self) -> None:
+        if self._backend is not None:
+            await self._backend.clear()
+
+    async def close(self) -> None:
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
+
+
+analytics_cache = AnalyticsCache()
+
+
+def cache_key(endpoint: str, user_id: str, version: int, params: dict[str, Any]) -> str:
+    """Hash an endpoint, user, data version, date and parameters into a key."""
+    material = json.dumps(
+        [endpoint, user_id, version, date.today().isoformat(), params],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(
+    endpoint: str,
+    response_model: Any = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Response]]]:
+    """Cache a per-user GET endpoint's JSON response.
+
+    The decorated endpoint must take ``user`` and ``db`` keyword arguments.
+    Every other argument is treated as a query parameter and becomes part
+    of the cache key.
+
+    The wrapper returns a ready-made Response, which FastAPI passes through
+    without applying the route's ``response_model``. Pass the same model
+    here so the result is validated and filtered before it is cached.
+
+    Args:
+        endpoint: Name identifying the endpoint in cache keys.
+        response_model: The route's response_model, if it has one.
+
+    Returns:
+        A decorator for FastAPI endpoint functions.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Response]]:
+        signature = inspect.signature(func)
+        adapter = TypeAdapter(response_model) if response_model is not None else None
+
+        def serialize(result: Any) -> bytes:
+            if adapter is None:
+                return json.dumps(jsonable_encoder(result)).encode()
+            validated = adapter.validate_python(result, from_attributes=True)
+            return adapter.dump_json(validated, by_alias=True)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, request: Request, **kwargs: Any) -> Response:
+            if not get_settings().analytics_cache_enabled:
+                return await func(*args, **kwargs)
+
+            user: User = kwargs["user"]
+            db: AsyncSession = kwargs["db"]
+            params = {k: v for k, v in kwargs.items() if k not in ("user", "db")}
+
+            # Read the version from the database rather than the User
+            # instance, which may predate writes made in this session
+            version = await db.scalar(
+                select(User.data_version).where(User.id == user.id)
+            )
+            key = cache_key(endpoint, user.id, version or 0, params)
+            headers = {"ETag": f'"{key[:32]}"', "Cache-Control": CACHE_CONTROL}
+
+            if _etag_matches(request, headers["ETag"]):
+                analytics_cache.stats.not_modified += 1
+                return Response(status_code=304, headers=headers)
+
+            body = await analytics_cache.get(key)
+            if body is None:
+                result = await func(*args, **kwargs)
+                body = serialize(result)
+                await analytics_cache.set(key, body)
+
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
+
+        request_param = inspect.Parameter(
+            "request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+        )
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[*signature.parameters.values(), request_param]
+        )
+        return wrapper
+
+    return decorator
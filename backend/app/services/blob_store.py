@@ -0,0 +1,305 @@
+"""Content-addressed file store for uploads.
+
+Uploaded files are stored once per distinct content (see
+``app.models.file_blob`` for the layout and reference counting). This module
+writes files into the store, deletes files nobody references any more and
+repairs the reference counts. Garbage is collected on startup and can be
+collected, repaired or backfilled as a command, e.g. from cron::
+
+    python -m app.services.blob_store                   # collect garbage
+    python -m app.services.blob_store --rebuild         # recount references
+    python -m app.services.blob_store --migrate-legacy  # move older uploads in
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import re
+import shutil
+import uuid
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models import FileBlob, RoundMedia
+from app.models.file_blob import BLOB_COLUMNS, BLOB_DIR, blob_key
+from app.services.resumable_uploads import file_sha256
+
+logger = logging.getLogger(__name__)
+
+_EXT_RE = re.compile(r"\.[a-z0-9]{1,16}")
+_INCOMING_DIR = ".incoming"
+
+
+def normalize_ext(ext: str, default: str) -> str:
+    """Lower-case a file extension, falling back to default if unusable."""
+    ext = ext.lower()
+    return ext if _EXT_RE.fullmatch(ext) else default
+
+
+def blob_root() -> str:
+    """Directory holding all stored files."""
+    return os.path.join(get_settings().upload_dir, BLOB_DIR)
+
+
+def blob_path(key: str) -> str:
+    """Path of the stored file with the given key."""
+    return os.path.join(blob_root(), key[:2], key[2:4], key)
+
+
+def incoming_path() -> str:
+    """Fresh path for a file that is still being received."""
+    return os.path.join(blob_root(), _INCOMING_DIR, uuid.uuid4().hex)
+
+
+def place_blob(source: str, sha256: str, ext: str) -> str:
+    """Move a complete file into the store. Blocking; run in a thread.
+
+    If a file with the same contents is already stored, source is deleted
+    and the stored file is reused. Its modification time is refreshed so
+    garbage collection does not remove it before the new reference is
+    committed.
+
+    Args:
+        source: Path of the file, on the same filesystem as upload_dir.
+        sha256: Hex SHA-256 of the file contents.
+        ext: Normalized file extension, including the dot.
+
+    Returns:
+        Path of the stored file.
+    """
+    path = blob_path(f"{sha256}{ext}")
+    if os.path.exists(path):
+        os.remove(source)
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return path
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(source, path)
+    return path
+
+
+def release_file(path: str | None) -> None:
+    """Drop a file that a row no longer points at.
+
+    Stored blobs may be shared with other rows and are left to garbage
+    collection; files from before the store existed are deleted directly.
+    """
+    if path and blob_key(path) is None and os.path.exists(path):
+        os.remove(path)
+
+
+def _remove_if_older(path: str, cutoff: float) -> bool:
+    """Delete a file unless it was modified after cutoff (a Unix time)."""
+    try:
+        if os.path.getmtime(path) >= cutoff:
+            return False
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    if blob_key(path) is not None:
+        # Prune the two shard directories once they are empty
+        shard = os.path.dirname(path)
+        for directory in (shard, os.path.dirname(shard)):
+            with contextlib.suppress(OSError):
+                os.rmdir(directory)
+    return True
+
+
+async def collect_garbage(db: AsyncSession, grace: timedelta | None = None) -> int:
+    """Delete stored files that nothing references.
+
+    A blob is removed once its reference count has been zero for longer
+    than the grace period. Files in the store without a row (left behind
+    by a request that failed before committing) are removed on the same
+    schedule.
+
+    Args:
+        db: Database session. The deletion is committed before returning.
+        grace: How long unreferenced files are kept; defaults to the
+            blob_gc_grace_hours setting.
+
+    Returns:
+        Number of files removed.
+    """
+    if grace is None:
+        grace = timedelta(hours=get_settings().blob_gc_grace_hours)
+    cutoff = datetime.now(UTC) - grace
+
+    result = await db.execute(
+        delete(FileBlob)
+        .where(FileBlob.ref_count <= 0, FileBlob.updated_at < cutoff)
+        .returning(FileBlob.key)
+    )
+    released = list(result.scalars())
+    await db.commit()
+    tracked = set((await db.execute(select(FileBlob.key))).scalars())
+
+    def remove_files() -> int:
+        # Files are only removed if not touched since the cutoff, so a blob
+        # reused by an upload that is still in flight survives
+        removed = sum(
+            _remove_if_older(blob_path(key), cutoff.timestamp()) for key in released
+        )
+        for directory, _, names in os.walk(blob_root()):
+            for name in names:
+                if name in tracked:
+                    continue
+                if blob_key(os.path.join(directory, name)) is None and (
+                    os.path.basename(directory) != _INCOMING_DIR
+                ):
+                    continue
+                removed += _remove_if_older(
+                    os.path.join(directory, name), cutoff.timestamp()
+                )
+        return removed
+
+    removed = await asyncio.to_thread(remove_files)
+    if removed:
+        logger.info(f"Removed {removed} unreferenced stored files")
+    return removed
+
+
+async def _stored_paths(db: AsyncSession) -> list[str]:
+    """Every non-null path in the columns that may point into the store."""
+    paths = []
+    for model, columns in BLOB_COLUMNS.items():
+        for column in columns:
+            attr = getattr(model, column)
+            paths.extend(
+                (await db.execute(select(attr).where(attr.is_not(None)))).scalars()
+            )
+    return paths
+
+
+async def rebuild_blob_refs(db: AsyncSession) -> int:
+    """Recompute reference counts from the rows that point at blobs.
+
+    Args:
+        db: Database session. The rebuild is committed before returning.
+
+    Returns:
+        Number of blobs whose count changed.
+    """
+    counts = Counter(
+        key for key in map(blob_key, await _stored_paths(db)) if key is not None
+    )
+    now = datetime.now(UTC)
+    changed = 0
+
+    for key, ref_count in (
+        await db.execute(select(FileBlob.key, FileBlob.ref_count))
+    ).all():
+        expected = counts.pop(key, 0)
+        if ref_count != expected:
+            await db.execute(
+                update(FileBlob)
+                .where(FileBlob.key == key)
+                .values(ref_count=expected, updated_at=now)
+            )
+            changed += 1
+
+    rows = []
+    for key, ref_count in counts.items():
+        try:
+            size = os.path.getsize(blob_path(key))
+        except OSError:
+            size = 0
+        rows.append(
+            {"key": key, "size": size, "ref_count": ref_count, "updated_at": now}
+        )
+    if rows:
+        await db.execute(insert(FileBlob), rows)
+    await db.commit()
+
+    changed += len(rows)
+    logger.info(f"Rebuilt reference counts, {changed} blobs changed")
+    return changed
+
+
+def _copy_into_store(source: str, sha256: str, ext: str) -> str:
+    """Copy a file into the store, leaving source in place. Blocking."""
+    temp_path = incoming_path()
+    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+    shutil.copyfile(source, temp_path)
+    return place_blob(temp_path, sha256, ext)
+
+
+async def migrate_legacy_files(db: AsyncSession) -> int:
+    """Move files uploaded before the store existed into it.
+
+    Every path column pointing at a file outside the store is repointed at
+    the deduplicated copy; the mapper events take the references. The old
+    files are deleted only after the change is committed.
+
+    Args:
+        db: Database session. The change is committed before returning.
+
+    Returns:
+        Number of files moved into the store.
+    """
+    moved: dict[str, tuple[str, str, int]] = {}
+    for model, columns in BLOB_COLUMNS.items():
+        for column in columns:
+            attr = getattr(model, column)
+            rows = await db.execute(select(model).where(attr.is_not(None)))
+            for row in rows.scalars():
+                path = getattr(row, column)
+                if blob_key(path) is not None:
+                    continue
+                if path not in moved:
+                    if not os.path.isfile(path):
+                        logger.warning(f"Skipping missing file {path}")
+                        continue
+                    sha256 = await asyncio.to_thread(file_sha256, path)
+                    ext = normalize_ext(os.path.splitext(path)[1], "")
+                    stored = await asyncio.to_thread(
+                        _copy_into_store, path, sha256, ext
+                    )
+                    moved[path] = (stored, sha256, os.path.getsize(stored))
+                stored, sha256, size = moved[path]
+                setattr(row, column, stored)
+                if isinstance(row, RoundMedia):
+                    row.checksum = row.checksum or sha256
+                    row.file_size = row.file_size or size
+
+    await db.commit()
+    for path in moved:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+    logger.info(f"Moved {len(moved)} files into the blob store")
+    return len(moved)
+
+
+async def _main() -> None:
+    from app.core.database import async_session_maker
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rebuild", action="store_true", help="recount references first"
+    )
+    parser.add_argument(
+        "--migrate-legacy",
+        action="store_true",
+        help="move files uploaded before the store existed into it first",
+    )
+    args = parser.parse_args()
+
+    async with async_session_maker() as db:
+        if args.migrate_legacy:
+            await migrate_legacy_files(db)
+        if args.rebuild:
+            await rebuild_blob_refs(db)
+        await collect_garbage(db)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
@@ -0,0 +1,199 @@
+"""Token-budget packing of job posting content for LLM prompts.
+
+Job pages carry a lot of text that never contributes to the extracted
+fields: equal-opportunity statements, benefits legalese, cookie banners,
+privacy notices. This module splits content into sections, scores each
+one with keyword heuristics, drops boilerplate and, if the remainder is
+still over the token budget, keeps the highest-value sections (in their
+original order) until the budget is filled.
+
+Token counts use LiteLLM's tokenizer for the configured model and fall
+back to a characters-per-token estimate if the model is unknown.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+
+from litellm import token_counter
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English prose across common tokenizers
+CHARS_PER_TOKEN = 4
+
+_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6}\s|\*\*[^*]+\*\*\s*$|[A-Z][^.!?]{2,60}:\s*$)")
+
+# Sections matching these are boilerplate and never worth sending
+_BOILERPLATE_PATTERNS = [
+    r"equal (employment )?opportunity",
+    r"\beeo\b",
+    r"affirmative action",
+    r"without regard to (race|color|religion|sex|gender)",
+    r"reasonable accommodation",
+    r"e-verify",
+    r"protected veteran",
+    r"\bcookies?\b",
+    r"privacy (policy|notice|statement)",
+    r"terms of (use|service)",
+    r"all rights reserved",
+    r"recruitment agenc(y|ies)",
+    r"unsolicited (resumes|applications)",
+    r"pay transparency",
+    r"401\(?k\)?",
+    r"(medical|dental|vision) (insurance|coverage)",
+    r"paid (time off|parental leave)",
+    r"employee assistance program",
+    r"(sign up|subscribe) (for|to) (job alerts|our newsletter)",
+    r"share this job",
+    r"similar jobs",
+]
+_BOILERPLATE_RE = re.compile("|".join(_BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# Sections matching these carry the fields we extract
+_VALUE_PATTERNS = [
+    r"responsibilit",
+    r"requirement",
+    r"qualification",
+    r"what you('ll| will) (do|bring)",
+    r"about (the|this) (role|position|job)",
+    r"(must|nice) to have",
+    r"experience",
+    r"skills?",
+    r"salary|compensation|pay range|\$\s?\d|€\s?\d|£\s?\d",
+    r"location|remote|hybrid|on-?site",
+    r"recruiter|hiring manager|linkedin\.com/in/",
+]
+_VALUE_RE = re.compile("|".join(_VALUE_PATTERNS), re.IGNORECASE)
+
+
+@dataclass
+class _Section:
+    index: int
+    text: str
+    tokens: int
+    score: float
+
+
+def estimate_tokens(text: str, model: str) -> int:
+    """Estimate how many tokens a piece of text uses for a model.
+
+    Args:
+        text: The text to measure.
+        model: The LiteLLM model name.
+
+    Returns:
+        Estimated token count.
+    """
+    if not text:
+        return 0
+    try:
+        return token_counter(model=model, text=text)
+    except Exception:
+        return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _is_heading(block: str) -> bool:
+    """True if a block starts with a markdown, bold or "Label:" heading."""
+    return bool(_HEADING_RE.match(block.split("\n", 1)[0]))
+
+
+def _split_sections(content: str) -> list[str]:
+    """Split content into heading-led sections and standalone paragraphs."""
+    sections: list[str] = []
+    current: list[str] = []
+    blocks = re.split(r"\n\s*\n", content)
+    if len(blocks) == 1:
+        # innerText from the extension often has no blank lines
+        blocks = content.split("\n")
+    for block in blocks:
+        block = block.strip()
+        if not block:
+            continue
+        if current and not _is_heading(block) and _is_heading(current[0]):
+            current.append(block)
+            continue
+        if current:
+            sections.append("\n\n".join(current))
+        current = [block]
+    if current:
+        sections.append("\n\n".join(current))
+    return sections
+
+
+def _score(text: str, index: int) -> float:
+    """Score a section: negative for boilerplate, higher for useful content."""
+    boilerplate = len(_BOILERPLATE_RE.findall(text))
+    value = len(_VALUE_RE.findall(text))
+    # Sections dominated by boilerplate phrases are dropped outright
+    if boilerplate and boilerplate >= value:
+        return -1.0
+    score = 1.0 + value
+    if index == 0:
+        # The opening usually carries the title, company and location
+        score += 5
+    return score
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut text to roughly max_tokens, at a line boundary where possible."""
+    tokens = estimate_tokens(text, model)
+    if tokens <= max_tokens:
+        return text
+    limit = max(1, int(len(text) * max_tokens / tokens))
+    cut = text.rfind("\n", 0, limit)
+    return text[: cut if cut > limit // 2 else limit].rstrip()
+
+
+def pack_content(content: str, model: str, max_tokens: int) -> str:
+    """Fit job posting content into a token budget.
+
+    Boilerplate sections are always removed. If the rest is still over
+    budget, sections are kept in order of score until the budget is used,
+    then emitted in their original order.
+
+    Args:
+        content: Plain text or markdown of the posting.
+        model: The LiteLLM model the prompt is for.
+        max_tokens: Token budget for the content (0 disables packing).
+
+    Returns:
+        The packed content. Falls back to the original content if
+        everything would be dropped.
+    """
+    if max_tokens <= 0 or not content.strip():
+        return content
+
+    sections = [
+        _Section(index=i, text=text, tokens=estimate_tokens(text, model), score=0)
+        for i, text in enumerate(_split_sections(content))
+    ]
+    for section in sections:
+        section.score = _score(section.text, section.index)
+
+    kept = [section for section in sections if section.score > 0]
+    if not kept:
+        return content
+
+    total = sum(section.tokens for section in kept)
+    if total > max_tokens:
+        budget = max_tokens
+        selected: list[_Section] = []
+        for section in sorted(kept, key=lambda s: (-s.score, s.index)):
+            if budget <= 0:
+                break
+            if section.tokens > budget:
+                section.text = _truncate_to_tokens(section.text, budget, model)
+                section.tokens = budget
+            selected.append(section)
+            budget -= section.tokens
+        kept = sorted(selected, key=lambda s: s.index)
+
+    packed = "\n\n".join(section.text for section in kept)
+    dropped = len(sections) - len(kept)
+    if dropped or total > max_tokens:
+        logger.info(
+            f"Packed content into token budget: {len(sections)} sections, "
+            f"{dropped} dropped, ~{total} -> ~{sum(s.tokens for s in kept)} tokens"
+        )
+    return packed
@@ -0,0 +1,100 @@
+"""Rebuild and read the per-user daily application rollup.
+
+The ``daily_application_stats`` table is maintained incrementally by the
+mapper events in ``app.models.daily_stats``. This module recomputes it from
+the source tables for a repair or backfill, and can be run as a command::
+
+    python -m app.services.daily_rollup            # every user
+    python -m app.services.daily_rollup --user-id <id>
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Application, ApplicationStatusHistory, DailyApplicationStats
+from app.models.daily_stats import transition_day
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_daily_stats(db: AsyncSession, user_id: str | None = None) -> int:
+    """Recompute rollup rows from applications and status history.
+
+    Args:
+        db: Database session. The rebuild is committed before returning.
+        user_id: Only rebuild this user's rows; all users if None.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    counts: dict[tuple[str, date, str], list[int]] = defaultdict(lambda: [0, 0])
+
+    applications = select(
+        Application.user_id,
+        Application.applied_at,
+        Application.status_id,
+        func.count(Application.id),
+    ).group_by(Application.user_id, Application.applied_at, Application.status_id)
+    if user_id is not None:
+        applications = applications.where(Application.user_id == user_id)
+    for owner, day, status_id, count in await db.execute(applications):
+        counts[(owner, day, status_id)][0] += count
+
+    # Transition days are derived in Python so the UTC date is computed the
+    # same way as the incremental path on every dialect.
+    history = select(
+        Application.user_id,
+        ApplicationStatusHistory.changed_at,
+        ApplicationStatusHistory.to_status_id,
+    ).join(Application, ApplicationStatusHistory.application_id == Application.id)
+    if user_id is not None:
+        history = history.where(Application.user_id == user_id)
+    async for owner, changed_at, status_id in await db.stream(history):
+        counts[(owner, transition_day(changed_at), status_id)][1] += 1
+
+    clear = delete(DailyApplicationStats)
+    if user_id is not None:
+        clear = clear.where(DailyApplicationStats.user_id == user_id)
+    await db.execute(clear)
+
+    rows = [
+        {
+            "user_id": owner,
+            "day": day,
+            "status_id": status_id,
+            "applications": applications_count,
+            "transitions": transitions_count,
+        }
+        for (owner, day, status_id), (
+            applications_count,
+            transitions_count,
+        ) in counts.items()
+    ]
+    if rows:
+        await db.execute(insert(DailyApplicationStats), rows)
+    await db.commit()
+    return len(rows)
+
+
+async def _main(user_id: str | None) -> None:
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as db:
+        written = await rebuild_daily_stats(db, user_id)
+    logger.info(f"Rebuilt daily application stats: {written} rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily application rollup table."
+    )
+    parser.add_argument("--user-id", help="Only rebuild this user's rows")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args.user_id))
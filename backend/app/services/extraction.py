@@ -12,6 +12,9 @@ using the following pipeline:
     Markdownify (convert to markdown)
         |
         v
+    Token budget (drop boilerplate, pack sections)
+        |
+        v
     LiteLLM (structured extraction with schema)
         |
         v
@@ -20,21 +23,37 @@ using the following pipeline:
         v
     JobLeadExtractionInput
 
+Pages that embed schema.org JobPosting metadata (JSON-LD/OpenGraph) take
+a deterministic fast path first; see app.services.structured_data.
+
 The service supports multiple LLM providers through LiteLLM and handles
 various error conditions including timeouts, invalid responses, and
 cases where no job data can be found.
 """
 
+import asyncio
 import json
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
 import openai
-from litellm import completion
+from litellm import acompletion, completion
 from markdownify import markdownify as md
 from readability import Document
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.schemas.job_lead import JobLeadExtractionInput
+from app.services.content_budget import pack_content
+from app.services.extraction_cache import (
+    extraction_cache_key,
+    get_cached_extraction,
+    store_extraction,
+)
+from app.services.structured_data import extract_structured_job_data
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +189,9 @@ def preprocess_html(html: str) -> str:
     5. Validate output (non-empty after processing)
     6. Truncate markdown if necessary
 
+    This is CPU-bound; async callers should use preprocess_html_async so
+    the work runs in the preprocessing process pool.
+
     Args:
         html: Raw HTML content from a job posting page.
 
@@ -180,6 +202,27 @@ def preprocess_html(html: str) -> str:
         ValueError: If the HTML content is empty, invalid, or results in
             empty markdown after processing.
     """
+    markdown_content, _ = preprocess_html_with_timings(html)
+    return markdown_content
+
+
+def preprocess_html_with_timings(html: str) -> tuple[str, dict[str, float]]:
+    """Run preprocess_html and report how long each stage took.
+
+    Module-level so it can be pickled and run in a worker process.
+
+    Args:
+        html: Raw HTML content from a job posting page.
+
+    Returns:
+        Tuple of (markdown, timings) where timings maps each stage name
+        (readability, markdown, clean, truncate) to seconds spent.
+
+    Raises:
+        ValueError: Same conditions as preprocess_html.
+    """
+    timings: dict[str, float] = {}
+
     # Step 1: Validate input is not empty
     if not html or not html.strip():
         raise ValueError("HTML content cannot be empty")
@@ -199,12 +242,14 @@ def preprocess_html(html: str) -> str:
         html += "</div></body></html>"
 
     # Step 3: Extract main content using Readability
+    started = time.perf_counter()
     try:
         doc = Document(html)
         article_html = doc.summary()
     except Exception as e:
         logger.error(f"Readability failed to parse HTML: {e}")
         raise ValueError(f"Failed to extract content from HTML: {e}") from e
+    timings["readability"] = time.perf_counter() - started
 
     # Validate Readability extracted something
     if not article_html or not article_html.strip():
@@ -213,32 +258,171 @@ def preprocess_html(html: str) -> str:
     logger.debug(f"Readability extracted {len(article_html)} chars of HTML")
 
     # Step 4: Convert to markdown
+    started = time.perf_counter()
     try:
         markdown_content = md(article_html)
     except Exception as e:
         logger.error(f"Markdownify failed to convert HTML: {e}")
         raise ValueError(f"Failed to convert HTML to markdown: {e}") from e
+    timings["markdown"] = time.perf_counter() - started
 
     # Step 5: Validate output is not empty
     if not markdown_content or not markdown_content.strip():
         raise ValueError("Markdown conversion resulted in empty content")
 
     # Clean up excessive whitespace while preserving structure
+    started = time.perf_counter()
     markdown_content = _clean_markdown(markdown_content)
+    timings["clean"] = time.perf_counter() - started
 
     # Step 6: Truncate markdown if necessary
+    started = time.perf_counter()
     if len(markdown_content) > MAX_MARKDOWN_SIZE:
         logger.warning(
             f"Markdown content ({len(markdown_content)} chars) exceeds limit "
             f"({MAX_MARKDOWN_SIZE} chars), truncating"
         )
         markdown_content = _truncate_markdown(markdown_content, MAX_MARKDOWN_SIZE)
+    timings["truncate"] = time.perf_counter() - started
 
     logger.debug(
         f"Preprocessed HTML: {original_size} -> {len(markdown_content)} chars "
         f"({len(markdown_content) / original_size * 100:.1f}% of original)"
     )
 
+    return markdown_content, timings
+
+
+@dataclass
+class StageTiming:
+    """Aggregated timing for one preprocessing stage."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class PreprocessMetrics:
+    """Per-stage timing and outcome counters for HTML preprocessing."""
+
+    STAGES = ("readability", "markdown", "clean", "truncate")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.stages: dict[str, StageTiming] = {
+            stage: StageTiming() for stage in self.STAGES
+        }
+        self.documents = 0
+        self.timeouts = 0
+
+    def record(self, timings: dict[str, float]) -> None:
+        """Record the stage timings of one processed document."""
+        self.documents += 1
+        for stage, seconds in timings.items():
+            self.stages.setdefault(stage, StageTiming()).record(seconds)
+
+
+preprocess_metrics = PreprocessMetrics()
+
+# Lazily created process pool for CPU-bound HTML preprocessing
+_preprocess_executor: ProcessPoolExecutor | None = None
+
+
+def _get_preprocess_executor() -> ProcessPoolExecutor | None:
+    """Get the preprocessing pool, or None to run in a thread instead."""
+    global _preprocess_executor
+    workers = get_settings().html_preprocess_workers
+    if workers <= 0:
+        return None
+    if _preprocess_executor is None:
+        _preprocess_executor = ProcessPoolExecutor(max_workers=workers)
+    return _preprocess_executor
+
+
+def shutdown_preprocess_pool(wait: bool = True) -> None:
+    """Shut down the preprocessing pool; it is recreated on next use."""
+    global _preprocess_executor
+    if _preprocess_executor is not None:
+        _preprocess_executor.shutdown(wait=wait, cancel_futures=True)
+        _preprocess_executor = None
+
+
+def _terminate_workers(workers: list) -> None:
+    """Kill worker processes of a retired pool that are still running."""
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+
+
+def _retire_preprocess_pool(executor: ProcessPoolExecutor, grace: float) -> None:
+    """Replace a pool that has a stuck worker.
+
+    New work goes to a fresh pool straight away. Work already queued on
+    the old pool is left to finish rather than cancelled, since it belongs
+    to other requests. Every such request gives up after its own time
+    budget, so once ``grace`` seconds have passed nobody is waiting on the
+    old pool and its remaining (stuck) workers are terminated.
+    """
+    global _preprocess_executor
+    if _preprocess_executor is executor:
+        _preprocess_executor = None
+    # shutdown() drops the pool's reference to its processes
+    workers = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=False)
+    asyncio.get_running_loop().call_later(grace, _terminate_workers, workers)
+
+
+async def preprocess_html_async(html: str) -> str:
+    """Preprocess HTML off the event loop, within a time budget.
+
+    Runs preprocess_html in the process pool (``html_preprocess_workers``
+    processes; 0 runs it in a thread instead) and gives up after
+    ``html_preprocess_timeout_seconds``. On timeout the pool is replaced so
+    a pathological document cannot hold a worker for later requests; see
+    _retire_preprocess_pool.
+
+    Args:
+        html: Raw HTML content from a job posting page.
+
+    Returns:
+        Cleaned markdown string containing the main content.
+
+    Raises:
+        ValueError: If preprocessing fails or exceeds the time budget.
+    """
+    settings = get_settings()
+    executor = _get_preprocess_executor()
+    loop = asyncio.get_running_loop()
+
+    try:
+        markdown_content, timings = await asyncio.wait_for(
+            loop.run_in_executor(executor, preprocess_html_with_timings, html),
+            timeout=settings.html_preprocess_timeout_seconds,
+        )
+    except TimeoutError:
+        preprocess_metrics.timeouts += 1
+        if executor is not None:
+            _retire_preprocess_pool(executor, settings.html_preprocess_timeout_seconds)
+        raise ValueError(
+            "HTML preprocessing exceeded the time budget "
+            f"({settings.html_preprocess_timeout_seconds}s)"
+        ) from None
+
+    preprocess_metrics.record(timings)
+    logger.debug(
+        "Preprocessing stage timings: "
+        + ", ".join(
+            f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in timings.items()
+        )
+    )
     return markdown_content
 
 
@@ -296,6 +480,221 @@ def _truncate_markdown(markdown: str, max_length: int) -> str:
     return truncated + truncation_notice
 
 
+# Allow one retry (with a correction prompt) for invalid JSON responses
+MAX_LLM_ATTEMPTS = 2
+
+
+class _CorrectionNeeded(Exception):
+    """Internal signal that the LLM response should be retried with a correction prompt."""
+
+    def __init__(self, error_message: str, raw_content: str):
+        super().__init__(error_message)
+        self.error_message = error_message
+        self.raw_content = raw_content
+
+
+def _resolve_extraction_model(model: str | None) -> str:
+    """Resolve the model to use: explicit override, env var, then default."""
+    import os
+
+    return model or os.getenv("LITELLM_MODEL", DEFAULT_EXTRACTION_MODEL)
+
+
+def _build_completion_kwargs(
+    content: str,
+    url: str,
+    model: str | None,
+    api_key: str | None,
+    api_base: str | None,
+    timeout: int,
+) -> tuple[dict[str, Any], str]:
+    """Build the LiteLLM completion kwargs for an extraction request.
+
+    Returns:
+        Tuple of (completion_kwargs, user_message). The user message is
+        returned separately so retries can rebuild the conversation.
+    """
+    # Determine which model to use
+    extraction_model = _resolve_extraction_model(model)
+    logger.info(f"Starting LLM extraction with model: {extraction_model}")
+
+    # Build the user message with URL context and content
+    user_message = f"""Source URL: {url}
+
+Job Posting Content:
+{content}"""
+
+    # Use json_object mode instead of full schema for broader compatibility
+    # (Cerebras and other providers don't support full JSON schema)
+    completion_kwargs: dict[str, Any] = {
+        "model": extraction_model,
+        "messages": [
+            {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        "response_format": {"type": "json_object"},
+        "timeout": timeout,
+    }
+
+    # Add API key and base URL if provided
+    if api_key:
+        completion_kwargs["api_key"] = api_key
+    if api_base:
+        completion_kwargs["api_base"] = api_base
+
+    return completion_kwargs, user_message
+
+
+def _correction_messages(
+    user_message: str, raw_content: str, error_message: str
+) -> list[dict[str, str]]:
+    """Build the conversation for a retry after an unparseable response."""
+    correction_prompt = CORRECTION_PROMPT_TEMPLATE.format(
+        error_message=error_message,
+        original_response=raw_content[:500],
+    )
+    return [
+        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+        {"role": "user", "content": user_message},
+        {"role": "assistant", "content": raw_content},
+        {"role": "user", "content": correction_prompt},
+    ]
+
+
+def _parse_llm_response(
+    raw_content: str | None,
+    content: str,
+    url: str,
+    extraction_model: str,
+    attempt: int,
+) -> JobLeadExtractionInput:
+    """Parse and validate a raw LLM response into JobLeadExtractionInput.
+
+    Args:
+        raw_content: The message content returned by the LLM.
+        content: The content that was sent for extraction (for error details).
+        url: The source URL.
+        extraction_model: The model that produced the response.
+        attempt: Zero-based attempt number.
+
+    Returns:
+        The validated extraction result.
+
+    Raises:
+        _CorrectionNeeded: If the response is invalid and a retry is still allowed.
+        ExtractionInvalidResponseError: If the response is invalid on the final attempt.
+        NoJobFoundError: If the response contains no job posting data.
+    """
+    is_final_attempt = attempt >= MAX_LLM_ATTEMPTS - 1
+
+    if not raw_content:
+        raise ExtractionInvalidResponseError(
+            "LLM returned empty response",
+            details={"model": extraction_model, "url": url},
+        )
+
+    logger.debug(f"Raw LLM response (attempt {attempt + 1}): {raw_content[:500]}...")
+
+    # Parse the JSON response
+    try:
+        parsed_data = json.loads(raw_content)
+    except json.JSONDecodeError as e:
+        if not is_final_attempt:
+            logger.warning(
+                f"JSON parse error on attempt {attempt + 1}, retrying with correction prompt"
+            )
+            raise _CorrectionNeeded(str(e), raw_content) from e
+        raise ExtractionInvalidResponseError(
+            f"Failed to parse LLM response as JSON after {MAX_LLM_ATTEMPTS} attempts: {e}",
+            details={
+                "model": extraction_model,
+                "url": url,
+                "raw_response": raw_content[:1000],
+                "attempts": MAX_LLM_ATTEMPTS,
+            },
+        ) from e
+
+    # Validate and create the Pydantic model
+    try:
+        job_data = JobLeadExtractionInput(**parsed_data)
+    except Exception as e:
+        if not is_final_attempt:
+            logger.warning(
+                f"Schema validation error on attempt {attempt + 1}, retrying with correction prompt"
+            )
+            raise _CorrectionNeeded(
+                f"Schema validation failed: {e}", raw_content
+            ) from e
+        raise ExtractionInvalidResponseError(
+            f"LLM response failed schema validation after {MAX_LLM_ATTEMPTS} attempts: {e}",
+            details={
+                "model": extraction_model,
+                "url": url,
+                "parsed_data": parsed_data,
+                "validation_error": str(e),
+                "attempts": MAX_LLM_ATTEMPTS,
+            },
+        ) from e
+
+    # Check if this appears to be an actual job posting
+    # If both title and company are None, likely not a job posting
+    if job_data.title is None and job_data.company is None:
+        raise NoJobFoundError(
+            "No job posting data could be extracted from the content",
+            details={
+                "url": url,
+                "content_preview": content[:500],
+            },
+        )
+
+    # Override source with URL-derived source if not extracted
+    if job_data.source is None:
+        job_data.source = _extract_source_from_url(url)
+
+    if attempt > 0:
+        logger.info(
+            f"Successfully extracted job after retry: {job_data.title} at {job_data.company}"
+        )
+    else:
+        logger.info(
+            f"Successfully extracted job: {job_data.title} at {job_data.company}"
+        )
+    return job_data
+
+
+def _translate_llm_error(
+    error: Exception, extraction_model: str, url: str, timeout: int
+) -> ExtractionError:
+    """Map a provider/transport exception to the matching ExtractionError."""
+    if isinstance(error, openai.APITimeoutError):
+        logger.error(f"LLM request timed out: {error}")
+        return ExtractionTimeoutError(
+            f"LLM request timed out after {timeout} seconds",
+            details={"model": extraction_model, "url": url, "timeout": timeout},
+        )
+
+    if isinstance(error, openai.APIError):
+        logger.error(f"LLM API error: {error}")
+        return ExtractionInvalidResponseError(
+            f"LLM API error: {error}",
+            details={
+                "model": extraction_model,
+                "url": url,
+                "error_type": type(error).__name__,
+            },
+        )
+
+    logger.error(f"Unexpected error during LLM extraction: {error}")
+    return ExtractionInvalidResponseError(
+        f"Unexpected error during extraction: {error}",
+        details={
+            "model": extraction_model,
+            "url": url,
+            "error_type": type(error).__name__,
+        },
+    )
+
+
 def extract_with_llm(
     content: str,
     url: str,
@@ -304,7 +703,7 @@ def extract_with_llm(
     api_base: str | None = None,
     timeout: int = 60,
 ) -> JobLeadExtractionInput:
-    """Extract structured job data using LiteLLM.
+    """Extract structured job data using LiteLLM (blocking).
 
     Uses structured output with the JobLeadExtractionInput schema to ensure
     the LLM returns valid, parseable job data.
@@ -312,6 +711,9 @@ def extract_with_llm(
     Includes retry logic: if the LLM returns invalid JSON, it will retry once
     with a correction prompt before failing.
 
+    This variant blocks the calling thread for the duration of the LLM call.
+    Async code should use extract_with_llm_async instead.
+
     Args:
         content: Text content from the job posting (plain text or preprocessed).
         url: The source URL (included in prompt for context).
@@ -329,199 +731,105 @@ def extract_with_llm(
         ExtractionInvalidResponseError: If the response cannot be parsed.
         NoJobFoundError: If no job data could be extracted.
     """
-    import os
+    completion_kwargs, user_message = _build_completion_kwargs(
+        content, url, model, api_key, api_base, timeout
+    )
+    extraction_model = completion_kwargs["model"]
 
-    # Determine which model to use
-    extraction_model = model or os.getenv("LITELLM_MODEL", DEFAULT_EXTRACTION_MODEL)
-    logger.info(f"Starting LLM extraction with model: {extraction_model}")
+    for attempt in range(MAX_LLM_ATTEMPTS):
+        try:
+            response = completion(**completion_kwargs)
+            raw_content = response.choices[0].message.content  # type: ignore[union-attr]
+            return _parse_llm_response(
+                raw_content, content, url, extraction_model, attempt
+            )
+        except _CorrectionNeeded as retry:
+            completion_kwargs["messages"] = _correction_messages(
+                user_message, retry.raw_content, retry.error_message
+            )
+        except ExtractionError:
+            # Re-raise our custom exceptions
+            raise
+        except Exception as e:
+            raise _translate_llm_error(e, extraction_model, url, timeout) from e
 
-    # Build the user message with URL context and content
-    user_message = f"""Source URL: {url}
+    # This should never be reached, but satisfy the type checker
+    raise ExtractionInvalidResponseError(
+        "Extraction failed after all attempts",
+        details={"model": extraction_model, "url": url},
+    )
 
-Job Posting Content:
-{content}"""
 
-    # Track retry state
-    is_retry = False
-    messages = [
-        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-        {"role": "user", "content": user_message},
-    ]
+# Bounded concurrency for async extraction. The semaphore is bound to the
+# running event loop, so it is recreated if the loop changes (e.g. in tests).
+_extraction_semaphore: asyncio.Semaphore | None = None
+_extraction_semaphore_loop: asyncio.AbstractEventLoop | None = None
 
-    # Build kwargs for LiteLLM completion
-    # Use json_object mode instead of full schema for broader compatibility
-    # (Cerebras and other providers don't support full JSON schema)
-    completion_kwargs = {
-        "model": extraction_model,
-        "messages": messages,
-        "response_format": {"type": "json_object"},
-        "timeout": timeout,
-    }
 
-    # Add API key and base URL if provided
-    if api_key:
-        completion_kwargs["api_key"] = api_key
-    if api_base:
-        completion_kwargs["api_base"] = api_base
+def _get_extraction_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent LLM extractions for this loop."""
+    global _extraction_semaphore, _extraction_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _extraction_semaphore is None or _extraction_semaphore_loop is not loop:
+        limit = max(1, get_settings().extraction_max_concurrency)
+        _extraction_semaphore = asyncio.Semaphore(limit)
+        _extraction_semaphore_loop = loop
+    return _extraction_semaphore
 
-    # Allow one retry for invalid JSON responses
-    max_attempts = 2
-    _last_parse_error: tuple[str, str] | None = None  # (error_message, raw_response)
 
-    for attempt in range(max_attempts):
-        try:
-            # Call LiteLLM with structured output
-            response = completion(**completion_kwargs)
-
-            # Extract the content from the response
-            raw_content = response.choices[0].message.content  # type: ignore[union-attr]
+async def extract_with_llm_async(
+    content: str,
+    url: str,
+    model: str | None = None,
+    api_key: str | None = None,
+    api_base: str | None = None,
+    timeout: int = 60,
+) -> JobLeadExtractionInput:
+    """Extract structured job data using LiteLLM without blocking the event loop.
 
-            if not raw_content:
-                raise ExtractionInvalidResponseError(
-                    "LLM returned empty response",
-                    details={"model": extraction_model, "url": url},
-                )
+    Behaves exactly like extract_with_llm (same prompt, same JSON-correction
+    retry, same exceptions) but awaits the LLM call. At most
+    ``settings.extraction_max_concurrency`` extractions run at once; further
+    callers wait for a free slot.
 
-            logger.debug(
-                f"Raw LLM response (attempt {attempt + 1}): {raw_content[:500]}..."
-            )
+    Args:
+        content: Text content from the job posting (plain text or preprocessed).
+        url: The source URL (included in prompt for context).
+        model: Optional model override. Falls back to DEFAULT_EXTRACTION_MODEL.
+        api_key: Optional API key for the LLM provider.
+        api_base: Optional base URL for the LLM provider.
+        timeout: Request timeout in seconds.
 
-            # Parse the JSON response
-            try:
-                parsed_data = json.loads(raw_content)
-            except json.JSONDecodeError as e:
-                # Store error for potential retry
-                _last_parse_error = (str(e), raw_content)
-                if attempt < max_attempts - 1:
-                    # Retry with correction prompt
-                    logger.warning(
-                        f"JSON parse error on attempt {attempt + 1}, retrying with correction prompt"
-                    )
-                    correction_prompt = CORRECTION_PROMPT_TEMPLATE.format(
-                        error_message=str(e),
-                        original_response=raw_content[:500],
-                    )
-                    messages = [
-                        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_message},
-                        {"role": "assistant", "content": raw_content},
-                        {"role": "user", "content": correction_prompt},
-                    ]
-                    completion_kwargs["messages"] = messages
-                    is_retry = True
-                    continue
-                else:
-                    # Final attempt failed
-                    raise ExtractionInvalidResponseError(
-                        f"Failed to parse LLM response as JSON after {max_attempts} attempts: {e}",
-                        details={
-                            "model": extraction_model,
-                            "url": url,
-                            "raw_response": raw_content[:1000],
-                            "attempts": max_attempts,
-                        },
-                    ) from e
-
-            # Validate and create the Pydantic model
-            try:
-                job_data = JobLeadExtractionInput(**parsed_data)
-            except Exception as e:
-                # Store error for potential retry
-                _last_parse_error = (str(e), raw_content)
-                if attempt < max_attempts - 1:
-                    # Retry with correction prompt for schema validation errors
-                    logger.warning(
-                        f"Schema validation error on attempt {attempt + 1}, retrying with correction prompt"
-                    )
-                    correction_prompt = CORRECTION_PROMPT_TEMPLATE.format(
-                        error_message=f"Schema validation failed: {e}",
-                        original_response=raw_content[:500],
-                    )
-                    messages = [
-                        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_message},
-                        {"role": "assistant", "content": raw_content},
-                        {"role": "user", "content": correction_prompt},
-                    ]
-                    completion_kwargs["messages"] = messages
-                    is_retry = True
-                    continue
-                else:
-                    # Final attempt failed
-                    raise ExtractionInvalidResponseError(
-                        f"LLM response failed schema validation after {max_attempts} attempts: {e}",
-                        details={
-                            "model": extraction_model,
-                            "url": url,
-                            "parsed_data": parsed_data,
-                            "validation_error": str(e),
-                            "attempts": max_attempts,
-                        },
-                    ) from e
-
-            # Check if this appears to be an actual job posting
-            # If both title and company are None, likely not a job posting
-            if job_data.title is None and job_data.company is None:
-                raise NoJobFoundError(
-                    "No job posting data could be extracted from the content",
-                    details={
-                        "url": url,
-                        "content_preview": content[:500],
-                    },
-                )
+    Returns:
+        JobLeadExtractionInput with extracted job data.
 
-            # Override source with URL-derived source if not extracted
-            if job_data.source is None:
-                job_data.source = _extract_source_from_url(url)
+    Raises:
+        ExtractionTimeoutError: If the LLM request times out.
+        ExtractionInvalidResponseError: If the response cannot be parsed.
+        NoJobFoundError: If no job data could be extracted.
+    """
+    completion_kwargs, user_message = _build_completion_kwargs(
+        content, url, model, api_key, api_base, timeout
+    )
+    extraction_model = completion_kwargs["model"]
 
-            if is_retry:
-                logger.info(
-                    f"Successfully extracted job after retry: {job_data.title} at {job_data.company}"
+    async with _get_extraction_semaphore():
+        for attempt in range(MAX_LLM_ATTEMPTS):
+            try:
+                response = await acompletion(**completion_kwargs)
+                raw_content = response.choices[0].message.content  # type: ignore[union-attr]
+                return _parse_llm_response(
+                    raw_content, content, url, extraction_model, attempt
                 )
-            else:
-                logger.info(
-                    f"Successfully extracted job: {job_data.title} at {job_data.company}"
+            except _CorrectionNeeded as retry:
+                completion_kwargs["messages"] = _correction_messages(
+                    user_message, retry.raw_content, retry.error_message
                 )
-            return job_data
-
-        except openai.APITimeoutError as e:
-            logger.error(f"LLM request timed out: {e}")
-            raise ExtractionTimeoutError(
-                f"LLM request timed out after {timeout} seconds",
-                details={"model": extraction_model, "url": url, "timeout": timeout},
-            ) from e
-
-        except openai.APIError as e:
-            logger.error(f"LLM API error: {e}")
-            raise ExtractionInvalidResponseError(
-                f"LLM API error: {e}",
-                details={
-                    "model": extraction_model,
-                    "url": url,
-                    "error_type": type(e).__name__,
-                },
-            ) from e
-
-        except (
-            ExtractionTimeoutError,
-            ExtractionInvalidResponseError,
-            NoJobFoundError,
-        ):
-            # Re-raise our custom exceptions
-            raise
-
-        except Exception as e:
-            logger.error(f"Unexpected error during LLM extraction: {e}")
-            raise ExtractionInvalidResponseError(
-                f"Unexpected error during extraction: {e}",
-                details={
-                    "model": extraction_model,
-                    "url": url,
-                    "error_type": type(e).__name__,
-                },
-            ) from e
+            except ExtractionError:
+                raise
+            except Exception as e:
+                raise _translate_llm_error(e, extraction_model, url, timeout) from e
 
-    # This should never be reached, but satisfy the type checker
     raise ExtractionInvalidResponseError(
         "Extraction failed after all attempts",
         details={"model": extraction_model, "url": url},
@@ -536,6 +844,7 @@ async def extract_job_data(
     api_key: str | None = None,
     api_base: str | None = None,
     timeout: int = 60,
+    db: AsyncSession | None = None,
 ) -> JobLeadExtractionInput:
     """Main entry point for job data extraction.
 
@@ -543,6 +852,18 @@ async def extract_job_data(
     1. Text mode (preferred): Pass text directly, skips preprocessing entirely
     2. HTML mode (legacy): Pass HTML, preprocesses to markdown first
 
+    Content from either mode is then packed into the configured token
+    budget (``extraction_token_budget``), dropping boilerplate sections.
+
+    Whenever HTML is available it is first checked for schema.org JobPosting
+    JSON-LD and OpenGraph metadata. If that yields a title, company and
+    description the LLM is skipped; partial metadata is merged over the LLM
+    result, and its description replaces the page as the prompt.
+
+    When a database session is passed, results are cached by content hash
+    and model (see app.services.extraction_cache), so identical postings
+    skip the LLM call entirely.
+
     Args:
         html: Raw HTML content from the job posting page (legacy mode).
         text: Plain text content from the job posting page (preferred mode).
@@ -551,6 +872,7 @@ async def extract_job_data(
         api_key: Optional API key for the LLM provider.
         api_base: Optional base URL for the LLM provider.
         timeout: LLM request timeout in seconds.
+        db: Optional database session used for the extraction cache.
 
     Returns:
         JobLeadExtractionInput with all extracted job data.
@@ -574,6 +896,18 @@ async def extract_job_data(
     """
     logger.info(f"Starting extraction for URL: {url}")
 
+    # Fast path: schema.org JobPosting / OpenGraph metadata in the page
+    structured = extract_structured_job_data(html) if html else None
+    if structured is not None and structured.is_complete:
+        job_data = structured.job_data
+        if not job_data.source and url:
+            job_data.source = _extract_source_from_url(url)
+        logger.info(
+            f"Extracted job from {structured.origin} metadata without LLM: "
+            f"{job_data.title} at {job_data.company}"
+        )
+        return job_data
+
     # Determine content to use
     content: str
 
@@ -583,19 +917,41 @@ async def extract_job_data(
         content = text.strip()
         if not content:
             raise ExtractionError("Text content is empty")
+    elif structured is not None and structured.job_data.description:
+        # Partial metadata: its description is a much smaller prompt than
+        # the whole page, and skips HTML preprocessing
+        content = structured.to_prompt_text()
+        logger.info(f"Using {structured.origin} description ({len(content)} chars)")
     elif html:
         # Legacy: preprocess HTML to markdown
         logger.info(f"Using HTML mode ({len(html)} chars)")
         try:
-            content = preprocess_html(html)
+            content = await preprocess_html_async(html)
         except ValueError as e:
             logger.error(f"HTML preprocessing failed: {e}")
             raise ExtractionError(f"Failed to preprocess HTML: {e}")
     else:
         raise ExtractionError("Either 'text' or 'html' must be provided")
 
-    # Extract with LLM
-    job_data = extract_with_llm(
+    # Drop boilerplate and fit the content into the prompt token budget
+    extraction_model = _resolve_extraction_model(model)
+    content = await asyncio.to_thread(
+        pack_content,
+        content,
+        extraction_model,
+        get_settings().extraction_token_budget,
+    )
+
+    cache_key: str | None = None
+    if db is not None:
+        cache_key = extraction_cache_key(content, extraction_model)
+        cached = await get_cached_extraction(db, cache_key)
+        if cached is not None:
+            logger.info(f"Using cached extraction: {cached.title} at {cached.company}")
+            return cached
+
+    # Extract with LLM (awaited, so the event loop keeps serving other requests)
+    job_data = await extract_with_llm_async(
         content=content,
         url=url,
         model=model,
@@ -603,6 +959,11 @@ async def extract_job_data(
         api_base=api_base,
         timeout=timeout,
     )
+    if structured is not None:
+        job_data = structured.merge_into(job_data)
+
+    if db is not None and cache_key is not None:
+        await store_extraction(db, cache_key, extraction_model, job_data)
 
     logger.info(f"Successfully extracted job: {job_data.title} at {job_data.company}")
     return job_data
@@ -0,0 +1,202 @@
+"""Content-addressed cache for LLM extraction results.
+
+The same posting is routinely extracted more than once: several users
+capture the same URL, failed leads are retried, and the applications
+extract endpoint re-runs known URLs. Results are cached in the database
+keyed by a hash of the normalized content plus the model name, so a
+repeat extraction costs one primary-key lookup instead of an LLM call.
+
+Entries expire after ``extraction_cache_ttl_hours`` and the table is kept
+to ``extraction_cache_max_entries`` rows by evicting the least recently
+used entries. Cache failures are logged and never fail an extraction.
+
+Lookups and writes run in their own short-lived session on the caller's
+engine, so they never commit, roll back or expire the caller's work.
+"""
+
+import hashlib
+import logging
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from pydantic import ValidationError
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.schemas.job_lead import JobLeadExtractionInput
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class ExtractionCacheStats:
+    """Hit/miss counters for the current process."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+cache_stats = ExtractionCacheStats()
+
+
+def extraction_cache_key(content: str, model: str) -> str:
+    """Build the cache key for a piece of content and a model.
+
+    Whitespace is collapsed before hashing so that trivial formatting
+    differences (trailing newlines, indentation) map to the same entry.
+
+    Args:
+        content: The text or markdown that would be sent to the LLM.
+        model: The model name used for extraction.
+
+    Returns:
+        A hex SHA-256 digest.
+    """
+    normalized = _WHITESPACE_RE.sub(" ", content).strip()
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalized.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@asynccontextmanager
+async def _cache_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Separate session on the same engine as db, for one cache operation."""
+    async with AsyncSession(db.bind, expire_on_commit=False) as session:
+        yield session
+
+
+def _as_aware(value: datetime) -> datetime:
+    """SQLite returns naive datetimes; treat them as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+async def get_cached_extraction(
+    db: AsyncSession, key: str
+) -> JobLeadExtractionInput | None:
+    """Look up a cached extraction result.
+
+    Expired entries are deleted on access. The lookup runs in its own
+    session, which is closed before returning so no connection is held
+    during a subsequent LLM call.
+
+    Args:
+        db: The caller's session; only its engine is used.
+        key: Key from extraction_cache_key().
+
+    Returns:
+        The cached result, or None on a miss.
+    """
+    settings = get_settings()
+    if not settings.extraction_cache_enabled:
+        return None
+
+    result: JobLeadExtractionInput | None = None
+    async with _cache_session(db) as session:
+        try:
+            entry = await session.get(ExtractionCacheEntry, key)
+            now = datetime.now(UTC)
+
+            if entry is not None:
+                ttl = timedelta(hours=settings.extraction_cache_ttl_hours)
+                if _as_aware(entry.created_at) + ttl < now:
+                    await session.delete(entry)
+                else:
+                    try:
+                        result = JobLeadExtractionInput.model_validate(entry.result)
+                    except ValidationError:
+                        # Schema changed since the entry was written
+                        await session.delete(entry)
+                    else:
+                        entry.hit_count += 1
+                        entry.last_accessed_at = now
+
+            await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            await session.rollback()
+            result = None
+
+    if result is None:
+        cache_stats.misses += 1
+    else:
+        cache_stats.hits += 1
+        logger.info(f"Extraction cache hit for key {key[:12]}")
+    return result
+
+
+async def store_extraction(
+    db: AsyncSession, key: str, model: str, result: JobLeadExtractionInput
+) -> None:
+    """Store an extraction result and evict old entries.
+
+    Args:
+        db: The caller's session; only its engine is used.
+        key: Key from extraction_cache_key().
+        model: The model name used for extraction.
+        result: The extraction result to cache.
+    """
+    settings = get_settings()
+    if not settings.extraction_cache_enabled:
+        return
+
+    now = datetime.now(UTC)
+    async with _cache_session(db) as session:
+        try:
+            await session.merge(
+                ExtractionCacheEntry(
+                    content_hash=key,
+                    model=model,
+                    result=result.model_dump(mode="json"),
+                    hit_count=0,
+                    created_at=now,
+                    last_accessed_at=now,
+                )
+            )
+            await session.flush()
+            await _evict(session, now)
+            await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Extraction cache store failed: {e}")
+            await session.rollback()
+
+
+async def _evict(db: AsyncSession, now: datetime) -> None:
+    """Delete expired entries, then the least recently used beyond the limit."""
+    settings = get_settings()
+    cutoff = now - timedelta(hours=settings.extraction_cache_ttl_hours)
+    await db.execute(
+        delete(ExtractionCacheEntry)
+        .where(ExtractionCacheEntry.created_at < cutoff)
+        .execution_options(synchronize_session="fetch")
+    )
+
+    max_entries = max(1, settings.extraction_cache_max_entries)
+    count = await db.scalar(select(func.count()).select_from(ExtractionCacheEntry))
+    overflow = (count or 0) - max_entries
+    if overflow > 0:
+        oldest = (
+            select(ExtractionCacheEntry.content_hash)
+            .order_by(ExtractionCacheEntry.last_accessed_at)
+            .limit(overflow)
+        )
+        await db.execute(
+            delete(ExtractionCacheEntry)
+            .where(ExtractionCacheEntry.content_hash.in_(oldest))
+            .execution_options(synchronize_session="fetch")
+        )
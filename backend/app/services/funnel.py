@@ -0,0 +1,164 @@
+"""History-based stage funnel ("ever reached stage X").
+
+Counting applications by *current* status undercounts every stage an
+application has moved past: an application that was interviewed and then
+rejected no longer counts as an interview. An application has reached a
+stage if its current status is that stage or any entry in
+``application_status_history`` moved it there.
+
+Both queries here aggregate entirely in the database. The per-stage funnel
+counts distinct applications over the union of current statuses and
+history targets. The weekly series tests each application with an
+``EXISTS`` probe that uses the ``(to_status_id, application_id)`` history
+index.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import case, exists, func, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Application, ApplicationStatus, ApplicationStatusHistory
+from app.services.kpis import FAR_PAST_DATE
+from app.services.week_buckets import week_index
+
+
+@dataclass
+class StageCount:
+    """Applications that ever reached one status."""
+
+    status_id: str
+    name: str
+    color: str
+    reached: int
+
+
+@dataclass
+class WeeklyStageCount:
+    """Applications in one week bucket, and how many reached the stage."""
+
+    week: int
+    applications: int
+    reached: int
+
+
+def _visible_statuses(user_id: str):
+    return or_(
+        ApplicationStatus.user_id == user_id, ApplicationStatus.user_id.is_(None)
+    )
+
+
+async def compute_stage_funnel(
+    db: AsyncSession, user_id: str, start_date: date = FAR_PAST_DATE
+) -> tuple[int, list[StageCount]]:
+    """Count, per status, the applications that ever reached it.
+
+    Args:
+        db: Database session.
+        user_id: The user whose applications are counted.
+        start_date: Only applications applied on or after this date.
+
+    Returns:
+        Total applications in the period, and one StageCount per status
+        visible to the user, in status order.
+    """
+    in_scope = (Application.user_id == user_id, Application.applied_at >= start_date)
+    history = ApplicationStatusHistory
+    reached = union_all(
+        select(
+            Application.id.label("application_id"),
+            Application.status_id.label("status_id"),
+        ).where(*in_scope),
+        select(history.application_id, history.to_status_id)
+        .join(Application, history.application_id == Application.id)
+        .where(*in_scope),
+    ).subquery()
+    per_status = (
+        select(
+            reached.c.status_id,
+            func.count(reached.c.application_id.distinct()).label("reached"),
+        )
+        .group_by(reached.c.status_id)
+        .subquery()
+    )
+    total = select(func.count(Application.id)).where(*in_scope).scalar_subquery()
+
+    result = await db.execute(
+        select(
+            ApplicationStatus.id,
+            ApplicationStatus.name,
+            ApplicationStatus.color,
+            func.coalesce(per_status.c.reached, 0),
+            total,
+        )
+        .outerjoin(per_status, per_status.c.status_id == ApplicationStatus.id)
+        .where(_visible_statuses(user_id))
+        .order_by(ApplicationStatus.order, ApplicationStatus.name)
+    )
+    rows = result.all()
+    stages = [StageCount(*row[:4]) for row in rows]
+    return (rows[0][4] if rows else 0), stages
+
+
+async def compute_weekly_stage_reach(
+    db: AsyncSession,
+    user_id: str,
+    stage: str,
+    today: date,
+    weeks_count: int,
+    start_date: date,
+    week_start: str | None = None,
+) -> list[WeeklyStageCount]:
+    """Per application week, count applications and those that reached a stage.
+
+    Applications are bucketed by applied date. A stage is matched by status
+    name, so user and default statuses with the same name both count.
+
+    Args:
+        db: Database session.
+        user_id: The user whose applications are counted.
+        stage: Status name, e.g. "Interviewing".
+        today: Reference date for week buckets.
+        weeks_count: Number of week buckets.
+        start_date: Only applications applied on or after this date.
+        week_start: Weekday calendar weeks start on; rolling weeks if None.
+
+    Returns:
+        One WeeklyStageCount per non-empty week, most recent first.
+    """
+    stage_ids = select(ApplicationStatus.id).where(
+        ApplicationStatus.name == stage, _visible_statuses(user_id)
+    )
+    history = ApplicationStatusHistory
+    ever_reached = or_(
+        Application.status_id.in_(stage_ids),
+        exists().where(
+            history.to_status_id.in_(stage_ids),
+            history.application_id == Application.id,
+        ),
+    )
+    per_application = (
+        select(
+            week_index(
+                db.bind.dialect.name,
+                today,
+                Application.applied_at,
+                weeks_count,
+                week_start,
+            ).label("week"),
+            case((ever_reached, 1), else_=0).label("reached"),
+        )
+        .where(Application.user_id == user_id, Application.applied_at >= start_date)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            per_application.c.week,
+            func.count(),
+            func.sum(per_application.c.reached),
+        )
+        .group_by(per_application.c.week)
+        .order_by(per_application.c.week)
+    )
+    return [WeeklyStageCount(*row) for row in result.all()]
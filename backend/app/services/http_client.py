@@ -0,0 +1,260 @@
+"""Shared HTTP client for fetching job postings.
+
+A single ``httpx.AsyncClient`` is created for the lifetime of the app so
+repeated fetches from the same job board (Greenhouse, Lever, Workday, ...)
+reuse warm keep-alive connections instead of paying a new TLS handshake
+per URL. On top of the shared pool this module adds:
+
+- a per-host concurrency limit, so a bulk capture against one board does
+  not monopolise the pool or trip the board's rate limiting;
+- HTTP/2 when the optional ``h2`` package is installed;
+- a response size cap enforced while the body is streamed;
+- conditional GET revalidation (ETag / Last-Modified) backed by a small
+  in-memory LRU of recently fetched pages, bounded both in pages and in
+  total body size.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT_SECONDS = 30
+HTTP_MAX_REDIRECTS = 5
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured size cap."""
+
+    def __init__(self, url: str, limit: int):
+        self.url = url
+        self.limit = limit
+        super().__init__(f"Response from {url} exceeds {limit} bytes")
+
+
+@dataclass
+class FetchResult:
+    """A fetched page."""
+
+    url: str
+    text: str
+    content_type: str
+    revalidated: bool = False
+
+
+@dataclass
+class _CachedPage:
+    etag: str | None
+    last_modified: str | None
+    text: str
+    content_type: str
+    size: int  # bytes of the response body, counted against the cache cap
+
+
+class SharedHttpClient:
+    """Pooled async HTTP client with per-host limits and revalidation.
+
+    The underlying ``httpx.AsyncClient`` is created lazily on first use (or
+    explicitly via ``start()`` from the app lifespan) and recreated if the
+    running event loop changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float,
+        max_redirects: int,
+        max_connections: int,
+        max_connections_per_host: int,
+        max_response_bytes: int,
+        revalidation_cache_size: int,
+        revalidation_cache_bytes: int,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the client wrapper.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_redirects: Maximum redirects to follow.
+            max_connections: Total connection pool size.
+            max_connections_per_host: Concurrent requests allowed per host.
+            max_response_bytes: Maximum response body size.
+            revalidation_cache_size: Number of pages kept for conditional GET.
+            revalidation_cache_bytes: Total body size of the kept pages.
+            http2: Negotiate HTTP/2 if the ``h2`` package is available.
+            transport: Optional transport override (used in tests).
+        """
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.max_connections = max(1, max_connections)
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.max_response_bytes = max_response_bytes
+        self.revalidation_cache_size = revalidation_cache_size
+        self.revalidation_cache_bytes = revalidation_cache_bytes
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._pages: OrderedDict[str, _CachedPage] = OrderedDict()
+        self._pages_bytes = 0
+
+    def start(self) -> httpx.AsyncClient:
+        """Create the underlying client on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                max_redirects=self.max_redirects,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+            self._loop = loop
+            self._host_semaphores = {}
+            logger.info(
+                f"Started shared HTTP client (http2={self.http2}, "
+                f"max_connections={self.max_connections})"
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying client and drop pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+        self._host_semaphores = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _remember(self, url: str, page: _CachedPage) -> None:
+        if self.revalidation_cache_size <= 0:
+            return
+        if page.size > self.revalidation_cache_bytes:
+            return
+        previous = self._pages.pop(url, None)
+        if previous is not None:
+            self._pages_bytes -= previous.size
+        self._pages[url] = page
+        self._pages_bytes += page.size
+        while (
+            len(self._pages) > self.revalidation_cache_size
+            or self._pages_bytes > self.revalidation_cache_bytes
+        ):
+            _, evicted = self._pages.popitem(last=False)
+            self._pages_bytes -= evicted.size
+
+    async def fetch_text(self, url: str, headers: dict[str, str]) -> FetchResult:
+        """GET a URL and return its decoded body.
+
+        If the page was fetched before and the server supplied an ETag or
+        Last-Modified header, the request is sent as a conditional GET and a
+        304 response is served from the local copy.
+
+        Args:
+            url: The URL to fetch.
+            headers: Request headers.
+
+        Returns:
+            FetchResult with the decoded body.
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds max_response_bytes.
+            httpx.HTTPStatusError: For 4xx/5xx responses.
+            httpx.HTTPError: For timeouts and transport errors.
+        """
+        client = self.start()
+        request_headers = dict(headers)
+        cached = self._pages.get(url)
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        async with (
+            self._host_semaphore(url),
+            client.stream("GET", url, headers=request_headers) as response,
+        ):
+            if response.status_code == 304 and cached is not None:
+                self._pages.move_to_end(url)
+                logger.debug(f"Revalidated cached copy of {url}")
+                return FetchResult(
+                    url=url,
+                    text=cached.text,
+                    content_type=cached.content_type,
+                    revalidated=True,
+                )
+
+            response.raise_for_status()
+
+            content_length = response.headers.get("content-length")
+            if (
+                content_length
+                and content_length.isdigit()
+                and int(content_length) > self.max_response_bytes
+            ):
+                raise ResponseTooLargeError(url, self.max_response_bytes)
+
+            chunks: list[bytes] = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > self.max_response_bytes:
+                    raise ResponseTooLargeError(url, self.max_response_bytes)
+                chunks.append(chunk)
+
+            text = b"".join(chunks).decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+            content_type = response.headers.get("content-type", "")
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+
+        if etag or last_modified:
+            self._remember(
+                url,
+                _CachedPage(
+                    etag=etag,
+                    last_modified=last_modified,
+                    text=text,
+                    content_type=content_type,
+                    size=received,
+                ),
+            )
+        return FetchResult(url=url, text=text, content_type=content_type)
+
+
+_settings = get_settings()
+
+http_client = SharedHttpClient(
+    timeout=HTTP_TIMEOUT_SECONDS,
+    max_redirects=HTTP_MAX_REDIRECTS,
+    max_connections=_settings.http_max_connections,
+    max_connections_per_host=_settings.http_max_connections_per_host,
+    max_response_bytes=_settings.http_max_response_mb * 1024 * 1024,
+    revalidation_cache_size=_settings.http_revalidation_cache_size,
+    revalidation_cache_bytes=_settings.http_revalidation_cache_mb * 1024 * 1024,
+    http2=_settings.http_enable_http2,
+)
@@ -0,0 +1,128 @@
+"""Shared KPI aggregation for analytics, dashboard and insights.
+
+All headline counts for a user are computed in a single conditional
+aggregation (one ``SUM(CASE ...)`` per KPI) instead of one ``COUNT`` round
+trip per KPI. The aggregation reads the per-day rollup in
+``daily_application_stats``, so its cost grows with the number of active
+days rather than the number of applications.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import ApplicationStatus, DailyApplicationStats
+
+# Far past date for "all time" queries
+FAR_PAST_DATE = date(2000, 1, 1)
+
+PERIOD_DAYS = {"7d": 7, "30d": 30, "3m": 90}
+DEFAULT_PERIOD_DAYS = 30
+
+INACTIVE_STATUSES = ("Rejected", "Withdrawn")
+
+
+def period_start_date(period: str, today: date | None = None) -> date:
+    """Resolve an analytics period (7d, 30d, 3m, all) to its start date.
+
+    Unknown periods fall back to 30 days.
+    """
+    today = today or date.today()
+    if period == "all":
+        return FAR_PAST_DATE
+    return today - timedelta(days=PERIOD_DAYS.get(period, DEFAULT_PERIOD_DAYS))
+
+
+@dataclass
+class KPICounts:
+    """Application counts for one user, from a single aggregate query."""
+
+    # Scoped to the requested period
+    total: int = 0
+    interviews: int = 0
+    offers: int = 0
+    responded: int = 0
+    active: int = 0
+    # Not scoped to the period
+    active_all_time: int = 0
+    last_7_days: int = 0
+    previous_7_days: int = 0
+    last_30_days: int = 0
+    previous_30_days: int = 0
+
+    def rate(self, count: int) -> float:
+        """Percentage of the period's applications, rounded to 0.1."""
+        return round(count / self.total * 100, 1) if self.total > 0 else 0
+
+    @property
+    def interview_rate(self) -> float:
+        return self.rate(self.interviews)
+
+    @property
+    def response_rate(self) -> float:
+        return self.rate(self.responded)
+
+
+def _count_if(condition: ColumnElement[bool]) -> ColumnElement[int]:
+    count = DailyApplicationStats.applications
+    return func.coalesce(func.sum(case((condition, count), else_=0)), 0)
+
+
+async def compute_kpis(
+    db: AsyncSession,
+    user_id: str,
+    start_date: date = FAR_PAST_DATE,
+    today: date | None = None,
+) -> KPICounts:
+    """Compute every KPI count for a user in one query.
+
+    Args:
+        db: Database session.
+        user_id: The user whose applications are counted.
+        start_date: Start of the analytics period (inclusive).
+        today: Reference date for the rolling 7/30-day windows.
+
+    Returns:
+        KPICounts for the user.
+    """
+    today = today or date.today()
+    last_7_start = today - timedelta(days=6)
+    previous_7_start = last_7_start - timedelta(days=7)
+    last_30_start = today - timedelta(days=29)
+    previous_30_start = last_30_start - timedelta(days=30)
+
+    applied_at = DailyApplicationStats.day
+    status_name = ApplicationStatus.name
+    in_period = applied_at >= start_date
+    is_active = status_name.not_in(INACTIVE_STATUSES)
+
+    result = await db.execute(
+        select(
+            _count_if(in_period).label("total"),
+            _count_if(and_(in_period, status_name == "Interviewing")).label(
+                "interviews"
+            ),
+            _count_if(and_(in_period, status_name == "Offer")).label("offers"),
+            _count_if(and_(in_period, status_name != "No Reply")).label("responded"),
+            _count_if(and_(in_period, is_active)).label("active"),
+            _count_if(is_active).label("active_all_time"),
+            _count_if(applied_at.between(last_7_start, today)).label("last_7_days"),
+            _count_if(
+                applied_at.between(previous_7_start, last_7_start - timedelta(days=1))
+            ).label("previous_7_days"),
+            _count_if(applied_at.between(last_30_start, today)).label("last_30_days"),
+            _count_if(
+                applied_at.between(previous_30_start, last_30_start - timedelta(days=1))
+            ).label("previous_30_days"),
+        )
+        .select_from(DailyApplicationStats)
+        .outerjoin(
+            ApplicationStatus, DailyApplicationStats.status_id == ApplicationStatus.id
+        )
+        .where(DailyApplicationStats.user_id == user_id)
+    )
+    row = result.one()
+    return KPICounts(**{key: int(value or 0) for key, value in row._mapping.items()})
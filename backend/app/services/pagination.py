@@ -0,0 +1,148 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+``OFFSET`` pagination reads and discards every row before the requested
+page, so deep pages get slower as a list grows. Keyset pagination instead
+remembers the sort key of the last row served and asks for rows strictly
+after it, which an index on the sort columns answers directly. Every page
+then costs the same as the first.
+
+Cursors are opaque to clients: the sort key values of the last row,
+JSON-encoded and base64url-wrapped. The sort key must end in a unique
+column (the primary key) so that rows with equal timestamps are neither
+skipped nor repeated.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row on a page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, date) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable[[Any], Any]]) -> list[Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page.
+        parsers: One callable per sort key value, e.g. date.fromisoformat.
+
+    Returns:
+        The parsed sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the sort key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise ValueError("Invalid cursor")
+    try:
+        return [parse(value) for parse, value in zip(parsers, values, strict=True)]
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def after_cursor(
+    columns: Sequence[ColumnElement[Any]], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Filter for rows after a cursor when sorting by columns descending.
+
+    Uses a row-value comparison, which SQLite and PostgreSQL can both
+    answer from a composite index on the same columns.
+    """
+    bound = [
+        literal(value, column.type)
+        for column, value in zip(columns, values, strict=True)
+    ]
+    return tuple_(*columns) < tuple_(*bound)
+
+
+@dataclass
+class Page:
+    """One page of rows, the total if counted, and the next page's cursor."""
+
+    items: list[Any]
+    total: int | None
+    next_cursor: str | None
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select[Any],
+    columns: Sequence[ColumnElement[Any]],
+    parsers: Sequence[Callable[[Any], Any]],
+    *,
+    per_page: int,
+    page: int = 1,
+    cursor: str | None = None,
+    count: bool = True,
+) -> Page:
+    """Fetch one page of a query, newest first by the given sort key.
+
+    With a cursor the page starts after the cursor's row and ``page`` is
+    ignored; otherwise ``page`` selects an offset page. Either way the
+    result carries a cursor for the following page, so clients can switch
+    to keyset paging after the first request.
+
+    Args:
+        db: Database session.
+        query: Filtered select of one ORM entity, without ordering.
+        columns: Sort key columns or expressions, ending in a unique column.
+        parsers: One callable per column to parse cursor values.
+        per_page: Page size.
+        page: 1-indexed page number when no cursor is given.
+        cursor: Cursor from a previous page.
+        count: Whether to run a COUNT over the whole result. When False,
+            the total is still reported if the first page holds every row.
+
+    Returns:
+        The page.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    total = None
+    if count:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    query = query.order_by(*(column.desc() for column in columns))
+    if cursor is not None:
+        query = query.where(after_cursor(columns, decode_cursor(cursor, parsers)))
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    # Select the key alongside each row, as it may include computed columns
+    result = await db.execute(query.add_columns(*columns).limit(per_page + 1))
+    rows = result.all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    if total is None and not has_more and cursor is None and page == 1:
+        total = len(rows)
+    next_cursor = encode_cursor(rows[-1][1:]) if has_more else None
+    return Page(items=[row[0] for row in rows], total=total, next_cursor=next_cursor)
@@ -0,0 +1,162 @@
+"""Storage helpers for resumable (tus-style) round media uploads.
+
+The HTTP side lives in ``app.api.media_uploads``; this module owns where
+partial files are kept and how abandoned uploads are cleaned up. Expired
+uploads are swept on startup and whenever a new upload is created, and the
+sweep can also be run as a command, e.g. from cron::
+
+    python -m app.services.resumable_uploads
+"""
+
+import asyncio
+import base64
+import binascii
+import contextlib
+import hashlib
+import logging
+import os
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models import MediaUpload
+
+logger = logging.getLogger(__name__)
+
+TUS_VERSION = "1.0.0"
+
+_HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+_PARTIAL_DIR = ".partial"
+
+# Partial files are created just before their row is committed, so one
+# without a row is only treated as orphaned once it is this old
+_ORPHAN_GRACE = timedelta(hours=1)
+
+
+def partial_path(upload_id: str) -> str:
+    """Path of the file holding the bytes received so far for an upload."""
+    return os.path.join(get_settings().upload_dir, _PARTIAL_DIR, f"{upload_id}.part")
+
+
+def upload_expiry() -> datetime:
+    """Expiry time for an upload that has just received data."""
+    hours = get_settings().media_upload_expiry_hours
+    return datetime.now(UTC) + timedelta(hours=hours)
+
+
+def parse_upload_metadata(header: str | None) -> dict[str, str]:
+    """Parse a tus ``Upload-Metadata`` header.
+
+    The header is a comma-separated list of ``key base64(value)`` pairs;
+    the value may be omitted.
+
+    Args:
+        header: Raw header value, if present.
+
+    Returns:
+        Decoded metadata by key.
+
+    Raises:
+        ValueError: If a value is not valid base64 or UTF-8.
+    """
+    metadata: dict[str, str] = {}
+    for pair in (header or "").split(","):
+        key, _, value = pair.strip().partition(" ")
+        if not key:
+            continue
+        try:
+            metadata[key] = base64.b64decode(value, validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid Upload-Metadata value for {key!r}") from e
+    return metadata
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file, read in chunks. Blocking; run in a thread."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remove_partial(upload_id: str) -> None:
+    """Delete an upload's partial file if it exists."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(partial_path(upload_id))
+
+
+def _remove_orphaned_partials(live_ids: set[str], cutoff: float) -> int:
+    """Delete partial files without an upload row. Blocking; run in a thread.
+
+    Rows go away without the application seeing it when the round, its
+    application or the user is deleted (ON DELETE CASCADE), which leaves
+    their partial files behind.
+    """
+    directory = os.path.join(get_settings().upload_dir, _PARTIAL_DIR)
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return 0
+
+    removed = 0
+    for name in names:
+        upload_id, ext = os.path.splitext(name)
+        if ext != ".part" or upload_id in live_ids:
+            continue
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) >= cutoff:
+                continue
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+async def sweep_expired_uploads(db: AsyncSession) -> int:
+    """Delete expired uploads and their partial files.
+
+    Partial files whose upload row no longer exists are removed as well.
+
+    Args:
+        db: Database session. The deletion is committed before returning.
+
+    Returns:
+        Number of uploads removed, not counting orphaned partial files.
+    """
+    now = datetime.now(UTC)
+    result = await db.execute(
+        select(MediaUpload.id).where(MediaUpload.expires_at < now)
+    )
+    upload_ids = list(result.scalars())
+    if upload_ids:
+        await db.execute(delete(MediaUpload).where(MediaUpload.id.in_(upload_ids)))
+        await db.commit()
+        for upload_id in upload_ids:
+            remove_partial(upload_id)
+        logger.info(f"Removed {len(upload_ids)} expired media uploads")
+
+    live_ids = set((await db.execute(select(MediaUpload.id))).scalars())
+    orphaned = await asyncio.to_thread(
+        _remove_orphaned_partials, live_ids, (now - _ORPHAN_GRACE).timestamp()
+    )
+    if orphaned:
+        logger.info(f"Removed {orphaned} partial files without an upload")
+    return len(upload_ids)
+
+
+async def _main() -> None:
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as db:
+        await sweep_expired_uploads(db)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
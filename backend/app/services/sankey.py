@@ -0,0 +1,236 @@
+"""Status-transition Sankey diagram for analytics.
+
+Each application's status history is a path through the user's statuses.
+Links count how many applications took each step, with these rules:
+
+- An application's first transition always starts at the "Applications"
+  source node.
+- Terminal statuses (Rejected, Withdrawn) get one node per stage they were
+  reached from, so drop-off is visible per stage.
+- A transition back into a status the application already visited is not
+  counted, which keeps the diagram acyclic.
+
+Applications that never revisit a status are counted in the database as a
+grouped ``(first, from, to)`` count. Only applications with a revisit need
+their full, ordered history, since only for them does the cycle rule depend
+on order. The builder then makes one pass over the transitions, keyed by
+status id.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models import Application, ApplicationStatus, ApplicationStatusHistory
+from app.schemas.analytics import SankeyData, SankeyLink, SankeyNode
+
+TERMINAL_STATUSES = {"Rejected", "Withdrawn"}
+
+SOURCE_NODE_ID = "applications"
+
+# Placeholder color, the frontend applies theme-aware colors
+FALLBACK_COLOR = "#8ec07c"
+
+
+@dataclass
+class Transition:
+    """A status change, or a group of identical ones."""
+
+    is_first: bool
+    from_status_id: str | None
+    from_name: str | None
+    from_color: str | None
+    to_status_id: str
+    to_name: str
+    to_color: str | None
+    count: int = 1
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_").replace("/", "_")
+
+
+class _SankeyBuilder:
+    """Builds nodes and links from transitions in a single pass each."""
+
+    def __init__(self) -> None:
+        self.names: dict[str, str] = {}
+        self.colors: dict[str, str | None] = {}
+        # terminal status id -> ids of the stages it was reached from
+        self.terminal_sources: dict[str, set[str]] = defaultdict(set)
+        self.status_nodes: dict[str, str] = {}
+        self.terminal_nodes: dict[tuple[str, str], str] = {}
+        self.link_counts: dict[tuple[str, str], int] = defaultdict(int)
+
+    def observe(self, t: Transition) -> None:
+        """Record the statuses and terminal edges a transition touches."""
+        if t.from_status_id is not None:
+            self.names.setdefault(t.from_status_id, t.from_name or "")
+            if self.colors.get(t.from_status_id) is None:
+                self.colors[t.from_status_id] = t.from_color
+        self.names.setdefault(t.to_status_id, t.to_name)
+        if self.colors.get(t.to_status_id) is None:
+            self.colors[t.to_status_id] = t.to_color
+        if t.to_name in TERMINAL_STATUSES and t.from_status_id is not None:
+            self.terminal_sources[t.to_status_id].add(t.from_status_id)
+
+    def build_nodes(self) -> list[SankeyNode]:
+        """Create the source node plus one node per status (or stage)."""
+        nodes: dict[str, SankeyNode] = {
+            SOURCE_NODE_ID: SankeyNode(
+                id=SOURCE_NODE_ID, name="Applications", color=FALLBACK_COLOR
+            )
+        }
+        for status_id in sorted(self.names, key=self.names.__getitem__):
+            name = self.names[status_id]
+            color = self.colors.get(status_id) or FALLBACK_COLOR
+            if status_id in self.terminal_sources:
+                sources = sorted(
+                    self.terminal_sources[status_id], key=self.names.__getitem__
+                )
+                for from_id in sources:
+                    node_id = f"terminal_{name.lower()}_{_slug(self.names[from_id])}"
+                    self.terminal_nodes[(from_id, status_id)] = node_id
+                    nodes.setdefault(
+                        node_id, SankeyNode(id=node_id, name=name, color=color)
+                    )
+            else:
+                node_id = f"status_{_slug(name)}"
+                self.status_nodes[status_id] = node_id
+                nodes.setdefault(
+                    node_id, SankeyNode(id=node_id, name=name, color=color)
+                )
+        return list(nodes.values())
+
+    def link(self, t: Transition) -> bool:
+        """Count a transition as a link; False if it has no node to attach to."""
+        if t.is_first or t.from_status_id is None:
+            source = SOURCE_NODE_ID
+        else:
+            source = self.status_nodes.get(t.from_status_id)
+            if source is None:
+                return False
+
+        if t.to_name in TERMINAL_STATUSES and t.from_status_id is not None:
+            target = self.terminal_nodes.get((t.from_status_id, t.to_status_id))
+        else:
+            target = self.status_nodes.get(t.to_status_id)
+        if target is None:
+            return False
+
+        self.link_counts[(source, target)] += t.count
+        return True
+
+
+def build_sankey(
+    grouped: Iterable[Transition],
+    journeys: Iterable[list[Transition]],
+) -> SankeyData:
+    """Build Sankey nodes and links.
+
+    Args:
+        grouped: Pre-aggregated transitions from applications that never
+            revisit a status (the cycle rule cannot apply to them).
+        journeys: Ordered transitions of each remaining application.
+
+    Returns:
+        SankeyData with one node per status and counted links.
+    """
+    grouped = list(grouped)
+    journeys = list(journeys)
+    if not grouped and not journeys:
+        return SankeyData(nodes=[], links=[])
+
+    builder = _SankeyBuilder()
+    for t in grouped:
+        builder.observe(t)
+    for journey in journeys:
+        for t in journey:
+            builder.observe(t)
+
+    nodes = builder.build_nodes()
+
+    for t in grouped:
+        builder.link(t)
+    for journey in journeys:
+        visited: set[str] = set()
+        for t in journey:
+            if t.to_status_id in visited:
+                continue
+            if builder.link(t):
+                visited.add(t.to_status_id)
+
+    links = [
+        SankeyLink(source=source, target=target, value=count)
+        for (source, target), count in builder.link_counts.items()
+    ]
+    return SankeyData(nodes=nodes, links=links)
+
+
+async def get_sankey(db: AsyncSession, user_id: str) -> SankeyData:
+    """Load a user's status transitions and build the Sankey diagram.
+
+    Args:
+        db: Database session.
+        user_id: The user whose application histories are used.
+
+    Returns:
+        SankeyData for the user.
+    """
+    history = ApplicationStatusHistory
+    ordering = (history.changed_at, history.id)
+    ranked = (
+        select(
+            history.application_id,
+            history.from_status_id,
+            history.to_status_id,
+            func.row_number()
+            .over(partition_by=history.application_id, order_by=ordering)
+            .label("position"),
+            func.count()
+            .over(partition_by=(history.application_id, history.to_status_id))
+            .label("visits"),
+        )
+        .join(Application, history.application_id == Application.id)
+        .where(Application.user_id == user_id)
+        .subquery()
+    )
+    revisiting = select(ranked.c.application_id).where(ranked.c.visits > 1)
+
+    from_status = aliased(ApplicationStatus)
+    to_status = aliased(ApplicationStatus)
+    is_first = (ranked.c.position == 1).label("is_first")
+    columns = (
+        ranked.c.from_status_id,
+        from_status.name,
+        from_status.color,
+        ranked.c.to_status_id,
+        to_status.name,
+        to_status.color,
+    )
+
+    grouped_rows = await db.execute(
+        select(is_first, *columns, func.count())
+        .join(to_status, ranked.c.to_status_id == to_status.id)
+        .outerjoin(from_status, ranked.c.from_status_id == from_status.id)
+        .where(ranked.c.application_id.not_in(revisiting))
+        .group_by(is_first, *columns)
+    )
+    grouped = [Transition(*row) for row in grouped_rows]
+
+    journey_rows = await db.execute(
+        select(ranked.c.application_id, is_first, *columns)
+        .join(to_status, ranked.c.to_status_id == to_status.id)
+        .outerjoin(from_status, ranked.c.from_status_id == from_status.id)
+        .where(ranked.c.application_id.in_(revisiting))
+        .order_by(ranked.c.application_id, ranked.c.position)
+    )
+    journeys: dict[str, list[Transition]] = defaultdict(list)
+    for application_id, *fields in journey_rows:
+        journeys[application_id].append(Transition(*fields))
+
+    return build_sankey(grouped, journeys.values())
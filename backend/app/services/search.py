@@ -0,0 +1,167 @@
+"""Ranked full-text search over applications and job leads.
+
+Queries run against the index maintained in ``app.models.search_index``.
+User input is split into words, and every word must match as a prefix, so
+search-as-you-type finds "Acme" from "ac". Results are ranked so matches
+in the company or job title come before matches in the description.
+
+The index can be rebuilt from the source tables, as a repair after bulk
+writes or as a backfill, by running::
+
+    python -m app.services.search            # every user
+    python -m app.services.search --user-id <id>
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    Subquery,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Application, JobLead
+from app.models.search_index import (
+    APPLICATION,
+    FTS_TABLE,
+    JOB_LEAD,
+    TS_CONFIG,
+    SearchDocument,
+    application_document,
+    job_lead_document,
+)
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of title matches in SQLite's bm25 (PostgreSQL uses 'A'/'B')
+TITLE_WEIGHT = 10.0
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(text: str) -> list[str]:
+    """Split user input into lowercase search words, dropping punctuation."""
+    return _WORD.findall(text.lower())
+
+
+def search_matches(dialect: str, kind: str, user_id: str, text: str) -> Subquery | None:
+    """Build a subquery of matching document ids and their rank.
+
+    Args:
+        dialect: Database dialect name.
+        kind: APPLICATION or JOB_LEAD.
+        user_id: Owner of the documents searched.
+        text: User search input.
+
+    Returns:
+        Subquery with ``doc_id`` and ``rank`` columns, higher rank meaning a
+        better match, or None if the input has no searchable words.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return None
+
+    docs = SearchDocument
+    query = select(docs.doc_id).where(docs.kind == kind, docs.user_id == user_id)
+
+    if dialect == "sqlite":
+        fts = table(FTS_TABLE, column("rowid", Integer))
+        match = " ".join(f'"{term}"*' for term in terms)
+        # bm25 is lower for better matches; negate so higher ranks first
+        rank = -func.bm25(literal_column(FTS_TABLE), TITLE_WEIGHT, 1.0)
+        query = (
+            query.add_columns(rank.label("rank"))
+            .join(fts, fts.c.rowid == docs.id)
+            .where(literal_column(FTS_TABLE).op("MATCH")(match))
+        )
+    elif dialect == "postgresql":
+        # Constants are inlined so the expression matches the GIN index
+        config = literal_column(f"'{TS_CONFIG}'::regconfig")
+        document = func.setweight(
+            func.to_tsvector(config, docs.title), literal_column("'A'")
+        ).op("||")(
+            func.setweight(func.to_tsvector(config, docs.body), literal_column("'B'"))
+        )
+        tsquery = func.to_tsquery(config, " & ".join(f"{term}:*" for term in terms))
+        query = query.add_columns(func.ts_rank(document, tsquery).label("rank")).where(
+            document.op("@@")(tsquery)
+        )
+    else:
+        conditions = [
+            or_(docs.title.ilike(f"%{term}%"), docs.body.ilike(f"%{term}%"))
+            for term in terms
+        ]
+        query = query.add_columns(literal_column("0.0", Float).label("rank")).where(
+            *conditions
+        )
+
+    return query.subquery()
+
+
+async def rebuild_search_index(db: AsyncSession, user_id: str | None = None) -> int:
+    """Recompute search documents from applications and job leads.
+
+    Args:
+        db: Database session. The rebuild is committed before returning.
+        user_id: Only rebuild this user's documents; all users if None.
+
+    Returns:
+        Number of documents written.
+    """
+    clear = delete(SearchDocument)
+    applications = select(Application)
+    job_leads = select(JobLead)
+    if user_id is not None:
+        clear = clear.where(SearchDocument.user_id == user_id)
+        applications = applications.where(Application.user_id == user_id)
+        job_leads = job_leads.where(JobLead.user_id == user_id)
+    await db.execute(clear)
+
+    rows = []
+    for kind, query, document in (
+        (APPLICATION, applications, application_document),
+        (JOB_LEAD, job_leads, job_lead_document),
+    ):
+        async for row in await db.stream_scalars(query):
+            title, body = document(row)
+            rows.append(
+                {
+                    "kind": kind,
+                    "doc_id": row.id,
+                    "user_id": row.user_id,
+                    "title": title,
+                    "body": body,
+                }
+            )
+    if rows:
+        await db.execute(insert(SearchDocument), rows)
+    await db.commit()
+    return len(rows)
+
+
+async def _main(user_id: str | None) -> None:
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as db:
+        written = await rebuild_search_index(db, user_id)
+    logger.info(f"Rebuilt search index: {written} documents")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the full-text search index.")
+    parser.add_argument("--user-id", help="Only rebuild this user's documents")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args.user_id))
@@ -0,0 +1,292 @@
+"""Deterministic extraction of schema.org JobPosting data.
+
+Many job boards (Greenhouse, Lever, Workday, LinkedIn, ...) embed a
+schema.org ``JobPosting`` as JSON-LD for search engines, and most pages
+carry OpenGraph tags. When that metadata already holds the title, company
+and description, parsing it is enough and the LLM call can be skipped; when
+it is partial, its description is a much smaller prompt than the whole page.
+
+Parsing uses regular expressions over the raw HTML rather than a DOM parse
+so it stays cheap enough to run on the event loop.
+"""
+
+import contextlib
+import html as html_lib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from markdownify import markdownify as md
+
+from app.schemas.job_lead import JobLeadExtractionInput
+
+logger = logging.getLogger(__name__)
+
+_JSON_LD_RE = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+_META_RE = re.compile(r"<meta\s[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"([a-zA-Z:_-]+)\s*=\s*(\"[^\"]*\"|'[^']*')")
+
+# Salaries quoted per hour/week/month do not fit the annual salary fields
+_ANNUAL_UNITS = {None, "", "YEAR", "ANNUAL"}
+
+
+@dataclass
+class StructuredJobData:
+    """Job data parsed from embedded page metadata."""
+
+    job_data: JobLeadExtractionInput
+    origin: str
+
+    @property
+    def is_complete(self) -> bool:
+        """True if the metadata alone is good enough to skip the LLM."""
+        return bool(
+            self.job_data.title and self.job_data.company and self.job_data.description
+        )
+
+    def to_prompt_text(self) -> str:
+        """Render the parsed fields as compact text for a reduced LLM prompt."""
+        data = self.job_data
+        lines = [
+            f"{label}: {value}"
+            for label, value in (
+                ("Title", data.title),
+                ("Company", data.company),
+                ("Location", data.location),
+            )
+            if value
+        ]
+        if data.description:
+            lines.append("")
+            lines.append(data.description)
+        return "\n".join(lines)
+
+    def merge_into(self, result: JobLeadExtractionInput) -> JobLeadExtractionInput:
+        """Fill the fields an LLM result left empty from the parsed metadata.
+
+        The model saw the parsed fields in its prompt, so what it returned is
+        kept; the metadata only supplies what it missed. Page-level tags such
+        as og:title are often decorated ("Job Title | Company Careers") and
+        must not replace a cleaner answer.
+        """
+        parsed = self.job_data.model_dump(exclude_defaults=True)
+        missing = {
+            field: value
+            for field, value in parsed.items()
+            if getattr(result, field) in (None, "", [])
+        }
+        return result.model_copy(update=missing)
+
+
+def extract_structured_job_data(html: str) -> StructuredJobData | None:
+    """Parse schema.org JobPosting JSON-LD and OpenGraph tags from a page.
+
+    Args:
+        html: Raw HTML of the job posting page.
+
+    Returns:
+        StructuredJobData, or None if the page has no usable metadata.
+    """
+    if not html:
+        return None
+
+    fields: dict[str, Any] = {}
+    origin = None
+
+    posting = _find_job_posting(html)
+    if posting is not None:
+        fields = _job_posting_fields(posting)
+        origin = "json-ld"
+
+    og = _opengraph(html)
+    if og.get("title") and not fields.get("title"):
+        fields["title"] = og["title"]
+        origin = origin or "opengraph"
+
+    if not fields:
+        return None
+
+    try:
+        job_data = JobLeadExtractionInput(**fields)
+    except ValueError as e:
+        logger.debug(f"Discarding structured data that failed validation: {e}")
+        return None
+
+    return StructuredJobData(job_data=job_data, origin=origin or "opengraph")
+
+
+def _find_job_posting(html: str) -> dict[str, Any] | None:
+    """Return the first JobPosting object found in the page's JSON-LD."""
+    for match in _JSON_LD_RE.finditer(html):
+        raw = match.group(1).strip()
+        if raw.startswith("<!--"):
+            raw = raw.removeprefix("<!--").removesuffix("-->").strip()
+        try:
+            document = json.loads(raw, strict=False)
+        except json.JSONDecodeError:
+            continue
+        posting = _search_job_posting(document)
+        if posting is not None:
+            return posting
+    return None
+
+
+def _search_job_posting(node: Any) -> dict[str, Any] | None:
+    """Depth-first search for a node whose @type is JobPosting."""
+    if isinstance(node, list):
+        for item in node:
+            found = _search_job_posting(item)
+            if found is not None:
+                return found
+    elif isinstance(node, dict):
+        node_type = node.get("@type")
+        types = node_type if isinstance(node_type, list) else [node_type]
+        if "JobPosting" in types:
+            return node
+        if "@graph" in node:
+            return _search_job_posting(node["@graph"])
+    return None
+
+
+def _job_posting_fields(posting: dict[str, Any]) -> dict[str, Any]:
+    """Map a schema.org JobPosting onto JobLeadExtractionInput fields."""
+    fields: dict[str, Any] = {}
+
+    title = _text(posting.get("title"))
+    if title:
+        fields["title"] = title
+
+    organization = posting.get("hiringOrganization")
+    company = _text(
+        organization.get("name") if isinstance(organization, dict) else organization
+    )
+    if company:
+        fields["company"] = company
+
+    description = _text(posting.get("description"))
+    if description:
+        markdown = md(description)
+        fields["description"] = re.sub(r"\n{3,}", "\n\n", markdown).strip()
+
+    location = _location(posting)
+    if location:
+        fields["location"] = location
+
+    fields.update(_salary(posting.get("baseSalary")))
+
+    posted = _text(posting.get("datePosted"))
+    if posted:
+        with contextlib.suppress(ValueError):
+            fields["posted_date"] = date.fromisoformat(posted[:10])
+
+    experience = posting.get("experienceRequirements")
+    if isinstance(experience, dict):
+        months = _number(experience.get("monthsOfExperience"))
+        if months is not None:
+            fields["years_experience_min"] = months // 12
+
+    skills = posting.get("skills")
+    if isinstance(skills, str):
+        skills = [skill.strip() for skill in skills.split(",")]
+    if isinstance(skills, list):
+        cleaned = [_text(skill) for skill in skills]
+        fields["skills"] = [skill for skill in cleaned if skill]
+
+    return fields
+
+
+def _location(posting: dict[str, Any]) -> str | None:
+    """Build a location string from jobLocation / jobLocationType."""
+    places = posting.get("jobLocation")
+    if isinstance(places, dict):
+        places = [places]
+
+    locations: list[str] = []
+    for place in places or []:
+        address = place.get("address") if isinstance(place, dict) else place
+        if isinstance(address, dict):
+            parts = [
+                _text(address.get(key))
+                for key in ("addressLocality", "addressRegion", "addressCountry")
+            ]
+            text = ", ".join(dict.fromkeys(part for part in parts if part))
+        else:
+            text = _text(address)
+        if text and text not in locations:
+            locations.append(text)
+
+    if locations:
+        return "; ".join(locations)
+    if _text(posting.get("jobLocationType")) == "TELECOMMUTE":
+        return "Remote"
+    return None
+
+
+def _salary(base_salary: Any) -> dict[str, Any]:
+    """Extract annual salary fields from a MonetaryAmount."""
+    if not isinstance(base_salary, dict):
+        return {}
+
+    value = base_salary.get("value")
+    if isinstance(value, dict):
+        unit = _text(value.get("unitText"))
+        minimum = _number(value.get("minValue"))
+        maximum = _number(value.get("maxValue"))
+        if minimum is None and maximum is None:
+            minimum = maximum = _number(value.get("value"))
+    else:
+        unit = _text(base_salary.get("unitText"))
+        minimum = maximum = _number(value)
+
+    if (unit or "").upper() not in _ANNUAL_UNITS or minimum is None:
+        return {}
+
+    fields: dict[str, Any] = {"salary_min": minimum}
+    if maximum is not None and maximum >= minimum:
+        fields["salary_max"] = maximum
+    currency = _text(base_salary.get("currency"))
+    if currency:
+        fields["salary_currency"] = currency.upper()
+    return fields
+
+
+def _opengraph(html: str) -> dict[str, str]:
+    """Collect og:* meta tags, keyed without the og: prefix."""
+    tags: dict[str, str] = {}
+    for tag in _META_RE.finditer(html):
+        attrs = {
+            name.lower(): html_lib.unescape(value[1:-1])
+            for name, value in _ATTR_RE.findall(tag.group(0))
+        }
+        prop = attrs.get("property") or attrs.get("name") or ""
+        if prop.startswith("og:") and attrs.get("content"):
+            tags.setdefault(prop[3:], attrs["content"].strip())
+    return tags
+
+
+def _text(value: Any) -> str | None:
+    """Return a stripped string, or None for empty/non-string values."""
+    if isinstance(value, str):
+        value = html_lib.unescape(value).strip()
+        return value or None
+    return None
+
+
+def _number(value: Any) -> int | None:
+    """Parse an int from a JSON number or numeric string."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(float(value.replace(",", "")))
+        except ValueError:
+            return None
+    return None
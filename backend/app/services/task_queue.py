@@ -0,0 +1,143 @@
+"""In-process background task queue with a bounded worker pool.
+
+Used to run slow work (e.g. job-lead fetch + LLM extraction) after the
+request that triggered it has already returned. Tasks are keyed so that
+clients can long-poll for completion of a specific task.
+
+The queue lives in process memory: queued tasks are lost on restart, so
+callers must persist enough state to detect and recover interrupted work.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+class TaskQueueFullError(Exception):
+    """Raised when a task is submitted to a queue that is at capacity."""
+
+    pass
+
+
+@dataclass
+class _QueuedTask:
+    """A unit of work waiting for a free worker."""
+
+    key: str
+    factory: Callable[[], Awaitable[None]]
+
+
+class BackgroundTaskQueue:
+    """Bounded asyncio queue drained by a fixed number of worker tasks.
+
+    Workers are started lazily on the first submit, on whatever event loop
+    is running at the time, and restarted if the loop changes.
+    """
+
+    def __init__(self, name: str, workers: int, maxsize: int):
+        """
+        Initialize the queue.
+
+        Args:
+            name: Name used in log messages.
+            workers: Number of tasks processed concurrently.
+            maxsize: Maximum number of queued (not yet started) tasks.
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.maxsize = max(1, maxsize)
+        self._queue: asyncio.Queue[_QueuedTask] | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[str, asyncio.Event] = {}
+
+    def _ensure_started(self) -> asyncio.Queue[_QueuedTask]:
+        """Start the worker pool on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._loop = loop
+            self._pending = {}
+            self._worker_tasks = [
+                loop.create_task(self._worker(i), name=f"{self.name}-worker-{i}")
+                for i in range(self.workers)
+            ]
+            logger.info(f"Started {self.workers} workers for queue '{self.name}'")
+        return self._queue
+
+    def submit(self, key: str, factory: Callable[[], Awaitable[None]]) -> None:
+        """Queue a task for background execution.
+
+        Args:
+            key: Identifier clients can wait on (e.g. a job lead ID).
+            factory: Zero-argument callable returning the coroutine to run.
+
+        Raises:
+            TaskQueueFullError: If the queue is at capacity.
+        """
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(_QueuedTask(key=key, factory=factory))
+        except asyncio.QueueFull:
+            raise TaskQueueFullError(
+                f"Queue '{self.name}' is full ({self.maxsize} tasks)"
+            ) from None
+        self._pending[key] = asyncio.Event()
+
+    def is_pending(self, key: str) -> bool:
+        """Return True if the task with this key is queued or running."""
+        return key in self._pending
+
+    async def wait(self, key: str, timeout: float) -> bool:
+        """Wait until the task with this key finishes or the timeout expires.
+
+        Returns:
+            True if the task is no longer pending, False on timeout.
+        """
+        event = self._pending.get(key)
+        if event is None:
+            return True
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout)
+        return event.is_set()
+
+    async def join(self) -> None:
+        """Wait until every queued task has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the workers. Tasks that have not finished are dropped."""
+        for task in self._worker_tasks:
+            task.cancel()
+        for task in self._worker_tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._worker_tasks = []
+        self._queue = None
+        self._loop = None
+        for event in self._pending.values():
+            event.set()
+        self._pending = {}
+
+    async def _worker(self, index: int) -> None:
+        """Process queued tasks until cancelled."""
+        queue = self._queue
+        assert queue is not None
+        while True:
+            item = await queue.get()
+            try:
+                await item.factory()
+            except Exception:
+                logger.exception(
+                    f"Background task {item.key} failed in queue '{self.name}'"
+                )
+            finally:
+                event = self._pending.pop(item.key, None)
+                if event is not None:
+                    event.set()
+                queue.task_done()
@@ -0,0 +1,156 @@
+"""Short-lived cache of authenticated users.
+
+Every authenticated request resolves its user, and a dashboard load fires
+several API calls at once, each of which would otherwise run the same
+``SELECT`` on ``users``. This cache keeps a snapshot of each user's column
+values for a few seconds, keyed by user id and by the stored digest of the
+API token, so the raw token is never held in memory by the cache.
+
+A cached user is put back into the request's session with
+``merge(load=False)``, which emits no SQL. The instance behaves like one
+loaded by a query: endpoints may change and commit it as before.
+
+Entries are evicted whenever a user row is updated or deleted through the
+ORM in this process, both at flush and again after commit, so deactivation,
+password changes and token regeneration take effect immediately. Other
+workers see such changes once their entry expires, which bounds staleness
+by the TTL.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import get_settings
+from app.core.security import hash_api_token
+from app.models import User
+
+# Session.info key for users evicted during a flush, evicted again on commit
+_PENDING_EVICTIONS = "user_cache_evictions"
+
+
+@dataclass
+class UserCacheStats:
+    """Hit/miss counters for the current process."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class UserCache:
+    """Bounded LRU of user snapshots with per-entry expiry."""
+
+    def __init__(self) -> None:
+        self.stats = UserCacheStats()
+        # user id -> (expires_at, column values)
+        self._users: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        # token hash -> user id, and the reverse for eviction
+        self._tokens: dict[str, str] = {}
+        self._user_tokens: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _snapshot(self, user_id: str) -> dict[str, Any] | None:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at < time.monotonic():
+            self.evict(user_id)
+            return None
+        self._users.move_to_end(user_id)
+        return values
+
+    async def _restore(
+        self, db: AsyncSession, values: dict[str, Any] | None
+    ) -> User | None:
+        if values is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        user = User(**copy.deepcopy(values))
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    async def get_by_id(self, db: AsyncSession, user_id: str) -> User | None:
+        """Return the cached user attached to db, or None on a miss."""
+        if not get_settings().user_cache_enabled:
+            return None
+        return await self._restore(db, self._snapshot(user_id))
+
+    async def get_by_token(self, db: AsyncSession, token: str) -> User | None:
+        """Return the cached owner of an API token attached to db, or None."""
+        if not get_settings().user_cache_enabled:
+            return None
+        user_id = self._tokens.get(hash_api_token(token)[1])
+        values = self._snapshot(user_id) if user_id is not None else None
+        return await self._restore(db, values)
+
+    def set(self, user: User, token: str | None = None) -> None:
+        """Cache a user loaded from the database, optionally under its token."""
+        settings = get_settings()
+        if not settings.user_cache_enabled:
+            return
+        values = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in sa_inspect(User).column_attrs
+        }
+        self._users[user.id] = (
+            time.monotonic() + settings.user_cache_ttl_seconds,
+            values,
+        )
+        self._users.move_to_end(user.id)
+        if token is not None:
+            _, token_hash = hash_api_token(token)
+            self._tokens[token_hash] = user.id
+            self._user_tokens.setdefault(user.id, set()).add(token_hash)
+        while len(self._users) > settings.user_cache_max_entries:
+            oldest, _ = self._users.popitem(last=False)
+            self._drop_tokens(oldest)
+
+    def _drop_tokens(self, user_id: str) -> None:
+        for token_hash in self._user_tokens.pop(user_id, ()):
+            self._tokens.pop(token_hash, None)
+
+    def evict(self, user_id: str) -> None:
+        """Forget a user and every token cached for them."""
+        self._users.pop(user_id, None)
+        self._drop_tokens(user_id)
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._tokens.clear()
+        self._user_tokens.clear()
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target: User) -> None:
+    user_cache.evict(target.id)
+    session = sa_inspect(target).session
+    if session is not None:
+        session.info.setdefault(_PENDING_EVICTIONS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    # A concurrent request may have cached the old row between the flush
+    # and the commit; evict again now that the change is visible
+    for user_id in session.info.pop(_PENDING_EVICTIONS, ()):
+        user_cache.evict(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_evictions(session: Session) -> None:
+    session.info.pop(_PENDING_EVICTIONS, None)
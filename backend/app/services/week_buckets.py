@@ -0,0 +1,101 @@
+"""Week bucketing for weekly analytics series.
+
+Weekly charts group days into numbered weeks counted back from today:
+bucket 0 is the current week and the oldest bucket also absorbs anything
+older than the window. Weeks are rolling seven-day windows ending today by
+default, or calendar weeks starting on a given weekday.
+
+The bucket index is computed in SQL so series can be produced by a single
+grouped aggregate. Date arithmetic differs between SQLite and PostgreSQL,
+so the day difference is rendered per dialect.
+"""
+
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import Date, Integer, case, cast, func, literal, type_coerce
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.services.kpis import FAR_PAST_DATE
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+WEEK_START_PATTERN = f"^({'|'.join(WEEKDAYS)})$"
+
+# period -> (number of weeks, days covered); None covers all time
+PERIOD_WEEKS = {"7d": (1, 7), "30d": (4, 30), "3m": (12, 90), "all": (52, None)}
+DEFAULT_PERIOD = "30d"
+
+
+def resolve_today(tz: str | None) -> date:
+    """Today's date, in the given IANA time zone if one is set.
+
+    Raises:
+        ValueError: If the time zone is unknown.
+    """
+    if tz is None:
+        return date.today()
+    try:
+        return datetime.now(ZoneInfo(tz)).date()
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Unknown time zone: {tz}") from e
+
+
+def weekly_window(period: str, today: date) -> tuple[int, date]:
+    """Number of week buckets and the first date included for a period.
+
+    Unknown periods fall back to 30 days.
+    """
+    weeks_count, days = PERIOD_WEEKS.get(period, PERIOD_WEEKS[DEFAULT_PERIOD])
+    if days is None:
+        return weeks_count, FAR_PAST_DATE
+    return weeks_count, today - timedelta(days=days)
+
+
+def week_shift(today: date, week_start: str | None) -> int:
+    """Days to add to "days ago" so calendar weeks end before week_start."""
+    if week_start is None:
+        return 0
+    return 6 - (today.weekday() - WEEKDAYS.index(week_start)) % 7
+
+
+def days_before(dialect: str, today: date, column) -> ColumnElement[int]:
+    """SQL expression for the whole days between a date column and today."""
+    if dialect == "sqlite":
+        return cast(func.julianday(today) - func.julianday(column), Integer)
+    return type_coerce(literal(today, Date) - column, Integer)
+
+
+def week_index(
+    dialect: str,
+    today: date,
+    column,
+    weeks_count: int,
+    week_start: str | None = None,
+) -> ColumnElement[int]:
+    """SQL expression for the week bucket (0 = current week) of a date column.
+
+    Future dates fall into the current week and dates older than the window
+    into the last one.
+
+    Args:
+        dialect: Database dialect name.
+        today: Reference date.
+        column: Date column to bucket.
+        weeks_count: Number of buckets.
+        week_start: Weekday calendar weeks start on; rolling weeks if None.
+
+    Returns:
+        Integer SQL expression in [0, weeks_count).
+    """
+    days = days_before(dialect, today, column) + week_shift(today, week_start)
+    oldest = (weeks_count - 1) * 7
+    return case((days < 0, 0), (days > oldest, oldest), else_=days) // 7
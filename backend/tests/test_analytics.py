@@ -0,0 +1,703 @@
+"""Tests for analytics, dashboard KPIs, KPI aggregation and the daily rollup."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token, get_password_hash
+from app.models import (
+    Application,
+    ApplicationStatus,
+    ApplicationStatusHistory,
+    DailyApplicationStats,
+    Round,
+    RoundType,
+    User,
+)
+from app.services.analytics_cache import analytics_cache
+from app.services.daily_rollup import rebuild_daily_stats
+from app.services.kpis import compute_kpis, period_start_date
+from app.services.user_cache import user_cache
+
+TODAY = date.today()
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession) -> User:
+    """Create a regular test user."""
+    user = User(
+        email="analytics@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_admin=False,
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    token = create_access_token({"sub": test_user.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def statuses(db: AsyncSession, test_user: User) -> dict[str, ApplicationStatus]:
+    """Create the statuses the KPIs are keyed on."""
+    names = ["Applied", "No Reply", "Interviewing", "Offer", "Rejected", "Withdrawn"]
+    created = {
+        name: ApplicationStatus(name=name, color="#ffffff", user_id=test_user.id)
+        for name in names
+    }
+    db.add_all(created.values())
+    await db.commit()
+    return created
+
+
+@pytest.fixture
+async def applications(
+    db: AsyncSession, test_user: User, statuses: dict[str, ApplicationStatus]
+) -> list[Application]:
+    """Create applications spread across statuses and dates."""
+    spec = [
+        ("Applied", 1),
+        ("Interviewing", 2),
+        ("Offer", 3),
+        ("No Reply", 5),
+        ("Rejected", 10),
+        ("Interviewing", 20),
+        ("Withdrawn", 40),
+        ("Applied", 100),
+    ]
+    created = [
+        Application(
+            user_id=test_user.id,
+            company=f"Company {i}",
+            job_title="Engineer",
+            status_id=statuses[status_name].id,
+            applied_at=TODAY - timedelta(days=days_ago),
+        )
+        for i, (status_name, days_ago) in enumerate(spec)
+    ]
+    db.add_all(created)
+    await db.commit()
+    return created
+
+
+@pytest.fixture
+async def rounds(
+    db: AsyncSession, test_user: User, applications: list[Application]
+) -> list[Round]:
+    """Create two rounds for each of the first five applications."""
+    round_type = RoundType(name="Technical", user_id=test_user.id)
+    db.add(round_type)
+    await db.flush()
+
+    created = []
+    for app in applications[:5]:
+        for day in (1, 5):
+            scheduled = datetime(2026, 1, day, 10, 0)
+            created.append(
+                Round(
+                    application_id=app.id,
+                    round_type_id=round_type.id,
+                    scheduled_at=scheduled,
+                    completed_at=scheduled + timedelta(days=2),
+                    outcome="Passed",
+                )
+            )
+    db.add_all(created)
+    await db.commit()
+    return created
+
+
+@pytest.fixture
+def query_counter(db_engine):
+    """Count SQL statements executed against the test engine."""
+    # Start with a cold user cache so the auth lookup is always counted
+    user_cache.clear()
+    statements: list[str] = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", before_execute)
+
+
+class TestComputeKpis:
+    """Tests for the shared single-pass KPI aggregation."""
+
+    async def test_counts_for_period(
+        self, db: AsyncSession, test_user: User, applications
+    ):
+        """Test that period-scoped and rolling-window counts are correct."""
+        kpis = await compute_kpis(db, test_user.id, period_start_date("30d"))
+
+        assert kpis.total == 6
+        assert kpis.interviews == 2
+        assert kpis.offers == 1
+        assert kpis.responded == 5
+        assert kpis.active == 5
+        assert kpis.active_all_time == 6
+        assert kpis.last_7_days == 4
+        assert kpis.previous_7_days == 1
+        assert kpis.last_30_days == 6
+        assert kpis.previous_30_days == 1
+        assert kpis.interview_rate == 33.3
+
+    async def test_no_applications(self, db: AsyncSession, test_user: User):
+        """Test that an empty account yields zeros, not None."""
+        kpis = await compute_kpis(db, test_user.id)
+
+        assert kpis.total == 0
+        assert kpis.response_rate == 0
+
+    async def test_single_query(
+        self, db: AsyncSession, test_user: User, applications, query_counter
+    ):
+        """Test that all KPIs come from one round trip."""
+        query_counter.clear()
+        await compute_kpis(db, test_user.id, period_start_date("all"))
+
+        assert len(query_counter) == 1
+
+
+class TestKpiEndpoints:
+    """Tests for the endpoints built on compute_kpis."""
+
+    async def test_analytics_kpis(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test GET /api/analytics/kpis."""
+        response = await client.get(
+            "/api/analytics/kpis?period=all", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total_applications": 8,
+            "interviews": 2,
+            "offers": 1,
+            "application_to_interview_rate": 25.0,
+            "response_rate": 87.5,
+            "active_opportunities": 6,
+        }
+
+    async def test_dashboard_kpis(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test GET /api/dashboard/kpis."""
+        response = await client.get("/api/dashboard/kpis", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "last_7_days": 4,
+            "last_7_days_trend": 300.0,
+            "last_30_days": 6,
+            "last_30_days_trend": 500.0,
+            "active_opportunities": 6,
+        }
+
+
+class TestInterviewRoundsProgress:
+    """Tests for candidate progress in /api/analytics/interview-rounds."""
+
+    async def test_candidate_progress_grouped_by_application(
+        self, client: AsyncClient, auth_headers: dict[str, str], rounds
+    ):
+        """Test that every application lists its rounds in order."""
+        response = await client.get(
+            "/api/analytics/interview-rounds", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["candidate_total"] == 5
+        progress = data["candidate_progress"]
+        assert len(progress) == 5
+        assert [p["application_id"] for p in progress] == sorted(
+            p["application_id"] for p in progress
+        )
+        for candidate in progress:
+            assert candidate["role"] == "Engineer"
+            assert len(candidate["rounds_completed"]) == 2
+            assert candidate["rounds_completed"][0]["days_in_round"] == 2
+
+    async def test_candidate_progress_pagination(
+        self, client: AsyncClient, auth_headers: dict[str, str], rounds
+    ):
+        """Test that limit/offset page by application, not by round."""
+        full = await client.get("/api/analytics/interview-rounds", headers=auth_headers)
+        page = await client.get(
+            "/api/analytics/interview-rounds?limit=2&offset=2", headers=auth_headers
+        )
+
+        expected = [p["application_id"] for p in full.json()["candidate_progress"]]
+        data = page.json()
+        assert [p["application_id"] for p in data["candidate_progress"]] == (
+            expected[2:4]
+        )
+        assert data["candidate_total"] == 5
+        assert all(len(p["rounds_completed"]) == 2 for p in data["candidate_progress"])
+
+    async def test_query_count_does_not_grow_with_applications(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        rounds,
+        query_counter,
+    ):
+        """Test that candidate progress does not issue per-application queries."""
+        query_counter.clear()
+        response = await client.get(
+            "/api/analytics/interview-rounds", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        # auth + data version + funnel + outcomes + timeline + count + progress
+        assert len(query_counter) <= 7
+
+
+async def _rollup(db: AsyncSession, user_id: str) -> dict[tuple, tuple[int, int]]:
+    result = await db.execute(
+        select(DailyApplicationStats).where(DailyApplicationStats.user_id == user_id)
+    )
+    return {
+        (row.day, row.status_id): (row.applications, row.transitions)
+        for row in result.scalars()
+        if row.applications or row.transitions
+    }
+
+
+class TestDailyRollup:
+    """Tests for the incrementally maintained daily_application_stats table."""
+
+    async def test_maintained_through_api(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+        statuses: dict[str, ApplicationStatus],
+    ):
+        """Test that create, update and delete adjust the rollup counts."""
+        applied = statuses["Applied"].id
+        interviewing = statuses["Interviewing"].id
+        day = TODAY - timedelta(days=3)
+
+        response = await client.post(
+            "/api/applications",
+            json={
+                "company": "Acme",
+                "job_title": "Engineer",
+                "status_id": applied,
+                "applied_at": day.isoformat(),
+            },
+            headers=auth_headers,
+        )
+        app_id = response.json()["id"]
+        assert await _rollup(db, test_user.id) == {(day, applied): (1, 0)}
+
+        await client.patch(
+            f"/api/applications/{app_id}",
+            json={"status_id": interviewing},
+            headers=auth_headers,
+        )
+        changed_on = datetime.now(UTC).date()
+        rollup = await _rollup(db, test_user.id)
+        assert rollup[(day, interviewing)][0] == 1
+        assert rollup[(changed_on, interviewing)][1] == 1
+        assert (day, applied) not in rollup
+
+        await client.delete(f"/api/applications/{app_id}", headers=auth_headers)
+        assert await _rollup(db, test_user.id) == {}
+
+    async def test_rebuild_matches_incremental(
+        self, db: AsyncSession, test_user: User, applications
+    ):
+        """Test that a full rebuild reproduces the incremental counts."""
+        db.add(
+            ApplicationStatusHistory(
+                application_id=applications[0].id,
+                from_status_id=None,
+                to_status_id=applications[0].status_id,
+            )
+        )
+        await db.commit()
+        incremental = await _rollup(db, test_user.id)
+
+        await db.execute(delete(DailyApplicationStats))
+        await db.commit()
+        written = await rebuild_daily_stats(db, test_user.id)
+
+        assert written == len(incremental)
+        assert await _rollup(db, test_user.id) == incremental
+
+    async def test_heatmap_and_weekly_read_rollup(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test heatmap and weekly output over the rollup."""
+        heatmap = await client.get(
+            "/api/analytics/heatmap?rolling=true", headers=auth_headers
+        )
+        weekly = await client.get(
+            "/api/analytics/weekly?period=30d", headers=auth_headers
+        )
+
+        days = heatmap.json()["days"]
+        assert len(days) == 8
+        assert sum(d["count"] for d in days) == 8
+        assert weekly.json() == [
+            {"week": "Week 1", "applications": 4, "interviews": 1},
+            {"week": "Week 2", "applications": 1, "interviews": 0},
+            {"week": "Week 3", "applications": 1, "interviews": 1},
+        ]
+
+
+@pytest.fixture
+async def journeys(
+    db: AsyncSession, applications: list[Application], statuses
+) -> list[Application]:
+    """Give three applications status histories, one of them with a cycle."""
+    s = {name: status.id for name, status in statuses.items()}
+    paths = [
+        [(None, "Applied"), ("Applied", "Interviewing"), ("Interviewing", "Offer")],
+        [(None, "Applied"), ("Applied", "Rejected")],
+        [
+            (None, "Applied"),
+            ("Applied", "Interviewing"),
+            ("Interviewing", "Applied"),
+            ("Applied", "Interviewing"),
+            ("Interviewing", "Rejected"),
+        ],
+    ]
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    for app, path in zip(applications, paths, strict=False):
+        for step, (from_name, to_name) in enumerate(path):
+            db.add(
+                ApplicationStatusHistory(
+                    application_id=app.id,
+                    from_status_id=s[from_name] if from_name else None,
+                    to_status_id=s[to_name],
+                    changed_at=start + timedelta(hours=step),
+                )
+            )
+    await db.commit()
+    return applications[:3]
+
+
+class TestSankey:
+    """Tests for GET /api/analytics/sankey."""
+
+    async def test_links_and_nodes(
+        self, client: AsyncClient, auth_headers: dict[str, str], journeys
+    ):
+        """Test link counts, per-stage terminal nodes and the cycle rule."""
+        response = await client.get("/api/analytics/sankey", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [node["id"] for node in data["nodes"]] == [
+            "applications",
+            "status_applied",
+            "status_interviewing",
+            "status_offer",
+            "terminal_rejected_applied",
+            "terminal_rejected_interviewing",
+        ]
+        assert data["nodes"][1]["color"] == "#ffffff"
+        links = {
+            (link["source"], link["target"]): link["value"] for link in data["links"]
+        }
+        assert links == {
+            ("applications", "status_applied"): 3,
+            ("status_applied", "status_interviewing"): 2,
+            ("status_interviewing", "status_offer"): 1,
+            ("status_applied", "terminal_rejected_applied"): 1,
+            ("status_interviewing", "terminal_rejected_interviewing"): 1,
+        }
+
+    async def test_no_history(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that a user without history gets an empty diagram."""
+        response = await client.get("/api/analytics/sankey", headers=auth_headers)
+
+        assert response.json() == {"nodes": [], "links": []}
+
+    async def test_query_count_is_constant(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        journeys,
+        query_counter,
+    ):
+        """Test that the diagram is built from a fixed number of queries."""
+        query_counter.clear()
+        response = await client.get("/api/analytics/sankey", headers=auth_headers)
+
+        assert response.status_code == 200
+        # auth + data version + grouped counts + revisiting journeys
+        assert len(query_counter) <= 4
+
+
+class TestAnalyticsCache:
+    """Tests for the per-user analytics response cache."""
+
+    async def test_repeat_request_is_served_from_cache(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that an unchanged repeat request hits the cache."""
+        hits = analytics_cache.stats.hits
+        first = await client.get("/api/analytics/kpis?period=all", headers=auth_headers)
+        second = await client.get(
+            "/api/analytics/kpis?period=all", headers=auth_headers
+        )
+
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert analytics_cache.stats.hits == hits + 1
+
+    async def test_parameters_are_part_of_the_key(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that different query parameters are cached separately."""
+        all_time = await client.get(
+            "/api/analytics/kpis?period=all", headers=auth_headers
+        )
+        week = await client.get("/api/analytics/kpis?period=7d", headers=auth_headers)
+
+        assert all_time.headers["etag"] != week.headers["etag"]
+        assert all_time.json()["total_applications"] == 8
+        assert week.json()["total_applications"] == 4
+
+    async def test_if_none_match_returns_304(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that a matching ETag short-circuits with 304."""
+        first = await client.get("/api/dashboard/kpis", headers=auth_headers)
+        second = await client.get(
+            "/api/dashboard/kpis",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]},
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    async def test_write_invalidates(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        statuses: dict[str, ApplicationStatus],
+        applications,
+    ):
+        """Test that creating an application changes the response and ETag."""
+        before = await client.get("/api/dashboard/kpis", headers=auth_headers)
+        await client.post(
+            "/api/applications",
+            json={
+                "company": "Acme",
+                "job_title": "Engineer",
+                "status_id": statuses["Applied"].id,
+            },
+            headers=auth_headers,
+        )
+        after = await client.get(
+            "/api/dashboard/kpis",
+            headers={**auth_headers, "If-None-Match": before.headers["etag"]},
+        )
+
+        assert after.status_code == 200
+        assert after.json()["last_7_days"] == before.json()["last_7_days"] + 1
+
+    async def test_history_write_bumps_version(
+        self, db: AsyncSession, test_user: User, applications
+    ):
+        """Test that writes owned through an application bump the version."""
+        version = await db.scalar(
+            select(User.data_version).where(User.id == test_user.id)
+        )
+        db.add(
+            ApplicationStatusHistory(
+                application_id=applications[0].id,
+                to_status_id=applications[0].status_id,
+            )
+        )
+        await db.commit()
+
+        assert (
+            await db.scalar(select(User.data_version).where(User.id == test_user.id))
+            == version + 1
+        )
+
+    async def test_shared_row_write_bumps_every_user(
+        self, db: AsyncSession, test_user: User
+    ):
+        """Test that editing a default status or round type bumps every user."""
+        version = await db.scalar(
+            select(User.data_version).where(User.id == test_user.id)
+        )
+        db.add(RoundType(name="Shared round", user_id=None))
+        await db.commit()
+
+        assert (
+            await db.scalar(select(User.data_version).where(User.id == test_user.id))
+            == version + 1
+        )
+
+    async def test_response_model_filters_cached_body(
+        self, db: AsyncSession, test_user: User
+    ):
+        """Test that cached bodies are validated through the response model."""
+        from pydantic import BaseModel
+        from starlette.requests import Request
+
+        from app.services.analytics_cache import cached_response
+
+        class Body(BaseModel):
+            count: int
+
+        @cached_response("test.filtered", Body)
+        async def endpoint(user: User, db: AsyncSession):
+            return {"count": "3", "secret": "internal"}
+
+        request = Request({"type": "http", "method": "GET", "headers": []})
+        response = await endpoint(user=test_user, db=db, request=request)
+
+        assert response.body == b'{"count":3}'
+
+
+class TestWeekly:
+    """Tests for week bucketing in GET /api/analytics/weekly."""
+
+    async def test_calendar_weeks(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that week_start aligns buckets to calendar weeks."""
+        weekday = TODAY.strftime("%A").lower()
+        response = await client.get(
+            f"/api/analytics/weekly?period=30d&week_start={weekday}",
+            headers=auth_headers,
+        )
+
+        # The current week started today, so everything else is older
+        assert response.status_code == 200
+        assert response.json() == [
+            {"week": "Week 2", "applications": 4, "interviews": 1},
+            {"week": "Week 3", "applications": 1, "interviews": 0},
+            {"week": "Week 4", "applications": 1, "interviews": 1},
+        ]
+
+    async def test_week_starting_tomorrow_matches_rolling(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that a week ending today buckets like rolling weeks."""
+        weekday = (TODAY + timedelta(days=1)).strftime("%A").lower()
+        calendar = await client.get(
+            f"/api/analytics/weekly?period=3m&week_start={weekday}",
+            headers=auth_headers,
+        )
+        rolling = await client.get(
+            "/api/analytics/weekly?period=3m", headers=auth_headers
+        )
+
+        assert calendar.json() == rolling.json()
+
+    async def test_time_zone(
+        self, client: AsyncClient, auth_headers: dict[str, str], applications
+    ):
+        """Test that tz is validated."""
+        ok = await client.get("/api/analytics/weekly?tz=UTC", headers=auth_headers)
+        bad = await client.get(
+            "/api/analytics/weekly?tz=Mars/Olympus", headers=auth_headers
+        )
+        invalid_start = await client.get(
+            "/api/analytics/weekly?week_start=someday", headers=auth_headers
+        )
+
+        assert ok.status_code == 200
+        assert bad.status_code == 400
+        assert invalid_start.status_code == 422
+
+    async def test_single_query(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications,
+        query_counter,
+    ):
+        """Test that both series come from one aggregate query."""
+        query_counter.clear()
+        await client.get("/api/analytics/weekly?period=all", headers=auth_headers)
+
+        # auth + data version + weekly aggregate
+        assert len(query_counter) == 3
+
+
+class TestStageFunnel:
+    """Tests for the history-based funnel endpoints."""
+
+    async def test_ever_reached_counts(
+        self, client: AsyncClient, auth_headers: dict[str, str], journeys
+    ):
+        """Test that stages count applications that have since moved on."""
+        response = await client.get("/api/analytics/funnel", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_applications"] == 8
+        assert {stage["name"]: stage["reached"] for stage in data["stages"]} == {
+            "Applied": 4,
+            "Interviewing": 4,
+            "No Reply": 1,
+            "Offer": 2,
+            "Rejected": 3,
+            "Withdrawn": 1,
+        }
+        interviewing = next(s for s in data["stages"] if s["name"] == "Interviewing")
+        assert interviewing["rate"] == 50.0
+
+    async def test_weekly_reach(
+        self, client: AsyncClient, auth_headers: dict[str, str], journeys
+    ):
+        """Test weekly cohorts against the current-status weekly series."""
+        funnel = await client.get(
+            "/api/analytics/funnel/weekly?period=30d", headers=auth_headers
+        )
+        current = await client.get(
+            "/api/analytics/weekly?period=30d", headers=auth_headers
+        )
+
+        assert funnel.json() == [
+            {"week": "Week 1", "applications": 4, "reached": 3, "rate": 75.0},
+            {"week": "Week 2", "applications": 1, "reached": 0, "rate": 0.0},
+            {"week": "Week 3", "applications": 1, "reached": 1, "rate": 100.0},
+        ]
+        # Only one of the three week-one interviews is still Interviewing
+        assert current.json()[0]["interviews"] == 1
+
+    async def test_single_query(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        journeys,
+        query_counter,
+    ):
+        """Test that each funnel endpoint aggregates in one query."""
+        query_counter.clear()
+        await client.get("/api/analytics/funnel", headers=auth_headers)
+        await client.get("/api/analytics/funnel/weekly", headers=auth_headers)
+
+        # auth (cached for the second request) + (data version + aggregate)
+        # per request
+        assert len(query_counter) == 5
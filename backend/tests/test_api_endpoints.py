@@ -12,20 +12,25 @@ All tests verify authentication requirements and success/error cases.
 # pyright: reportCallIssue=warning
 # Pydantic v2 optional fields cause false positives with pyright
 
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.api.job_leads import fail_interrupted_job_leads, job_lead_queue
 from app.core.security import (
     create_access_token,
     generate_api_token,
     get_password_hash,
+    hash_api_token,
+    verify_api_token,
 )
-from app.models import JobLead, SystemSettings, User
+from app.models import Application, ApplicationStatus, JobLead, SystemSettings, User
 from app.models.user_profile import UserProfile
+from app.services.task_queue import TaskQueueFullError
 
 # ============================================================================
 # Fixtures
@@ -63,14 +68,22 @@ async def admin_user(db: AsyncSession) -> User:
 
 
 @pytest.fixture
-async def user_with_api_token(db: AsyncSession) -> User:
+def api_token() -> str:
+    """Generate the API token held by user_with_api_token."""
+    return generate_api_token()
+
+
+@pytest.fixture
+async def user_with_api_token(db: AsyncSession, api_token: str) -> User:
     """Create a user with an API token set."""
+    prefix, token_hash = hash_api_token(api_token)
     user = User(
         email="api_user@example.com",
         password_hash=get_password_hash("testpass123"),
         is_admin=False,
         is_active=True,
-        api_token=generate_api_token(),
+        api_token_prefix=prefix,
+        api_token_hash=token_hash,
     )
     db.add(user)
     await db.commit()
@@ -220,6 +233,215 @@ class TestJobLeadsList:
         for item in data["items"]:
             assert item["status"] == "extracted"
 
+    async def test_list_job_leads_cursor_pages(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db: AsyncSession,
+        test_user: User,
+    ):
+        """Test that cursor pages cover every lead once, newest first."""
+        scraped_at = datetime(2026, 1, 1, tzinfo=UTC)
+        leads = [
+            JobLead(
+                user_id=test_user.id,
+                url=f"https://example.com/job/cursor-{i}",
+                status="extracted",
+                # Pairs share a timestamp, so the id tiebreak is exercised
+                scraped_at=scraped_at + timedelta(hours=i // 2),
+            )
+            for i in range(7)
+        ]
+        db.add_all(leads)
+        await db.commit()
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"per_page": 3, "include_total": "false"}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/api/job-leads", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = sorted(leads, key=lambda lead: (lead.scraped_at, lead.id))
+        assert seen == [lead.id for lead in reversed(expected)]
+
+    async def test_list_job_leads_cursor_matches_offset(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db: AsyncSession,
+        test_user: User,
+    ):
+        """Test that the first page's cursor leads to the same rows as page 2."""
+        for i in range(5):
+            db.add(
+                JobLead(
+                    user_id=test_user.id,
+                    url=f"https://example.com/job/offset-{i}",
+                    status="extracted",
+                )
+            )
+        await db.commit()
+
+        first = (
+            await client.get("/api/job-leads?per_page=2", headers=auth_headers)
+        ).json()
+        by_cursor = await client.get(
+            "/api/job-leads",
+            params={"per_page": 2, "cursor": first["next_cursor"]},
+            headers=auth_headers,
+        )
+        by_offset = await client.get(
+            "/api/job-leads?page=2&per_page=2", headers=auth_headers
+        )
+        assert first["total"] == 5
+        assert by_cursor.json()["items"] == by_offset.json()["items"]
+
+    async def test_list_job_leads_without_total(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db: AsyncSession,
+        test_user: User,
+    ):
+        """Test that include_total=false skips the count unless one page has it all."""
+        for i in range(3):
+            db.add(
+                JobLead(
+                    user_id=test_user.id,
+                    url=f"https://example.com/job/no-total-{i}",
+                    status="extracted",
+                )
+            )
+        await db.commit()
+
+        partial = await client.get(
+            "/api/job-leads?per_page=2&include_total=false", headers=auth_headers
+        )
+        assert partial.json()["total"] is None
+
+        complete = await client.get(
+            "/api/job-leads?per_page=5&include_total=false", headers=auth_headers
+        )
+        assert complete.json()["total"] == 3
+
+    async def test_list_job_leads_url_lookup_skips_count(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db_engine,
+        test_job_lead: JobLead,
+    ):
+        """Test that exact URL lookups do not run a COUNT query."""
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.get(
+                "/api/job-leads",
+                params={"search": test_job_lead.url},
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+        assert response.json()["total"] == 1
+        assert not [s for s in statements if "count(*)" in s.lower()]
+
+    async def test_list_job_leads_invalid_cursor(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/job-leads?cursor=not-a-cursor", headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestApplicationsList:
+    """Tests for GET /api/applications pagination."""
+
+    @pytest.fixture
+    async def applications(
+        self, db: AsyncSession, test_user: User
+    ) -> list[Application]:
+        status = ApplicationStatus(
+            name="Applied", color="#ffffff", user_id=test_user.id
+        )
+        db.add(status)
+        await db.flush()
+        created = [
+            Application(
+                user_id=test_user.id,
+                status_id=status.id,
+                company=f"Company {i}",
+                job_title="Engineer",
+                job_url=f"https://example.com/apply/{i}",
+                # Several applications per day, ordered by created_at within it
+                applied_at=date(2026, 3, 1) + timedelta(days=i // 3),
+                created_at=datetime(2026, 3, 1, tzinfo=UTC) + timedelta(minutes=i),
+            )
+            for i in range(8)
+        ]
+        db.add_all(created)
+        await db.commit()
+        return created
+
+    async def test_cursor_pages_cover_all(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        applications: list[Application],
+    ):
+        """Test that following next_cursor yields every application once."""
+        seen: list[str] = []
+        cursor = None
+        for _ in range(len(applications)):
+            params = {"per_page": 3}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/api/applications", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == len(applications)
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [a.id for a in reversed(applications)]
+
+    async def test_url_lookup_returns_total_without_count(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        applications: list[Application],
+    ):
+        """Test that exact URL lookups still report the number of matches."""
+        response = await client.get(
+            "/api/applications",
+            params={"url": applications[2].job_url},
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["next_cursor"] is None
+        assert data["items"][0]["id"] == applications[2].id
+
 
 class TestJobLeadsGet:
     """Tests for GET /api/job-leads/{id} endpoint."""
@@ -307,10 +529,11 @@ class TestJobLeadsCreate:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
     ):
         """Test creating a job lead using Bearer token with API token."""
         # Use the API token as a Bearer token
-        headers = {"Authorization": f"Bearer {user_with_api_token.api_token}"}
+        headers = {"Authorization": f"Bearer {api_token}"}
 
         # Mock the extraction service with AsyncMock
         with patch(
@@ -346,9 +569,10 @@ class TestJobLeadsCreate:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
     ):
         """Test creating a job lead using X-API-Key header."""
-        headers = {"X-API-Key": user_with_api_token.api_token}
+        headers = {"X-API-Key": api_token}
 
         with patch(
             "app.api.job_leads.extract_job_data", new_callable=AsyncMock
@@ -381,6 +605,7 @@ class TestJobLeadsCreate:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
         db: AsyncSession,
     ):
         """Test that creating a job lead with duplicate URL returns 409."""
@@ -393,7 +618,7 @@ class TestJobLeadsCreate:
         db.add(existing_lead)
         await db.commit()
 
-        headers = {"X-API-Key": user_with_api_token.api_token}
+        headers = {"X-API-Key": api_token}
 
         response = await client.post(
             "/api/job-leads",
@@ -408,9 +633,10 @@ class TestJobLeadsCreate:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
     ):
         """Test creating a job lead with pre-fetched HTML content."""
-        headers = {"X-API-Key": user_with_api_token.api_token}
+        headers = {"X-API-Key": api_token}
 
         with patch("app.api.job_leads.extract_job_data") as mock_extract:
             from app.schemas.job_lead import JobLeadExtractionInput
@@ -543,6 +769,284 @@ class TestJobLeadsRetry:
         assert data["error_message"] is None
 
 
+class TestJobLeadsBackground:
+    """Tests for background extraction (POST ?background=true + status polling)."""
+
+    @pytest.fixture
+    def worker_sessions(self, db_engine):
+        """Point background workers at the test database."""
+        session_maker = async_sessionmaker(
+            db_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        with patch("app.api.job_leads.async_session_maker", session_maker):
+            yield
+
+    async def test_create_job_lead_background_returns_pending(
+        self,
+        client: AsyncClient,
+        user_with_api_token: User,
+        api_token: str,
+        worker_sessions,
+    ):
+        """Test that a background capture returns 202 and completes later."""
+        headers = {"X-API-Key": api_token}
+
+        with patch(
+            "app.api.job_leads.extract_job_data", new_callable=AsyncMock
+        ) as mock_extract:
+            from app.schemas.job_lead import JobLeadExtractionInput
+
+            mock_extract.return_value = JobLeadExtractionInput(
+                title="Queued Job",
+                company="Queued Company",
+            )
+
+            response = await client.post(
+                "/api/job-leads?background=true",
+                headers=headers,
+                json={
+                    "url": "https://example.com/job/queued",
+                    "text": "Queued Job at Queued Company",
+                },
+            )
+            assert response.status_code == 202
+            data = response.json()
+            assert data["status"] == "pending"
+            assert data["title"] is None
+
+            status_response = await client.get(
+                f"/api/job-leads/{data['id']}/status?wait=5",
+                headers=headers,
+            )
+            await job_lead_queue.join()
+
+        assert status_response.status_code == 200
+        status_data = status_response.json()
+        assert status_data["status"] == "extracted"
+        assert status_data["title"] == "Queued Job"
+        assert mock_extract.call_args.kwargs["text"] == "Queued Job at Queued Company"
+
+    async def test_create_job_lead_background_failure_sets_error(
+        self,
+        client: AsyncClient,
+        user_with_api_token: User,
+        api_token: str,
+        worker_sessions,
+    ):
+        """Test that a failed background extraction is recorded on the lead."""
+        from app.services.extraction import NoJobFoundError
+
+        headers = {"X-API-Key": api_token}
+
+        with patch(
+            "app.api.job_leads.extract_job_data", new_callable=AsyncMock
+        ) as mock_extract:
+            mock_extract.side_effect = NoJobFoundError("nothing here")
+
+            response = await client.post(
+                "/api/job-leads?background=true",
+                headers=headers,
+                json={
+                    "url": "https://example.com/job/not-a-job",
+                    "text": "Login page",
+                },
+            )
+            assert response.status_code == 202
+            await job_lead_queue.join()
+
+        status_response = await client.get(
+            f"/api/job-leads/{response.json()['id']}/status",
+            headers=headers,
+        )
+        data = status_response.json()
+        assert data["status"] == "failed"
+        assert "valid job posting" in data["error_message"]
+
+    async def test_job_lead_status_not_found_for_other_user(
+        self,
+        client: AsyncClient,
+        test_job_lead: JobLead,
+        user_with_api_token: User,
+        api_token: str,
+    ):
+        """Test that users cannot poll another user's job lead."""
+        response = await client.get(
+            f"/api/job-leads/{test_job_lead.id}/status",
+            headers={"X-API-Key": api_token},
+        )
+        assert response.status_code == 404
+
+    async def test_fail_interrupted_job_leads(
+        self,
+        db: AsyncSession,
+        test_user: User,
+    ):
+        """Test that leads left pending by a previous process are marked failed."""
+        pending = JobLead(
+            user_id=test_user.id,
+            url="https://example.com/job/interrupted",
+            status="pending",
+        )
+        db.add(pending)
+        await db.commit()
+
+        assert await fail_interrupted_job_leads(db) == 1
+
+        await db.refresh(pending)
+        assert pending.status == "failed"
+        assert pending.error_message is not None
+
+
+class TestJobLeadsBatch:
+    """Tests for POST /api/job-leads/batch endpoint."""
+
+    @pytest.fixture
+    def worker_sessions(self, db_engine):
+        """Point extraction sessions at the test database."""
+        session_maker = async_sessionmaker(
+            db_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        with patch("app.api.job_leads.async_session_maker", session_maker):
+            yield
+
+    async def test_batch_requires_api_token(self, client: AsyncClient):
+        """Test that batch capture requires authentication."""
+        response = await client.post(
+            "/api/job-leads/batch",
+            json={"items": [{"url": "https://example.com/job/1"}]},
+        )
+        assert response.status_code == 401
+
+    async def test_batch_dedupes_and_extracts(
+        self,
+        client: AsyncClient,
+        user_with_api_token: User,
+        api_token: str,
+        db: AsyncSession,
+        worker_sessions,
+    ):
+        """Test that a batch skips known URLs and extracts the new ones."""
+        existing = JobLead(
+            user_id=user_with_api_token.id,
+            url="https://example.com/job/known",
+            status="extracted",
+        )
+        db.add(existing)
+        await db.commit()
+
+        headers = {"X-API-Key": api_token}
+
+        with patch(
+            "app.api.job_leads.extract_job_data", new_callable=AsyncMock
+        ) as mock_extract:
+            from app.schemas.job_lead import JobLeadExtractionInput
+
+            mock_extract.return_value = JobLeadExtractionInput(
+                title="Batch Job", company="Batch Co"
+            )
+
+            response = await client.post(
+                "/api/job-leads/batch",
+                headers=headers,
+                json={
+                    "items": [
+                        {"url": "https://example.com/job/a", "text": "Job A"},
+                        {"url": "https://example.com/job/known"},
+                        {"url": "https://example.com/job/b", "text": "Job B"},
+                        {"url": "https://example.com/job/a", "text": "Job A again"},
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 2
+        assert data["duplicates"] == 1
+        assert [r["url"] for r in data["results"]] == [
+            "https://example.com/job/a",
+            "https://example.com/job/known",
+            "https://example.com/job/b",
+        ]
+        assert data["results"][1]["result"] == "duplicate"
+        assert data["results"][1]["existing_id"] == existing.id
+        assert data["results"][0]["job_lead"]["status"] == "extracted"
+        assert data["results"][0]["job_lead"]["title"] == "Batch Job"
+        assert mock_extract.await_count == 2
+
+    async def test_batch_background_returns_pending(
+        self,
+        client: AsyncClient,
+        user_with_api_token: User,
+        api_token: str,
+        worker_sessions,
+    ):
+        """Test that a background batch returns 202 with pending leads."""
+        headers = {"X-API-Key": api_token}
+
+        with patch(
+            "app.api.job_leads.extract_job_data", new_callable=AsyncMock
+        ) as mock_extract:
+            from app.schemas.job_lead import JobLeadExtractionInput
+
+            mock_extract.return_value = JobLeadExtractionInput(
+                title="Later", company="Later Co"
+            )
+
+            response = await client.post(
+                "/api/job-leads/batch?background=true",
+                headers=headers,
+                json={
+                    "items": [
+                        {"url": "https://example.com/job/x", "text": "Job X"},
+                        {"url": "https://example.com/job/y", "text": "Job Y"},
+                    ]
+                },
+            )
+            await job_lead_queue.join()
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["created"] == 2
+        assert all(r["job_lead"]["status"] == "pending" for r in data["results"])
+        assert mock_extract.await_count == 2
+
+    async def test_batch_background_reports_rejected_items(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        user_with_api_token: User,
+        api_token: str,
+    ):
+        """Test that leads the full queue could not take are reported, not lost."""
+        headers = {"X-API-Key": api_token}
+
+        with patch.object(
+            job_lead_queue, "submit", side_effect=[None, TaskQueueFullError()]
+        ):
+            response = await client.post(
+                "/api/job-leads/batch?background=true",
+                headers=headers,
+                json={
+                    "items": [
+                        {"url": "https://example.com/job/q", "text": "Job Q"},
+                        {"url": "https://example.com/job/r", "text": "Job R"},
+                    ]
+                },
+            )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert (data["created"], data["rejected"]) == (1, 1)
+        queued, rejected = data["results"]
+        assert queued["result"] == "created"
+        assert rejected["result"] == "rejected"
+        assert rejected["detail"]
+
+        # The rejected lead is gone, so retrying the URL creates it afresh
+        result = await db.execute(select(JobLead.url))
+        assert result.scalars().all() == ["https://example.com/job/q"]
+
+
 # ============================================================================
 # User Profile API Tests
 # ============================================================================
@@ -785,8 +1289,9 @@ class TestSettingsAPIKey:
         data = response.json()
         assert data["has_api_key"] is True
         assert data["api_key_masked"] is not None
-        # Masked format: "abcd...wxyz" or similar
+        # Masked format: "abcd1234..."; only the hash is stored
         assert "..." in data["api_key_masked"]
+        assert data["api_key_full"] is None
 
 
 class TestSettingsAPIKeyRegenerate:
@@ -817,7 +1322,8 @@ class TestSettingsAPIKeyRegenerate:
 
         # Verify the token was saved to the database
         await db.refresh(test_user)
-        assert test_user.api_token is not None
+        assert test_user.api_token_hash is not None
+        assert verify_api_token(data["api_key_full"], test_user.api_token_hash)
 
     async def test_regenerate_api_key_replaces_existing(
         self,
@@ -826,7 +1332,7 @@ class TestSettingsAPIKeyRegenerate:
         db: AsyncSession,
     ):
         """Test that regenerating replaces an existing API key."""
-        old_token = user_with_api_token.api_token
+        old_hash = user_with_api_token.api_token_hash
         token = create_access_token({"sub": user_with_api_token.id})
         headers = {"Authorization": f"Bearer {token}"}
 
@@ -838,7 +1344,7 @@ class TestSettingsAPIKeyRegenerate:
 
         # Verify the token was changed
         await db.refresh(user_with_api_token)
-        assert user_with_api_token.api_token != old_token
+        assert user_with_api_token.api_token_hash != old_hash
 
 
 # ============================================================================
@@ -1024,9 +1530,10 @@ class TestAuthenticationMethods:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
     ):
         """Test authentication with API token as Bearer token."""
-        headers = {"Authorization": f"Bearer {user_with_api_token.api_token}"}
+        headers = {"Authorization": f"Bearer {api_token}"}
 
         # API token auth works for job_leads create endpoint
         with patch(
@@ -1058,9 +1565,10 @@ class TestAuthenticationMethods:
         self,
         client: AsyncClient,
         user_with_api_token: User,
+        api_token: str,
     ):
         """Test authentication with X-API-Key header."""
-        headers = {"X-API-Key": user_with_api_token.api_token}
+        headers = {"X-API-Key": api_token}
 
         # X-API-Key works for job_leads create endpoint
         with patch(
@@ -1088,6 +1596,27 @@ class TestAuthenticationMethods:
 
         assert response.status_code == 201
 
+    async def test_api_token_with_matching_prefix_rejected(
+        self,
+        client: AsyncClient,
+        user_with_api_token: User,
+        api_token: str,
+    ):
+        """Test that a token sharing only the lookup prefix is rejected."""
+        forged = api_token[:8] + "0" * (len(api_token) - 8)
+        if forged == api_token:
+            forged = api_token[:8] + "1" * (len(api_token) - 8)
+
+        response = await client.get(
+            "/api/users/settings", headers={"X-API-Key": forged}
+        )
+        assert response.status_code == 401
+
+        response = await client.get(
+            "/api/users/settings", headers={"X-API-Key": api_token}
+        )
+        assert response.status_code == 200
+
     async def test_invalid_token_returns_401(self, client: AsyncClient):
         """Test that invalid tokens return 401."""
         headers = {"Authorization": "Bearer invalid-token-12345"}
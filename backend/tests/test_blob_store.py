@@ -0,0 +1,311 @@
+"""Tests for the content-addressed file store and its reference counts."""
+
+import hashlib
+import json
+import os
+import time
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.utils.zip_utils import create_zip_export
+from app.core.config import get_settings
+from app.core.security import create_access_token, get_password_hash
+from app.models import (
+    Application,
+    ApplicationStatus,
+    FileBlob,
+    Round,
+    RoundMedia,
+    RoundType,
+    User,
+)
+from app.services.blob_store import (
+    blob_path,
+    collect_garbage,
+    migrate_legacy_files,
+    rebuild_blob_refs,
+)
+
+CV = b"%PDF-1.4 the same CV every time"
+CV_KEY = f"{hashlib.sha256(CV).hexdigest()}.pdf"
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch) -> str:
+    """Point uploads at a temporary directory."""
+    monkeypatch.setattr(get_settings(), "upload_dir", str(tmp_path))
+    return str(tmp_path)
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession) -> User:
+    """Create a regular test user."""
+    user = User(
+        email="blobs@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+
+
+@pytest.fixture
+async def applications(db: AsyncSession, test_user: User) -> list[Application]:
+    """Create two applications, each with one interview round."""
+    status = ApplicationStatus(name="Applied", color="#ffffff", user_id=test_user.id)
+    round_type = RoundType(name="Technical", user_id=test_user.id)
+    db.add_all([status, round_type])
+    await db.flush()
+    applications = []
+    for company in ("Acme", "Globex"):
+        application = Application(
+            user_id=test_user.id,
+            status_id=status.id,
+            company=company,
+            job_title="Engineer",
+            applied_at=date(2026, 3, 1),
+        )
+        application.rounds = [Round(round_type_id=round_type.id)]
+        applications.append(application)
+    db.add_all(applications)
+    await db.commit()
+    return applications
+
+
+async def _ref_count(db: AsyncSession, key: str) -> int | None:
+    return await db.scalar(select(FileBlob.ref_count).where(FileBlob.key == key))
+
+
+async def _upload_cv(
+    client: AsyncClient, application: Application, headers: dict, content: bytes
+) -> str:
+    response = await client.post(
+        f"/api/applications/{application.id}/cv",
+        files={"file": ("cv.PDF", content, "application/pdf")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()["cv_path"]
+
+
+class TestDeduplication:
+    async def test_same_file_is_stored_once(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        applications: list[Application],
+    ):
+        """Test that identical uploads share one stored file."""
+        paths = [
+            await _upload_cv(client, application, auth_headers, CV)
+            for application in applications
+        ]
+
+        assert paths == [blob_path(CV_KEY)] * 2
+        assert os.listdir(os.path.dirname(paths[0])) == [CV_KEY]
+        assert await _ref_count(db, CV_KEY) == 2
+        assert await db.scalar(select(FileBlob.size)) == len(CV)
+
+    async def test_shared_file_outlives_one_reference(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        applications: list[Application],
+    ):
+        """Test that a file is only collected once every reference is gone."""
+        for application in applications:
+            await _upload_cv(client, application, auth_headers, CV)
+
+        response = await client.delete(
+            f"/api/applications/{applications[0].id}/cv", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert await _ref_count(db, CV_KEY) == 1
+        assert await collect_garbage(db, grace=timedelta(0)) == 0
+        assert os.path.exists(blob_path(CV_KEY))
+
+        response = await client.delete(
+            f"/api/applications/{applications[1].id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert await _ref_count(db, CV_KEY) == 0
+
+        # Kept during the grace period, removed after it
+        assert await collect_garbage(db) == 0
+        assert await collect_garbage(db, grace=timedelta(0)) == 1
+        assert not os.path.exists(blob_path(CV_KEY))
+        assert await _ref_count(db, CV_KEY) is None
+
+    async def test_cascading_delete_releases_media(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        applications: list[Application],
+    ):
+        """Test that media and transcripts removed by cascade are released."""
+        round_id = applications[0].rounds[0].id
+        response = await client.post(
+            f"/api/rounds/{round_id}/media",
+            files={"file": ("call.mp3", b"audio", "audio/mpeg")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        response = await client.post(
+            f"/api/rounds/{round_id}/transcript",
+            files={"file": ("notes.pdf", b"transcript", "application/pdf")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        counts = (await db.execute(select(FileBlob.ref_count))).scalars().all()
+        assert counts == [1, 1]
+
+        response = await client.delete(
+            f"/api/applications/{applications[0].id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        counts = (await db.execute(select(FileBlob.ref_count))).scalars().all()
+        assert counts == [0, 0]
+        assert await collect_garbage(db, grace=timedelta(0)) == 2
+
+
+class TestMaintenance:
+    async def test_collects_untracked_files(self, db: AsyncSession, upload_dir: str):
+        """Test that stored files without a row are removed once stale."""
+        path = blob_path(CV_KEY)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(CV)
+
+        assert await collect_garbage(db, grace=timedelta(hours=1)) == 0
+        stale = time.time() - 7200
+        os.utime(path, (stale, stale))
+        assert await collect_garbage(db, grace=timedelta(hours=1)) == 1
+        assert os.listdir(os.path.join(upload_dir, "blobs")) == []
+
+    async def test_rebuild_repairs_counts(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        applications: list[Application],
+    ):
+        """Test that counts are recomputed after a bulk update skipped them."""
+        for application in applications:
+            await _upload_cv(client, application, auth_headers, CV)
+        await db.execute(
+            update(Application)
+            .where(Application.id == applications[0].id)
+            .values(cv_path=None)
+        )
+        await db.commit()
+        assert await _ref_count(db, CV_KEY) == 2
+
+        assert await rebuild_blob_refs(db) == 1
+        assert await _ref_count(db, CV_KEY) == 1
+
+    async def test_migrates_legacy_files(
+        self,
+        db: AsyncSession,
+        applications: list[Application],
+        upload_dir: str,
+    ):
+        """Test that files from before the store are moved in and deduplicated."""
+        legacy = []
+        for application in applications:
+            path = os.path.join(upload_dir, f"cv_{application.id}.pdf")
+            with open(path, "wb") as f:
+                f.write(CV)
+            application.cv_path = path
+            legacy.append(path)
+        media = RoundMedia(
+            round_id=applications[0].rounds[0].id,
+            file_path=os.path.join(upload_dir, "call.mp3"),
+            media_type="audio",
+        )
+        with open(media.file_path, "wb") as f:
+            f.write(b"audio")
+        db.add(media)
+        await db.commit()
+
+        assert await migrate_legacy_files(db) == 3
+        assert [a.cv_path for a in applications] == [blob_path(CV_KEY)] * 2
+        assert media.checksum == hashlib.sha256(b"audio").hexdigest()
+        assert media.file_size == 5
+        assert await _ref_count(db, CV_KEY) == 2
+        assert not any(os.path.exists(path) for path in legacy)
+        assert sorted(os.listdir(upload_dir)) == ["blobs"]
+
+
+class TestImport:
+    async def test_round_trip_keeps_shared_file(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        test_user: User,
+        applications: list[Application],
+        upload_dir: str,
+    ):
+        """Test that an imported shared CV is stored once and reference counted."""
+        for application in applications:
+            await _upload_cv(client, application, auth_headers, CV)
+        data = {
+            "user": {"email": test_user.email},
+            "applications": [
+                {
+                    "id": application.id,
+                    "company": application.company,
+                    "job_title": application.job_title,
+                    "status": "Applied",
+                    "cv_path": blob_path(CV_KEY),
+                    "applied_at": "2026-03-01T00:00:00",
+                }
+                for application in applications
+            ],
+        }
+        archive = await create_zip_export(json.dumps(data), test_user.id, upload_dir)
+
+        # Start over as if on a fresh instance
+        for application in applications:
+            response = await client.delete(
+                f"/api/applications/{application.id}", headers=auth_headers
+            )
+            assert response.status_code == 204
+        assert await collect_garbage(db, grace=timedelta(0)) == 1
+
+        response = await client.post(
+            "/api/import/import",
+            files={"file": ("export.zip", archive, "application/zip")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        imported = (
+            (await db.execute(select(Application).order_by(Application.company)))
+            .scalars()
+            .all()
+        )
+        assert [a.cv_path for a in imported] == [blob_path(CV_KEY)] * 2
+        assert await _ref_count(db, CV_KEY) == 2
+
+        response = await client.delete(
+            f"/api/applications/{imported[0].id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert await _ref_count(db, CV_KEY) == 1
+        assert await collect_garbage(db, grace=timedelta(0)) == 0
+        with open(imported[1].cv_path, "rb") as f:
+            assert f.read() == CV
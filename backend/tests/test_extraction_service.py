@@ -9,8 +9,9 @@ including HTML preprocessing, LLM extraction, and error handling.
 # pyright: reportCallIssue=warning, reportArgumentType=warning
 # Pydantic v2 optional fields cause false positives with pyright
 
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import openai
 import pytest
@@ -25,7 +26,12 @@ from app.services.extraction import (
     _truncate_markdown,
     extract_job_data,
     extract_with_llm,
+    extract_with_llm_async,
     preprocess_html,
+    preprocess_html_async,
+    preprocess_html_with_timings,
+    preprocess_metrics,
+    shutdown_preprocess_pool,
 )
 
 # Sample HTML for testing
@@ -146,6 +152,106 @@ class TestPreprocessHtml:
         assert len(result) <= 60_000  # Some buffer over 50KB limit
 
 
+class TestPreprocessHtmlAsync:
+    """Test off-loop HTML preprocessing and stage metrics."""
+
+    def test_timings_cover_every_stage(self):
+        """Test that each preprocessing stage reports a duration."""
+        markdown, timings = preprocess_html_with_timings(SAMPLE_JOB_HTML)
+
+        assert markdown == preprocess_html(SAMPLE_JOB_HTML)
+        assert set(timings) == {"readability", "markdown", "clean", "truncate"}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+    async def test_process_pool_matches_sync_result(self):
+        """Test that the process pool produces the same markdown."""
+        from app.core.config import Settings
+
+        preprocess_metrics.reset()
+        settings = Settings(html_preprocess_workers=1)
+        try:
+            with patch("app.services.extraction.get_settings", return_value=settings):
+                result = await preprocess_html_async(SAMPLE_JOB_HTML_WITH_DETAILS)
+        finally:
+            shutdown_preprocess_pool()
+
+        assert result == preprocess_html(SAMPLE_JOB_HTML_WITH_DETAILS)
+        assert preprocess_metrics.documents == 1
+        assert preprocess_metrics.stages["readability"].count == 1
+
+    async def test_errors_propagate_from_pool(self):
+        """Test that preprocessing errors surface as ValueError."""
+        from app.core.config import Settings
+
+        settings = Settings(html_preprocess_workers=0)
+        with patch("app.services.extraction.get_settings", return_value=settings):
+            with pytest.raises(ValueError, match="cannot be empty"):
+                await preprocess_html_async("   ")
+
+    async def test_time_budget(self):
+        """Test that a document exceeding the time budget is abandoned."""
+        import time
+
+        from app.core.config import Settings
+
+        def slow(html):
+            time.sleep(0.5)
+            return "late", {}
+
+        preprocess_metrics.reset()
+        settings = Settings(
+            html_preprocess_workers=0, html_preprocess_timeout_seconds=0.05
+        )
+        with (
+            patch("app.services.extraction.get_settings", return_value=settings),
+            patch("app.services.extraction.preprocess_html_with_timings", slow),
+        ):
+            with pytest.raises(ValueError, match="time budget"):
+                await preprocess_html_async(SAMPLE_JOB_HTML)
+
+        assert preprocess_metrics.timeouts == 1
+
+    async def test_timeout_leaves_other_requests_alone(self):
+        """Test that a timeout neither cancels queued work nor leaks the worker."""
+        from app.core.config import Settings
+        from app.services import extraction
+
+        settings = Settings(
+            html_preprocess_workers=1, html_preprocess_timeout_seconds=0.5
+        )
+        try:
+            with (
+                patch("app.services.extraction.get_settings", return_value=settings),
+                patch(
+                    "app.services.extraction.preprocess_html_with_timings",
+                    _stuck_preprocess,
+                ),
+            ):
+                stuck = asyncio.ensure_future(preprocess_html_async("stuck"))
+                await asyncio.sleep(0.1)
+                workers = list(extraction._preprocess_executor._processes.values())
+                queued = asyncio.ensure_future(preprocess_html_async("queued"))
+                results = await asyncio.gather(stuck, queued, return_exceptions=True)
+
+            # The queued request runs out its own budget instead of being
+            # cancelled by the other request's timeout
+            assert all(isinstance(result, ValueError) for result in results)
+            assert extraction._preprocess_executor is None
+            await asyncio.sleep(0.5)
+            await asyncio.to_thread(lambda: [w.join(timeout=5) for w in workers])
+            assert not any(worker.is_alive() for worker in workers)
+        finally:
+            shutdown_preprocess_pool()
+
+
+def _stuck_preprocess(html):
+    """Stand-in for a document that hangs preprocessing (runs in the pool)."""
+    import time
+
+    time.sleep(30)
+    return "late", {}
+
+
 class TestTruncateMarkdown:
     """Test markdown truncation functionality."""
 
@@ -415,6 +521,132 @@ class TestExtractWithLlm:
             assert mock_completion.call_count == 2
 
 
+class TestExtractWithLlmAsync:
+    """Test the non-blocking LLM extraction path."""
+
+    @staticmethod
+    def _response(content: str | None) -> MagicMock:
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content=content))]
+        return response
+
+    @pytest.mark.asyncio
+    async def test_extract_with_llm_async_success(self):
+        """Test that the async path awaits acompletion and validates the result."""
+        valid = json.dumps(
+            {
+                "title": "Engineer",
+                "company": "Corp",
+                "requirements_must_have": [],
+                "requirements_nice_to_have": [],
+                "skills": [],
+            }
+        )
+
+        with (
+            patch(
+                "app.services.extraction.acompletion", new_callable=AsyncMock
+            ) as mock_acompletion,
+            patch("app.services.extraction.completion") as mock_completion,
+        ):
+            mock_acompletion.return_value = self._response(valid)
+
+            result = await extract_with_llm_async(
+                content="Test content",
+                url="https://jobs.lever.co/corp/123",
+            )
+
+            assert result.title == "Engineer"
+            assert result.source == "Lever"
+            mock_acompletion.assert_awaited_once()
+            mock_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_with_llm_async_retry_on_invalid_json(self):
+        """Test that the async path keeps the JSON-correction retry."""
+        valid = json.dumps(
+            {
+                "title": "Engineer",
+                "company": "Corp",
+                "requirements_must_have": [],
+                "requirements_nice_to_have": [],
+                "skills": [],
+            }
+        )
+
+        with patch(
+            "app.services.extraction.acompletion", new_callable=AsyncMock
+        ) as mock_acompletion:
+            mock_acompletion.side_effect = [
+                self._response("invalid json{"),
+                self._response(valid),
+            ]
+
+            result = await extract_with_llm_async(
+                content="Test content",
+                url="https://example.com/job/123",
+            )
+
+            assert result.company == "Corp"
+            assert mock_acompletion.await_count == 2
+            retry_messages = mock_acompletion.call_args.kwargs["messages"]
+            assert retry_messages[2] == {
+                "role": "assistant",
+                "content": "invalid json{",
+            }
+
+    @pytest.mark.asyncio
+    async def test_extract_with_llm_async_timeout_raises_error(self):
+        """Test that async LLM timeouts map to ExtractionTimeoutError."""
+        with patch(
+            "app.services.extraction.acompletion", new_callable=AsyncMock
+        ) as mock_acompletion:
+            mock_acompletion.side_effect = openai.APITimeoutError("timeout")
+
+            with pytest.raises(ExtractionTimeoutError, match="timed out"):
+                await extract_with_llm_async(
+                    content="Test content",
+                    url="https://example.com/job/123",
+                    timeout=30,
+                )
+
+    @pytest.mark.asyncio
+    async def test_extract_with_llm_async_bounded_concurrency(self):
+        """Test that concurrent extractions never exceed the configured limit."""
+        valid = json.dumps({"title": "Engineer", "company": "Corp"})
+        in_flight = 0
+        peak = 0
+
+        async def slow_completion(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._response(valid)
+
+        with (
+            patch("app.services.extraction.acompletion", side_effect=slow_completion),
+            patch("app.services.extraction._extraction_semaphore", None),
+            patch(
+                "app.services.extraction.get_settings",
+                return_value=MagicMock(extraction_max_concurrency=2),
+            ),
+        ):
+            results = await asyncio.gather(
+                *[
+                    extract_with_llm_async(
+                        content="Test content",
+                        url=f"https://example.com/job/{i}",
+                    )
+                    for i in range(6)
+                ]
+            )
+
+        assert len(results) == 6
+        assert peak == 2
+
+
 class TestExtractJobData:
     """Test the main extract_job_data async function."""
 
@@ -441,7 +673,9 @@ class TestExtractJobData:
             )
         ]
 
-        with patch("app.services.extraction.completion") as mock_completion:
+        with patch(
+            "app.services.extraction.acompletion", new_callable=AsyncMock
+        ) as mock_completion:
             mock_completion.return_value = mock_response
 
             result = await extract_job_data(
@@ -482,7 +716,9 @@ class TestExtractJobData:
             )
         ]
 
-        with patch("app.services.extraction.completion") as mock_completion:
+        with patch(
+            "app.services.extraction.acompletion", new_callable=AsyncMock
+        ) as mock_completion:
             mock_completion.return_value = mock_response
 
             with pytest.raises(NoJobFoundError):
@@ -511,7 +747,9 @@ class TestExtractJobData:
             )
         ]
 
-        with patch("app.services.extraction.completion") as mock_completion:
+        with patch(
+            "app.services.extraction.acompletion", new_callable=AsyncMock
+        ) as mock_completion:
             mock_completion.return_value = mock_response
 
             await extract_job_data(
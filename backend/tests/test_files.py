@@ -0,0 +1,196 @@
+"""Tests for serving stored files: validators, 304s and byte ranges."""
+
+import os
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.security import create_access_token, get_password_hash
+from app.models import Application, ApplicationStatus, Round, RoundType, User
+
+CONTENT = os.urandom(64 * 1024)
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch) -> str:
+    """Point uploads at a temporary directory."""
+    monkeypatch.setattr(get_settings(), "upload_dir", str(tmp_path))
+    return str(tmp_path)
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession) -> User:
+    """Create a regular test user."""
+    user = User(
+        email="files@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+
+
+@pytest.fixture
+async def media(
+    client: AsyncClient, db: AsyncSession, test_user: User, auth_headers: dict
+) -> dict:
+    """Upload a recording to a new round and return its media entry."""
+    user_id = test_user.id
+    status = ApplicationStatus(name="Applied", color="#ffffff", user_id=user_id)
+    round_type = RoundType(name="Technical", user_id=user_id)
+    db.add_all([status, round_type])
+    await db.flush()
+    application = Application(
+        user_id=user_id,
+        status_id=status.id,
+        company="Acme",
+        job_title="Engineer",
+        applied_at=date(2026, 3, 1),
+    )
+    application.rounds = [Round(round_type_id=round_type.id)]
+    db.add(application)
+    await db.commit()
+
+    round_id = application.rounds[0].id
+    response = await client.post(
+        f"/api/rounds/{round_id}/media",
+        files={"file": ("call.mp4", CONTENT, "video/mp4")},
+        headers=auth_headers,
+    )
+    return response.json()["media"][0]
+
+
+class TestMediaServing:
+    async def test_sends_validators(
+        self, client: AsyncClient, auth_headers: dict, media: dict
+    ):
+        """Test that media carries a checksum ETag and must be revalidated."""
+        response = await client.get(
+            f"/api/files/media/{media['id']}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["etag"] == f'"{media["checksum"]}"'
+        assert response.headers["accept-ranges"] == "bytes"
+        assert "last-modified" in response.headers
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    async def test_conditional_requests_not_modified(
+        self, client: AsyncClient, auth_headers: dict, media: dict
+    ):
+        """Test that matching If-None-Match or If-Modified-Since gives 304."""
+        url = f"/api/files/media/{media['id']}"
+        first = await client.get(url, headers=auth_headers)
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = await client.get(
+            url,
+            headers={
+                **auth_headers,
+                "If-Modified-Since": first.headers["last-modified"],
+            },
+        )
+        assert response.status_code == 304
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": '"other"'}
+        )
+        assert response.status_code == 200
+
+    async def test_range_request(
+        self, client: AsyncClient, auth_headers: dict, media: dict
+    ):
+        """Test that a byte range is served as 206 with only those bytes."""
+        url = f"/api/files/media/{media['id']}"
+        response = await client.get(
+            url, headers={**auth_headers, "Range": "bytes=1000-1999"}
+        )
+        assert response.status_code == 206
+        assert response.content == CONTENT[1000:2000]
+        assert response.headers["content-range"] == f"bytes 1000-1999/{len(CONTENT)}"
+
+        # A stale If-Range falls back to the whole file
+        response = await client.get(
+            url,
+            headers={**auth_headers, "Range": "bytes=0-9", "If-Range": '"stale"'},
+        )
+        assert response.status_code == 200
+        assert len(response.content) == len(CONTENT)
+
+    async def test_signed_url_cacheable_until_expiry(
+        self, client: AsyncClient, auth_headers: dict, media: dict
+    ):
+        """Test that signed URLs may be reused while their token is valid."""
+        signed = await client.get(
+            f"/api/files/media/{media['id']}/signed", headers=auth_headers
+        )
+        response = await client.get(signed.json()["url"])
+        assert response.status_code == 200
+
+        directive, max_age = response.headers["cache-control"].split(", max-age=")
+        assert directive == "private"
+        assert 0 < int(max_age) <= signed.json()["expires_in"]
+
+
+class TestProxyDelivery:
+    async def test_x_accel_redirect(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        media: dict,
+        upload_dir: str,
+        monkeypatch,
+    ):
+        """Test that nginx mode returns only headers and an internal redirect."""
+        monkeypatch.setattr(get_settings(), "file_delivery", "x-accel-redirect")
+        response = await client.get(
+            f"/api/files/media/{media['id']}", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.content == b""
+        relative = os.path.relpath(media["file_path"], upload_dir)
+        assert response.headers["x-accel-redirect"] == (
+            f"/_protected/uploads/{relative}"
+        )
+        assert response.headers["content-type"] == "video/mp4"
+        assert response.headers["content-disposition"].startswith("inline")
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    async def test_x_sendfile(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        media: dict,
+        monkeypatch,
+    ):
+        """Test that sendfile mode points the proxy at the absolute path."""
+        monkeypatch.setattr(get_settings(), "file_delivery", "x-sendfile")
+        url = f"/api/files/media/{media['id']}"
+        response = await client.get(url, headers=auth_headers)
+
+        assert response.content == b""
+        assert response.headers["x-sendfile"] == os.path.realpath(media["file_path"])
+
+        # Conditional requests are still answered without involving the proxy
+        response = await client.get(
+            url,
+            headers={**auth_headers, "If-None-Match": f'"{media["checksum"]}"'},
+        )
+        assert response.status_code == 304
+        assert "x-sendfile" not in response.headers
@@ -0,0 +1,176 @@
+"""Query-plan regression checks for the main read endpoints.
+
+Every SELECT issued while serving the endpoints below is re-run under
+EXPLAIN, and the test fails if a per-user table is read with a full scan.
+On SQLite that is a ``SCAN <table>`` step; on PostgreSQL a ``Seq Scan``
+node while ``enable_seqscan`` is off, so only a missing index can produce
+one however small the test tables are. Set ``TEST_DATABASE_URL`` to run
+against PostgreSQL.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.core.security import (
+    create_access_token,
+    generate_api_token,
+    hash_api_token,
+)
+from app.models import (
+    Application,
+    ApplicationStatus,
+    ApplicationStatusHistory,
+    JobLead,
+    Round,
+    RoundMedia,
+    RoundType,
+    User,
+)
+
+# Tables that grow with usage and must always be read through an index
+WATCHED_TABLES = {
+    "applications",
+    "application_status_history",
+    "job_leads",
+    "rounds",
+    "round_media",
+    "search_documents",
+    "users",
+}
+
+
+@pytest.fixture
+async def data(db: AsyncSession) -> dict:
+    """Create a user with applications, rounds, history and job leads."""
+    api_token = generate_api_token()
+    prefix, token_hash = hash_api_token(api_token)
+    user = User(
+        email="plans@example.com",
+        password_hash="x",
+        is_active=True,
+        api_token_prefix=prefix,
+        api_token_hash=token_hash,
+    )
+    db.add(user)
+    await db.flush()
+    applied = ApplicationStatus(name="Applied", color="#ffffff", user_id=user.id)
+    interviewing = ApplicationStatus(
+        name="Interviewing", color="#ffffff", user_id=user.id
+    )
+    round_type = RoundType(name="Technical", user_id=user.id)
+    db.add_all([applied, interviewing, round_type])
+    await db.flush()
+
+    applications = []
+    for i in range(5):
+        application = Application(
+            user_id=user.id,
+            status_id=interviewing.id,
+            company=f"Company {i}",
+            job_title="Engineer",
+            job_url=f"https://example.com/apply/{i}",
+            applied_at=date(2026, 3, 1) + timedelta(days=i),
+        )
+        application.status_history = [
+            ApplicationStatusHistory(
+                from_status_id=applied.id, to_status_id=interviewing.id
+            )
+        ]
+        application.rounds = [
+            Round(
+                round_type_id=round_type.id,
+                media=[RoundMedia(file_path=f"media/{i}.mp3", media_type="audio")],
+            )
+        ]
+        applications.append(application)
+    db.add_all(applications)
+    db.add_all(
+        JobLead(
+            user_id=user.id,
+            url=f"https://example.com/jobs/{i}",
+            status="extracted",
+            title="Engineer",
+        )
+        for i in range(5)
+    )
+    await db.commit()
+    return {
+        "user": user,
+        "status": interviewing,
+        "application": applications[0],
+        "bearer": {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"},
+        "api_key": {"X-API-Key": api_token},
+    }
+
+
+async def _full_scans(conn: AsyncConnection, statement: str, parameters) -> list[str]:
+    """Plan steps of one statement that scan a watched table."""
+    if conn.dialect.name == "postgresql":
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        scans = []
+        nodes = [result.scalar()[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get("Plans", []))
+            if (
+                node["Node Type"] == "Seq Scan"
+                and node.get("Relation Name") in WATCHED_TABLES
+            ):
+                scans.append(f"Seq Scan on {node['Relation Name']}")
+        return scans
+
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [
+        detail
+        for *_, detail in result
+        if detail.startswith("SCAN ") and detail.split()[1] in WATCHED_TABLES
+    ]
+
+
+async def test_main_endpoints_use_indexes(
+    client: AsyncClient, db: AsyncSession, db_engine: AsyncEngine, data: dict
+):
+    """Test that list, lookup and detail endpoints never scan a watched table."""
+    statements: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    application = data["application"]
+    bearer, api_key = data["bearer"], data["api_key"]
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        first = await client.get("/api/applications?per_page=2", headers=bearer)
+        cursor = first.json()["next_cursor"]
+        for url, headers in [
+            (f"/api/applications?per_page=2&cursor={cursor}", bearer),
+            (f"/api/applications?status_id={data['status'].id}", bearer),
+            (f"/api/applications?url={application.job_url}", api_key),
+            ("/api/applications?search=comp", bearer),
+            (f"/api/applications/{application.id}", bearer),
+            (f"/api/applications/{application.id}/history", bearer),
+            ("/api/job-leads", bearer),
+            ("/api/job-leads?search=https://example.com/jobs/3", api_key),
+        ]:
+            response = await client.get(url, headers=headers)
+            assert response.status_code == 200, url
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    conn = await db.connection()
+    if conn.dialect.name == "postgresql":
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    regressions = {}
+    for statement, parameters in statements:
+        scans = await _full_scans(conn, statement, parameters)
+        if scans:
+            regressions[statement] = scans
+    assert not regressions
@@ -0,0 +1,300 @@
+"""Tests for full-text search over applications and job leads."""
+
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token, get_password_hash
+from app.models import Application, ApplicationStatus, JobLead, SearchDocument, User
+from app.services.search import rebuild_search_index, search_terms
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession) -> User:
+    """Create a regular test user."""
+    user = User(
+        email="search@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_admin=False,
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    token = create_access_token({"sub": test_user.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def applications(db: AsyncSession, test_user: User) -> dict[str, Application]:
+    """Create applications with text in different searchable fields."""
+    status = ApplicationStatus(name="Applied", color="#ffffff", user_id=test_user.id)
+    db.add(status)
+    await db.flush()
+
+    def application(company: str, job_title: str, **fields) -> Application:
+        return Application(
+            user_id=test_user.id,
+            status_id=status.id,
+            company=company,
+            job_title=job_title,
+            applied_at=date(2026, 3, 1),
+            **fields,
+        )
+
+    created = {
+        "title": application("Kubernetes Inc", "Platform Engineer"),
+        "skills": application(
+            "Acme", "Backend Engineer", skills=["Python", "Kubernetes"]
+        ),
+        "recruiter": application(
+            "Globex", "Data Analyst", recruiter_name="Jane Kowalski"
+        ),
+        "description": application(
+            "Initech", "Designer", job_description="Remote-friendly design team"
+        ),
+    }
+    db.add_all(created.values())
+    await db.commit()
+    return created
+
+
+async def _search(
+    client: AsyncClient, headers: dict[str, str], term: str, **params
+) -> list[str]:
+    response = await client.get(
+        "/api/applications", params={"search": term, **params}, headers=headers
+    )
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()["items"]]
+
+
+class TestSearchTerms:
+    def test_splits_words_and_drops_punctuation(self):
+        """Test that query syntax characters never reach the index."""
+        assert search_terms('Back-end "C++" dev*') == ["back", "end", "c", "dev"]
+
+
+class TestApplicationSearch:
+    async def test_prefix_match_across_fields(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that word prefixes match in title, skills and recruiter fields."""
+        assert set(await _search(client, auth_headers, "kube")) == {
+            applications["title"].id,
+            applications["skills"].id,
+        }
+        assert await _search(client, auth_headers, "kowal") == [
+            applications["recruiter"].id
+        ]
+        assert await _search(client, auth_headers, "remote design") == [
+            applications["description"].id
+        ]
+
+    async def test_title_matches_rank_first(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that a company match outranks a skills match."""
+        assert await _search(client, auth_headers, "kubernetes") == [
+            applications["title"].id,
+            applications["skills"].id,
+        ]
+
+    async def test_all_words_must_match(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that every search word narrows the results."""
+        assert await _search(client, auth_headers, "engineer python") == [
+            applications["skills"].id
+        ]
+
+    async def test_input_without_words_matches_nothing(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that punctuation-only input does not return the whole list."""
+        response = await client.get(
+            "/api/applications", params={"search": "!!!"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["items"] == []
+        assert body["total"] == 0
+        assert body["next_cursor"] is None
+
+    async def test_other_users_documents_excluded(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        applications: dict[str, Application],
+    ):
+        """Test that search only returns the caller's applications."""
+        other = User(email="other@example.com", password_hash="x", is_active=True)
+        db.add(other)
+        await db.commit()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': other.id})}"}
+        assert await _search(client, headers, "kube") == []
+
+    async def test_index_follows_updates_and_deletes(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that edits and deletes through the API update the index."""
+        target = applications["description"]
+        response = await client.patch(
+            f"/api/applications/{target.id}",
+            json={"job_title": "Site Reliability Engineer"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert await _search(client, auth_headers, "reliab") == [target.id]
+        assert await _search(client, auth_headers, "designer") == []
+
+        await client.delete(f"/api/applications/{target.id}", headers=auth_headers)
+        assert await _search(client, auth_headers, "reliab") == []
+        remaining = await db.scalar(
+            select(SearchDocument.id).where(SearchDocument.doc_id == target.id)
+        )
+        assert remaining is None
+
+    async def test_cursor_pages_follow_rank(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that cursor paging through ranked results keeps rank order."""
+        first = await client.get(
+            "/api/applications",
+            params={"search": "kubernetes", "per_page": 1},
+            headers=auth_headers,
+        )
+        data = first.json()
+        assert data["total"] == 2
+        second = await client.get(
+            "/api/applications",
+            params={
+                "search": "kubernetes",
+                "per_page": 1,
+                "cursor": data["next_cursor"],
+            },
+            headers=auth_headers,
+        )
+        assert [data["items"][0]["id"], second.json()["items"][0]["id"]] == [
+            applications["title"].id,
+            applications["skills"].id,
+        ]
+        assert second.json()["next_cursor"] is None
+
+
+class TestJobLeadSearch:
+    @pytest.fixture
+    async def job_leads(self, db: AsyncSession, test_user: User) -> list[JobLead]:
+        leads = [
+            JobLead(
+                user_id=test_user.id,
+                url="https://example.com/jobs/1",
+                status="extracted",
+                title="Rust Developer",
+                company="Ferris Labs",
+            ),
+            JobLead(
+                user_id=test_user.id,
+                url="https://example.com/jobs/2",
+                status="extracted",
+                title="Go Developer",
+                company="Gopher Co",
+                description="Some Rust experience is a plus",
+            ),
+        ]
+        db.add_all(leads)
+        await db.commit()
+        return leads
+
+    async def test_text_search_is_ranked(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        job_leads: list[JobLead],
+    ):
+        """Test that free text searches title, company and description."""
+        response = await client.get(
+            "/api/job-leads", params={"search": "rust"}, headers=auth_headers
+        )
+        assert [item["id"] for item in response.json()["items"]] == [
+            job_leads[0].id,
+            job_leads[1].id,
+        ]
+
+    async def test_input_without_words_matches_nothing(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        job_leads: list[JobLead],
+    ):
+        """Test that punctuation-only input does not return the whole list."""
+        response = await client.get(
+            "/api/job-leads", params={"search": "!!!"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["items"] == []
+        assert body["total"] == 0
+        assert body["next_cursor"] is None
+
+    async def test_url_is_matched_exactly(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        job_leads: list[JobLead],
+    ):
+        """Test that a URL still performs the extension's exact lookup."""
+        response = await client.get(
+            "/api/job-leads",
+            params={"search": "https://example.com/jobs/2"},
+            headers=auth_headers,
+        )
+        assert [item["id"] for item in response.json()["items"]] == [job_leads[1].id]
+
+
+class TestRebuildSearchIndex:
+    async def test_rebuild_restores_documents(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+        applications: dict[str, Application],
+    ):
+        """Test that a rebuild repairs an index emptied by a bulk delete."""
+        await db.execute(delete(SearchDocument))
+        await db.commit()
+        assert await _search(client, auth_headers, "kube") == []
+
+        written = await rebuild_search_index(db, test_user.id)
+
+        assert written == len(applications)
+        assert len(await _search(client, auth_headers, "kube")) == 2
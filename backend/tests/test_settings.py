@@ -11,7 +11,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import generate_api_token, get_password_hash
+from app.core.security import generate_api_token, get_password_hash, hash_api_token
 from app.core.themes import (
     ACCENT_OPTIONS,
     DEFAULT_ACCENT,
@@ -26,14 +26,28 @@ from app.models import User
 
 
 @pytest.fixture
-async def test_user(db: AsyncSession) -> User:
+def api_token() -> str:
+    """Generate the API token held by test_user."""
+    return generate_api_token()
+
+
+@pytest.fixture
+def settings_api_token() -> str:
+    """Generate the API token held by test_user_with_settings."""
+    return generate_api_token()
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession, api_token: str) -> User:
     """Create a regular test user with API token."""
+    prefix, token_hash = hash_api_token(api_token)
     user = User(
         email="settings_test@example.com",
         password_hash=get_password_hash("testpass123"),
         is_admin=False,
         is_active=True,
-        api_token=generate_api_token(),
+        api_token_prefix=prefix,
+        api_token_hash=token_hash,
     )
     db.add(user)
     await db.commit()
@@ -42,15 +56,17 @@ async def test_user(db: AsyncSession) -> User:
 
 
 @pytest.fixture
-async def test_user_with_settings(db: AsyncSession) -> User:
+async def test_user_with_settings(db: AsyncSession, settings_api_token: str) -> User:
     """Create a user with existing settings and API token."""
+    prefix, token_hash = hash_api_token(settings_api_token)
     user = User(
         email="settings_custom@example.com",
         password_hash=get_password_hash("testpass123"),
         is_admin=False,
         is_active=True,
         settings={"theme": "catppuccin", "accent": "blue"},
-        api_token=generate_api_token(),
+        api_token_prefix=prefix,
+        api_token_hash=token_hash,
     )
     db.add(user)
     await db.commit()
@@ -59,15 +75,17 @@ async def test_user_with_settings(db: AsyncSession) -> User:
 
 
 @pytest.fixture
-def auth_headers(test_user: User) -> dict[str, str]:
+def auth_headers(test_user: User, api_token: str) -> dict[str, str]:
     """Create API token auth headers for a regular user."""
-    return {"X-API-Key": test_user.api_token}
+    return {"X-API-Key": api_token}
 
 
 @pytest.fixture
-def auth_headers_with_settings(test_user_with_settings: User) -> dict[str, str]:
+def auth_headers_with_settings(
+    test_user_with_settings: User, settings_api_token: str
+) -> dict[str, str]:
     """Create API token auth headers for a user with settings."""
-    return {"X-API-Key": test_user_with_settings.api_token}
+    return {"X-API-Key": settings_api_token}
 
 
 # ============================================================================
@@ -0,0 +1,344 @@
+"""Tests for streamed and resumable file uploads."""
+
+import base64
+import fcntl
+import hashlib
+import os
+import time
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.security import create_access_token, get_password_hash
+from app.models import (
+    Application,
+    ApplicationStatus,
+    MediaUpload,
+    Round,
+    RoundMedia,
+    RoundType,
+    User,
+)
+from app.services.blob_store import collect_garbage
+from app.services.resumable_uploads import partial_path, sweep_expired_uploads
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch) -> str:
+    """Point uploads at a temporary directory with a 1MB media limit."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "max_media_size_mb", 1)
+    return str(tmp_path)
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession) -> User:
+    """Create a regular test user."""
+    user = User(
+        email="uploads@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_active=True,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+
+
+@pytest.fixture
+async def round_(db: AsyncSession, test_user: User) -> Round:
+    """Create an application with one interview round."""
+    status = ApplicationStatus(name="Applied", color="#ffffff", user_id=test_user.id)
+    round_type = RoundType(name="Technical", user_id=test_user.id)
+    db.add_all([status, round_type])
+    await db.flush()
+    application = Application(
+        user_id=test_user.id,
+        status_id=status.id,
+        company="Acme",
+        job_title="Engineer",
+        applied_at=date(2026, 3, 1),
+    )
+    application.rounds = [Round(round_type_id=round_type.id)]
+    db.add(application)
+    await db.commit()
+    return application.rounds[0]
+
+
+class TestMediaUpload:
+    async def test_streams_file_and_records_checksum(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        round_: Round,
+        upload_dir: str,
+    ):
+        """Test that media is written whole with its size and SHA-256."""
+        content = os.urandom(3 * 1024 * 1024 // 4)
+        response = await client.post(
+            f"/api/rounds/{round_.id}/media",
+            files={"file": ("call.mp3", content, "audio/mpeg")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        media = response.json()["media"][0]
+        digest = hashlib.sha256(content).hexdigest()
+        assert media["file_size"] == len(content)
+        assert media["checksum"] == digest
+        assert media["file_path"] == os.path.join(
+            upload_dir, "blobs", digest[:2], digest[2:4], f"{digest}.mp3"
+        )
+        with open(media["file_path"], "rb") as f:
+            assert f.read() == content
+        assert os.listdir(os.path.join(upload_dir, "blobs", ".incoming")) == []
+
+    async def test_oversized_upload_leaves_nothing_behind(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        round_: Round,
+        upload_dir: str,
+    ):
+        """Test that a file over the limit is rejected and cleaned up."""
+        response = await client.post(
+            f"/api/rounds/{round_.id}/media",
+            files={"file": ("call.mp3", b"\0" * (1024 * 1024 + 1), "audio/mpeg")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+        assert os.listdir(upload_dir) == []
+
+
+class TestDocumentUpload:
+    async def test_cv_replaced_atomically(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        round_: Round,
+    ):
+        """Test that re-uploading a CV replaces it and frees the old file."""
+        url = f"/api/applications/{round_.application_id}/cv"
+        first = await client.post(
+            url,
+            files={"file": ("cv.pdf", b"first", "application/pdf")},
+            headers=auth_headers,
+        )
+        second = await client.post(
+            url,
+            files={"file": ("cv.doc", b"second", "application/msword")},
+            headers=auth_headers,
+        )
+        assert first.status_code == second.status_code == 200
+
+        cv_path = second.json()["cv_path"]
+        with open(cv_path, "rb") as f:
+            assert f.read() == b"second"
+
+        # The first file is unreferenced and goes at the next collection
+        assert await collect_garbage(db, grace=timedelta(0)) == 1
+        assert not os.path.exists(first.json()["cv_path"])
+        assert os.path.exists(cv_path)
+
+
+def _metadata(**values: str) -> str:
+    """Encode a tus Upload-Metadata header."""
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}"
+        for key, value in values.items()
+    )
+
+
+class TestResumableUpload:
+    async def _create(
+        self, client: AsyncClient, round_: Round, headers: dict, length: int
+    ) -> str:
+        response = await client.post(
+            f"/api/rounds/{round_.id}/media/uploads",
+            headers={
+                **headers,
+                "Upload-Length": str(length),
+                "Upload-Metadata": _metadata(
+                    filename="call.webm", filetype="video/webm"
+                ),
+            },
+        )
+        assert response.status_code == 201
+        assert response.headers["Upload-Offset"] == "0"
+        return response.headers["Location"]
+
+    async def _patch(
+        self, client: AsyncClient, url: str, headers: dict, offset: int, data: bytes
+    ):
+        return await client.patch(
+            url,
+            content=data,
+            headers={
+                **headers,
+                "Upload-Offset": str(offset),
+                "Content-Type": "application/offset+octet-stream",
+            },
+        )
+
+    async def test_resume_after_partial_upload(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        round_: Round,
+        upload_dir: str,
+    ):
+        """Test that an upload can continue from the offset HEAD reports."""
+        content = os.urandom(300_000)
+        url = await self._create(client, round_, auth_headers, len(content))
+
+        response = await self._patch(client, url, auth_headers, 0, content[:100_000])
+        assert response.status_code == 204
+        assert response.headers["Upload-Offset"] == "100000"
+
+        response = await client.head(url, headers=auth_headers)
+        assert response.headers["Upload-Offset"] == "100000"
+        assert response.headers["Upload-Length"] == str(len(content))
+
+        response = await self._patch(
+            client, url, auth_headers, 100_000, content[100_000:]
+        )
+        assert response.status_code == 204
+        media_url = response.headers["Location"]
+
+        result = await db.execute(
+            select(RoundMedia).where(RoundMedia.round_id == round_.id)
+        )
+        media = result.scalars().one()
+        assert media_url == f"/api/files/media/{media.id}"
+        assert media.media_type == "video"
+        assert media.file_path.endswith(".webm")
+        assert media.file_size == len(content)
+        assert media.checksum == hashlib.sha256(content).hexdigest()
+        with open(media.file_path, "rb") as f:
+            assert f.read() == content
+
+        assert (await db.execute(select(MediaUpload))).first() is None
+        assert os.listdir(os.path.join(upload_dir, ".partial")) == []
+        assert (await client.head(url, headers=auth_headers)).status_code == 404
+
+    async def test_offset_mismatch_conflicts(
+        self, client: AsyncClient, auth_headers: dict[str, str], round_: Round
+    ):
+        """Test that a PATCH at a stale offset is rejected."""
+        url = await self._create(client, round_, auth_headers, 10)
+        await self._patch(client, url, auth_headers, 0, b"12345")
+
+        response = await self._patch(client, url, auth_headers, 0, b"12345")
+        assert response.status_code == 409
+
+        response = await self._patch(client, url, auth_headers, 5, b"123456")
+        assert response.status_code == 413
+
+    async def test_concurrent_patch_is_locked_out(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        round_: Round,
+    ):
+        """Test that a PATCH while another is writing gets 423 and writes nothing."""
+        url = await self._create(client, round_, auth_headers, 10)
+        path = partial_path(url.rsplit("/", 1)[1])
+
+        with open(path, "r+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            response = await self._patch(client, url, auth_headers, 0, b"12345")
+        assert response.status_code == 423
+        assert os.path.getsize(path) == 0
+
+        response = await self._patch(client, url, auth_headers, 0, b"12345")
+        assert response.status_code == 204
+        assert response.headers["Upload-Offset"] == "5"
+
+    async def test_rejects_oversized_and_non_media(
+        self, client: AsyncClient, auth_headers: dict[str, str], round_: Round
+    ):
+        """Test that the announced size and type are validated up front."""
+        url = f"/api/rounds/{round_.id}/media/uploads"
+        response = await client.post(
+            url,
+            headers={
+                **auth_headers,
+                "Upload-Length": str(1024 * 1024 + 1),
+                "Upload-Metadata": _metadata(filetype="video/mp4"),
+            },
+        )
+        assert response.status_code == 413
+
+        response = await client.post(
+            url,
+            headers={
+                **auth_headers,
+                "Upload-Length": "10",
+                "Upload-Metadata": _metadata(filetype="application/pdf"),
+            },
+        )
+        assert response.status_code == 400
+
+    async def test_cancel_and_expiry_remove_partial_files(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        round_: Round,
+        upload_dir: str,
+    ):
+        """Test that cancelled and expired uploads leave nothing behind."""
+        cancelled = await self._create(client, round_, auth_headers, 10)
+        abandoned = await self._create(client, round_, auth_headers, 10)
+        partial_dir = os.path.join(upload_dir, ".partial")
+        assert len(os.listdir(partial_dir)) == 2
+
+        response = await client.delete(cancelled, headers=auth_headers)
+        assert response.status_code == 204
+        assert len(os.listdir(partial_dir)) == 1
+
+        await db.execute(
+            update(MediaUpload).values(expires_at=datetime.now(UTC) - timedelta(1))
+        )
+        await db.commit()
+        assert (await client.head(abandoned, headers=auth_headers)).status_code == 404
+
+        assert await sweep_expired_uploads(db) == 1
+        assert os.listdir(partial_dir) == []
+
+    async def test_sweep_removes_orphaned_partial_files(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        round_: Round,
+        upload_dir: str,
+    ):
+        """Test that partial files whose row was cascaded away are swept."""
+        await self._create(client, round_, auth_headers, 10)
+        # What ON DELETE CASCADE does when the round is deleted
+        await db.execute(delete(MediaUpload))
+        await db.commit()
+        partial_dir = os.path.join(upload_dir, ".partial")
+        (name,) = os.listdir(partial_dir)
+
+        # Too recent to tell apart from an upload still being created
+        assert await sweep_expired_uploads(db) == 0
+        assert os.listdir(partial_dir) == [name]
+
+        stale = time.time() - 7200
+        os.utime(os.path.join(partial_dir, name), (stale, stale))
+        await sweep_expired_uploads(db)
+        assert os.listdir(partial_dir) == []
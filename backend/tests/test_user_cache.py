@@ -0,0 +1,217 @@
+"""Tests for the authenticated-user cache."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import (
+    create_access_token,
+    generate_api_token,
+    get_password_hash,
+    hash_api_token,
+)
+from app.models import User
+from app.services.user_cache import UserCache, user_cache
+
+
+@pytest.fixture(autouse=True)
+def cold_cache():
+    """Start every test with an empty cache and zeroed counters."""
+    user_cache.clear()
+    user_cache.stats.hits = user_cache.stats.misses = 0
+
+
+@pytest.fixture
+def api_token() -> str:
+    """Generate the API token held by test_user."""
+    return generate_api_token()
+
+
+@pytest.fixture
+async def test_user(db: AsyncSession, api_token: str) -> User:
+    """Create a regular user with an API token."""
+    prefix, token_hash = hash_api_token(api_token)
+    user = User(
+        email="cached@example.com",
+        password_hash=get_password_hash("testpass123"),
+        is_admin=False,
+        is_active=True,
+        api_token_prefix=prefix,
+        api_token_hash=token_hash,
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def admin_headers(db: AsyncSession) -> dict[str, str]:
+    """Create an admin and return Bearer auth headers for them."""
+    admin = User(
+        email="cache-admin@example.com",
+        password_hash=get_password_hash("adminpass123"),
+        is_admin=True,
+        is_active=True,
+    )
+    db.add(admin)
+    await db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': admin.id})}"}
+
+
+@pytest.fixture
+def auth_headers(test_user: User) -> dict[str, str]:
+    """Create Bearer token auth headers for the test user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+
+
+@pytest.fixture
+def user_queries(db_engine):
+    """Record SELECTs on the users table."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT users."):
+            statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestUserCache:
+    async def test_repeated_requests_skip_user_lookup(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        user_queries: list[str],
+    ):
+        """Test that only the first of several requests loads the user."""
+        for _ in range(3):
+            response = await client.get("/api/profile", headers=auth_headers)
+            assert response.status_code == 200
+
+        assert len(user_queries) == 1
+        assert (user_cache.stats.hits, user_cache.stats.misses) == (2, 1)
+
+    async def test_api_token_lookups_are_cached(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        api_token: str,
+        user_queries: list[str],
+    ):
+        """Test that API token authentication is cached by token hash."""
+        headers = {"X-API-Key": api_token}
+        for _ in range(2):
+            response = await client.get("/api/users/settings", headers=headers)
+            assert response.status_code == 200
+
+        assert len(user_queries) == 1
+
+    async def test_cached_user_changes_are_saved(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict[str, str],
+    ):
+        """Test that a user served from the cache can still be updated."""
+        await client.get("/api/profile", headers=auth_headers)
+        response = await client.post(
+            "/api/settings/api-key/regenerate", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert user_cache.stats.hits == 1
+
+        await db.refresh(test_user)
+        new_token = response.json()["api_key_full"]
+        assert test_user.api_token_hash == hash_api_token(new_token)[1]
+
+    async def test_deactivation_applies_immediately(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        auth_headers: dict[str, str],
+        admin_headers: dict[str, str],
+    ):
+        """Test that an admin deactivating a user evicts the cached entry."""
+        assert (await client.get("/api/profile", headers=auth_headers)).is_success
+
+        await client.patch(
+            f"/api/admin/users/{test_user.id}",
+            json={"is_active": False},
+            headers=admin_headers,
+        )
+
+        response = await client.get("/api/profile", headers=auth_headers)
+        assert response.status_code == 403
+
+    async def test_regenerated_token_replaces_old_one(
+        self,
+        client: AsyncClient,
+        api_token: str,
+        auth_headers: dict[str, str],
+    ):
+        """Test that the old API token stops working after regeneration."""
+        old_headers = {"X-API-Key": api_token}
+        assert (await client.get("/api/users/settings", headers=old_headers)).is_success
+
+        response = await client.post(
+            "/api/settings/api-key/regenerate", headers=auth_headers
+        )
+        new_headers = {"X-API-Key": response.json()["api_key_full"]}
+
+        assert (
+            await client.get("/api/users/settings", headers=old_headers)
+        ).status_code == 401
+        assert (await client.get("/api/users/settings", headers=new_headers)).is_success
+
+    async def test_deleted_user_is_evicted(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        auth_headers: dict[str, str],
+        admin_headers: dict[str, str],
+    ):
+        """Test that deleting a user removes them from the cache."""
+        await client.get("/api/profile", headers=auth_headers)
+        assert test_user.id in user_cache._users
+
+        response = await client.delete(
+            f"/api/admin/users/{test_user.id}", headers=admin_headers
+        )
+        assert response.status_code == 204
+
+        assert test_user.id not in user_cache._users
+        response = await client.get("/api/profile", headers=auth_headers)
+        assert response.status_code == 401
+
+    async def test_admin_stats_report_counters(
+        self, client: AsyncClient, admin_headers: dict[str, str]
+    ):
+        """Test that the hit counters are exposed to admins."""
+        await client.get("/api/admin/stats", headers=admin_headers)
+        response = await client.get("/api/admin/stats", headers=admin_headers)
+
+        data = response.json()
+        assert data["user_cache_hits"] == 1
+        assert data["user_cache_misses"] == 1
+        assert data["user_cache_entries"] == 1
+
+
+class TestUserCacheBounds:
+    def test_evicts_least_recently_used(self, monkeypatch):
+        """Test that the entry count stays bounded and tokens go with users."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "user_cache_max_entries", 2)
+        cache = UserCache()
+        users = [User(id=f"user-{i}", email=f"{i}@example.com") for i in range(3)]
+        for user in users:
+            cache.set(user, token=f"token-{user.id}")
+
+        assert len(cache) == 2
+        assert "user-0" not in cache._users
+        assert "user-0" not in cache._tokens.values()
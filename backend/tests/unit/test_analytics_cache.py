@@ -0,0 +1,40 @@
+"""Tests for the analytics response cache backend and keys."""
+
+from app.services.analytics_cache import _MemoryBackend, cache_key
+
+
+class TestMemoryBackend:
+    """Tests for the in-process LRU backend."""
+
+    async def test_evicts_least_recently_used(self):
+        """Test that the entry count stays bounded."""
+        backend = _MemoryBackend(max_entries=2, ttl_seconds=60)
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.get("a")
+        await backend.set("c", b"3")
+
+        assert len(backend) == 2
+        assert await backend.get("a") == b"1"
+        assert await backend.get("b") is None
+
+    async def test_expired_entries_are_dropped(self):
+        """Test that entries past their TTL are not returned."""
+        backend = _MemoryBackend(max_entries=2, ttl_seconds=-1)
+        await backend.set("a", b"1")
+
+        assert await backend.get("a") is None
+        assert len(backend) == 0
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_key_changes_with_version_and_params(self):
+        """Test that version and parameters both change the key."""
+        base = cache_key("analytics.kpis", "user", 1, {"period": "30d"})
+
+        assert base == cache_key("analytics.kpis", "user", 1, {"period": "30d"})
+        assert base != cache_key("analytics.kpis", "user", 2, {"period": "30d"})
+        assert base != cache_key("analytics.kpis", "user", 1, {"period": "7d"})
+        assert base != cache_key("analytics.kpis", "other", 1, {"period": "30d"})
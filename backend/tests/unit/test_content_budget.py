@@ -0,0 +1,90 @@
+"""Tests for token-budget content packing."""
+
+from app.services.content_budget import estimate_tokens, pack_content
+
+MODEL = "gpt-4o-mini"
+
+POSTING = """Senior Engineer at Acme
+Berlin, Germany
+
+We use cookies to improve your experience. See our privacy policy.
+
+## Responsibilities
+
+Build and operate Python APIs.
+
+## Requirements
+
+5+ years of experience with PostgreSQL.
+
+## Benefits
+
+Medical insurance, dental coverage, 401k matching and paid time off.
+
+Acme is an equal opportunity employer and does not discriminate without
+regard to race, color, religion, sex or protected veteran status."""
+
+
+class TestPackContent:
+    """Tests for pack_content."""
+
+    def test_drops_boilerplate_sections(self):
+        """Test that cookie, benefits and EEO sections are removed."""
+        packed = pack_content(POSTING, MODEL, max_tokens=10_000)
+
+        assert "Senior Engineer at Acme" in packed
+        assert "Build and operate Python APIs." in packed
+        assert "PostgreSQL" in packed
+        assert "cookies" not in packed
+        assert "401k" not in packed
+        assert "equal opportunity" not in packed
+
+    def test_packs_highest_value_sections_within_budget(self):
+        """Test that low-value filler is dropped first when over budget."""
+        filler = "\n\n".join(f"Team offsite story number {i}." for i in range(200))
+        content = POSTING + "\n\n" + filler
+        budget = estimate_tokens(POSTING, MODEL)
+
+        packed = pack_content(content, MODEL, max_tokens=budget)
+
+        assert estimate_tokens(packed, MODEL) <= budget + 10
+        assert "Senior Engineer at Acme" in packed
+        assert "## Requirements" in packed
+        # Original order is preserved
+        assert packed.index("Responsibilities") < packed.index("Requirements")
+
+    def test_single_line_text_is_split_by_line(self):
+        """Test that innerText without blank lines is still filtered."""
+        content = (
+            "Data Analyst - Globex\n"
+            "Remote\n"
+            "Accept all cookies\n"
+            "Requirements: SQL and 3 years of experience\n"
+        )
+        packed = pack_content(content, MODEL, max_tokens=1000)
+
+        assert "cookies" not in packed
+        assert "SQL" in packed
+
+    def test_oversized_section_is_truncated(self):
+        """Test that a single section larger than the budget is cut down."""
+        content = "Requirements:\n" + "\n".join(
+            f"- experience with tool {i}" for i in range(2000)
+        )
+        packed = pack_content(content, MODEL, max_tokens=200)
+
+        assert estimate_tokens(packed, MODEL) <= 210
+        assert packed.startswith("Requirements:")
+
+    def test_zero_budget_disables_packing(self):
+        """Test that a budget of 0 returns the content unchanged."""
+        assert pack_content(POSTING, MODEL, max_tokens=0) == POSTING
+
+    def test_all_boilerplate_returns_original(self):
+        """Test that content is never packed down to nothing."""
+        content = "We use cookies. Read our privacy policy."
+        assert pack_content(content, MODEL, max_tokens=1000) == content
+
+    def test_unknown_model_falls_back_to_estimate(self):
+        """Test that token estimation works for any model name."""
+        assert estimate_tokens("x" * 400, "not-a-real/model") > 0
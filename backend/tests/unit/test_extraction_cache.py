@@ -0,0 +1,141 @@
+"""Tests for the extraction result cache."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.models import ExtractionCacheEntry
+from app.schemas.job_lead import JobLeadExtractionInput
+from app.services import extraction_cache
+from app.services.extraction import extract_job_data
+from app.services.extraction_cache import (
+    extraction_cache_key,
+    get_cached_extraction,
+    store_extraction,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    """Start every test with zeroed counters."""
+    extraction_cache.cache_stats.hits = 0
+    extraction_cache.cache_stats.misses = 0
+
+
+def _result(title: str = "Engineer") -> JobLeadExtractionInput:
+    return JobLeadExtractionInput(title=title, company="Acme", skills=["Python"])
+
+
+class TestCacheKey:
+    """Tests for extraction_cache_key."""
+
+    def test_whitespace_is_normalized(self):
+        """Test that formatting differences map to the same key."""
+        assert extraction_cache_key("Senior  Engineer\n\nAcme ", "m") == (
+            extraction_cache_key("Senior Engineer Acme", "m")
+        )
+
+    def test_model_is_part_of_key(self):
+        """Test that different models get different entries."""
+        assert extraction_cache_key("text", "a") != extraction_cache_key("text", "b")
+
+
+class TestCacheStore:
+    """Tests for get_cached_extraction and store_extraction."""
+
+    async def test_miss_then_hit(self, db: AsyncSession):
+        """Test that a stored result is returned and counted as a hit."""
+        key = extraction_cache_key("posting", "gpt-4o-mini")
+
+        assert await get_cached_extraction(db, key) is None
+        await store_extraction(db, key, "gpt-4o-mini", _result())
+        cached = await get_cached_extraction(db, key)
+
+        assert cached is not None
+        assert cached.title == "Engineer"
+        assert cached.skills == ["Python"]
+        assert extraction_cache.cache_stats.hits == 1
+        assert extraction_cache.cache_stats.misses == 1
+
+        entry = await db.get(ExtractionCacheEntry, key)
+        assert entry.hit_count == 1
+
+    async def test_expired_entry_is_a_miss(self, db: AsyncSession):
+        """Test that entries older than the TTL are dropped."""
+        key = extraction_cache_key("old posting", "gpt-4o-mini")
+        await store_extraction(db, key, "gpt-4o-mini", _result())
+        entry = await db.get(ExtractionCacheEntry, key)
+        entry.created_at = datetime.now(UTC) - timedelta(days=30)
+        await db.commit()
+
+        assert await get_cached_extraction(db, key) is None
+        # The cache works in its own session; drop this one's stale copy
+        db.expunge_all()
+        assert await db.get(ExtractionCacheEntry, key) is None
+
+    async def test_lru_eviction(self, db: AsyncSession):
+        """Test that the least recently used entries are evicted."""
+        settings = Settings(extraction_cache_max_entries=2)
+        with patch.object(extraction_cache, "get_settings", return_value=settings):
+            keys = [extraction_cache_key(f"posting {i}", "m") for i in range(3)]
+            await store_extraction(db, keys[0], "m", _result("First"))
+            await store_extraction(db, keys[1], "m", _result("Second"))
+            # Touch the first entry so the second becomes least recently used
+            entry = await db.get(ExtractionCacheEntry, keys[1])
+            entry.last_accessed_at = datetime.now(UTC) - timedelta(hours=1)
+            await db.commit()
+            await get_cached_extraction(db, keys[0])
+            await store_extraction(db, keys[2], "m", _result("Third"))
+
+        count = await db.scalar(select(func.count()).select_from(ExtractionCacheEntry))
+        assert count == 2
+        db.expunge_all()
+        assert await db.get(ExtractionCacheEntry, keys[1]) is None
+
+    async def test_disabled_cache_is_bypassed(self, db: AsyncSession):
+        """Test that nothing is stored when the cache is disabled."""
+        settings = Settings(extraction_cache_enabled=False)
+        with patch.object(extraction_cache, "get_settings", return_value=settings):
+            key = extraction_cache_key("posting", "m")
+            await store_extraction(db, key, "m", _result())
+            assert await get_cached_extraction(db, key) is None
+
+        assert await db.get(ExtractionCacheEntry, key) is None
+
+
+class TestExtractJobDataCaching:
+    """Tests for the cache in front of extract_job_data."""
+
+    async def test_second_extraction_skips_llm(self, db: AsyncSession):
+        """Test that identical content is only sent to the LLM once."""
+        with patch(
+            "app.services.extraction.extract_with_llm_async",
+            new_callable=AsyncMock,
+            return_value=_result("Cached Role"),
+        ) as mock_llm:
+            first = await extract_job_data(
+                text="Cached Role at Acme", url="https://a.example/1", db=db
+            )
+            second = await extract_job_data(
+                text="  Cached Role   at Acme\n", url="https://b.example/2", db=db
+            )
+
+        assert mock_llm.await_count == 1
+        assert first.title == second.title == "Cached Role"
+        assert extraction_cache.cache_stats.hits == 1
+
+    async def test_without_session_cache_is_not_used(self, db: AsyncSession):
+        """Test that callers without a session always hit the LLM."""
+        with patch(
+            "app.services.extraction.extract_with_llm_async",
+            new_callable=AsyncMock,
+            return_value=_result(),
+        ) as mock_llm:
+            await extract_job_data(text="Some posting", url="https://a.example")
+            await extract_job_data(text="Some posting", url="https://a.example")
+
+        assert mock_llm.await_count == 2
@@ -0,0 +1,130 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.http_client import ResponseTooLargeError, SharedHttpClient
+
+
+def _client(handler, **overrides) -> SharedHttpClient:
+    options = {
+        "timeout": 5,
+        "max_redirects": 3,
+        "max_connections": 10,
+        "max_connections_per_host": 2,
+        "max_response_bytes": 1024,
+        "revalidation_cache_size": 8,
+        "revalidation_cache_bytes": 4096,
+        "http2": False,
+        "transport": httpx.MockTransport(handler),
+    }
+    options.update(overrides)
+    return SharedHttpClient(**options)
+
+
+HTML = {"content-type": "text/html; charset=utf-8"}
+
+
+class TestSharedHttpClient:
+    """Tests for SharedHttpClient.fetch_text."""
+
+    async def test_reuses_one_client(self):
+        """Test that consecutive fetches share the underlying client."""
+        client = _client(lambda request: httpx.Response(200, headers=HTML, text="ok"))
+        await client.fetch_text("https://boards.example/a", {})
+        first = client._client
+        await client.fetch_text("https://boards.example/b", {})
+
+        assert client._client is first
+        await client.close()
+
+    async def test_conditional_get_uses_cached_copy(self):
+        """Test that a 304 response is served from the local copy."""
+        seen_headers: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, headers={**HTML, "etag": '"v1"'}, text="<p>Job</p>"
+            )
+
+        client = _client(handler)
+        first = await client.fetch_text("https://boards.example/job", {})
+        second = await client.fetch_text("https://boards.example/job", {})
+
+        assert first.text == second.text == "<p>Job</p>"
+        assert not first.revalidated
+        assert second.revalidated
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        await client.close()
+
+    async def test_revalidation_cache_is_bounded_by_bytes(self):
+        """Test that cached pages are evicted once their bodies exceed the cap."""
+        body = "x" * 600
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={**HTML, "etag": '"v1"'}, text=body)
+
+        client = _client(handler, revalidation_cache_bytes=1000)
+        await client.fetch_text("https://boards.example/a", {})
+        await client.fetch_text("https://boards.example/b", {})
+
+        assert list(client._pages) == ["https://boards.example/b"]
+        assert client._pages_bytes == 600
+        await client.close()
+
+    async def test_declared_size_over_limit_is_rejected(self):
+        """Test that an oversized Content-Length is rejected up front."""
+        client = _client(
+            lambda request: httpx.Response(200, headers=HTML, content=b"x" * 4096)
+        )
+        with pytest.raises(ResponseTooLargeError):
+            await client.fetch_text("https://boards.example/big", {})
+        await client.close()
+
+    async def test_streamed_size_over_limit_is_rejected(self):
+        """Test that the cap is enforced on streamed bodies without a length."""
+
+        async def body():
+            for _ in range(8):
+                yield b"x" * 256
+
+        client = _client(
+            lambda request: httpx.Response(200, headers=HTML, content=body())
+        )
+        with pytest.raises(ResponseTooLargeError):
+            await client.fetch_text("https://boards.example/stream", {})
+        await client.close()
+
+    async def test_http_errors_are_raised(self):
+        """Test that error statuses raise HTTPStatusError."""
+        client = _client(lambda request: httpx.Response(404))
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.fetch_text("https://boards.example/missing", {})
+        await client.close()
+
+    async def test_per_host_limit(self):
+        """Test that concurrent requests to one host are capped."""
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, headers=HTML, text="ok")
+
+        client = _client(handler, max_connections_per_host=2)
+        await asyncio.gather(
+            *(client.fetch_text(f"https://boards.example/{i}", {}) for i in range(6))
+        )
+
+        assert peak == 2
+        await client.close()
@@ -0,0 +1,171 @@
+"""Tests for schema.org JobPosting / OpenGraph extraction."""
+
+import json
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+from app.schemas.job_lead import JobLeadExtractionInput
+from app.services.extraction import extract_job_data
+from app.services.structured_data import extract_structured_job_data
+
+JOB_POSTING = {
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": "Senior Backend Engineer",
+    "description": "<p>Build <strong>APIs</strong>.</p><ul><li>Python</li></ul>",
+    "datePosted": "2026-01-15T09:00:00Z",
+    "hiringOrganization": {"@type": "Organization", "name": "Acme &amp; Co"},
+    "jobLocation": {
+        "@type": "Place",
+        "address": {
+            "addressLocality": "Berlin",
+            "addressRegion": "Berlin",
+            "addressCountry": "DE",
+        },
+    },
+    "baseSalary": {
+        "@type": "MonetaryAmount",
+        "currency": "eur",
+        "value": {
+            "@type": "QuantitativeValue",
+            "minValue": 70000,
+            "maxValue": "90,000",
+            "unitText": "YEAR",
+        },
+    },
+    "experienceRequirements": {"monthsOfExperience": 60},
+    "skills": "Python, PostgreSQL",
+}
+
+
+def _page(*head: str) -> str:
+    return f"<html><head>{''.join(head)}</head><body><p>Body</p></body></html>"
+
+
+def _json_ld(document: object) -> str:
+    return f'<script type="application/ld+json">{json.dumps(document)}</script>'
+
+
+class TestExtractStructuredJobData:
+    """Tests for extract_structured_job_data."""
+
+    def test_full_job_posting(self):
+        """Test that every supported JobPosting field is mapped."""
+        result = extract_structured_job_data(_page(_json_ld(JOB_POSTING)))
+
+        assert result is not None
+        assert result.origin == "json-ld"
+        assert result.is_complete
+        data = result.job_data
+        assert data.title == "Senior Backend Engineer"
+        assert data.company == "Acme & Co"
+        assert "**APIs**" in data.description
+        assert data.location == "Berlin, DE"
+        assert (data.salary_min, data.salary_max) == (70000, 90000)
+        assert data.salary_currency == "EUR"
+        assert data.posted_date == date(2026, 1, 15)
+        assert data.years_experience_min == 5
+        assert data.skills == ["Python", "PostgreSQL"]
+
+    def test_job_posting_inside_graph(self):
+        """Test that JobPosting nodes nested in @graph are found."""
+        document = {
+            "@context": "https://schema.org",
+            "@graph": [{"@type": "WebPage"}, {**JOB_POSTING, "@type": ["JobPosting"]}],
+        }
+        result = extract_structured_job_data(_page(_json_ld(document)))
+
+        assert result is not None
+        assert result.job_data.title == "Senior Backend Engineer"
+
+    def test_hourly_salary_is_ignored(self):
+        """Test that non-annual salaries are not mapped to annual fields."""
+        posting = {
+            **JOB_POSTING,
+            "baseSalary": {
+                "currency": "USD",
+                "value": {"value": 45, "unitText": "HOUR"},
+            },
+        }
+        result = extract_structured_job_data(_page(_json_ld(posting)))
+
+        assert result is not None
+        assert result.job_data.salary_min is None
+
+    def test_remote_without_address(self):
+        """Test that TELECOMMUTE postings without an address are Remote."""
+        posting = {**JOB_POSTING, "jobLocationType": "TELECOMMUTE"}
+        del posting["jobLocation"]
+        result = extract_structured_job_data(_page(_json_ld(posting)))
+
+        assert result is not None
+        assert result.job_data.location == "Remote"
+
+    def test_opengraph_only_is_partial(self):
+        """Test that OpenGraph alone yields a title but is not complete."""
+        html = _page('<meta content="Data Analyst" property="og:title">')
+        result = extract_structured_job_data(html)
+
+        assert result is not None
+        assert result.origin == "opengraph"
+        assert result.job_data.title == "Data Analyst"
+        assert not result.is_complete
+
+    def test_merge_only_fills_empty_fields(self):
+        """Test that page metadata does not override the LLM's answer."""
+        html = _page('<meta content="Data Analyst | Acme Careers" property="og:title">')
+        result = extract_structured_job_data(html)
+        assert result is not None
+
+        merged = result.merge_into(JobLeadExtractionInput(title="Data Analyst"))
+        assert merged.title == "Data Analyst"
+        merged = result.merge_into(JobLeadExtractionInput(company="Acme"))
+        assert merged.title == "Data Analyst | Acme Careers"
+
+    def test_invalid_json_ld_is_skipped(self):
+        """Test that malformed JSON-LD blocks are ignored."""
+        html = _page('<script type="application/ld+json">{not json</script>')
+        assert extract_structured_job_data(html) is None
+
+    def test_page_without_metadata(self):
+        """Test that plain pages return None."""
+        assert extract_structured_job_data(_page("<title>Jobs</title>")) is None
+
+
+class TestExtractJobDataFastPath:
+    """Tests for the structured-data fast path in extract_job_data."""
+
+    async def test_complete_metadata_skips_llm(self):
+        """Test that complete JSON-LD is returned without calling the LLM."""
+        with patch(
+            "app.services.extraction.extract_with_llm_async", new_callable=AsyncMock
+        ) as mock_llm:
+            result = await extract_job_data(
+                html=_page(_json_ld(JOB_POSTING)),
+                url="https://boards.greenhouse.io/acme/jobs/1",
+            )
+
+        mock_llm.assert_not_awaited()
+        assert result.title == "Senior Backend Engineer"
+        assert result.source == "Greenhouse"
+
+    async def test_partial_metadata_sends_smaller_prompt(self):
+        """Test that a partial posting sends only its description to the LLM."""
+        posting = {**JOB_POSTING}
+        del posting["hiringOrganization"]
+        html = _page(_json_ld(posting)) + "<div>" + "navigation " * 2000 + "</div>"
+
+        with patch(
+            "app.services.extraction.extract_with_llm_async",
+            new_callable=AsyncMock,
+            return_value=JobLeadExtractionInput(title="Backend Eng", company="Acme"),
+        ) as mock_llm:
+            result = await extract_job_data(html=html, url="https://acme.example/1")
+
+        content = mock_llm.await_args.kwargs["content"]
+        assert "navigation" not in content
+        assert "Build" in content
+        # The model's answer is kept; metadata fills what it left empty
+        assert result.title == "Backend Eng"
+        assert result.company == "Acme"
+        assert result.salary_min == 70000
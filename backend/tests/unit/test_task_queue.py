@@ -0,0 +1,98 @@
+"""Tests for the in-process background task queue."""
+
+import asyncio
+
+import pytest
+
+from app.services.task_queue import BackgroundTaskQueue, TaskQueueFullError
+
+
+@pytest.fixture
+async def queue():
+    """Create a queue and stop its workers after the test."""
+    q = BackgroundTaskQueue("test", workers=2, maxsize=10)
+    yield q
+    await q.stop()
+
+
+async def test_submit_runs_task(queue):
+    """Test that submitted tasks run on a worker."""
+    results = []
+
+    async def task():
+        results.append("done")
+
+    queue.submit("a", task)
+    await queue.join()
+
+    assert results == ["done"]
+    assert not queue.is_pending("a")
+
+
+async def test_worker_pool_is_bounded(queue):
+    """Test that no more than `workers` tasks run at once."""
+    running = 0
+    peak = 0
+
+    async def task():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for i in range(6):
+        queue.submit(str(i), task)
+    await queue.join()
+
+    assert peak == 2
+
+
+async def test_wait_returns_when_task_finishes(queue):
+    """Test that wait() unblocks as soon as the keyed task completes."""
+    release = asyncio.Event()
+
+    async def task():
+        await release.wait()
+
+    queue.submit("slow", task)
+    assert await queue.wait("slow", timeout=0.01) is False
+
+    release.set()
+    assert await queue.wait("slow", timeout=1) is True
+
+
+async def test_failing_task_does_not_kill_worker(queue):
+    """Test that an exception in one task doesn't stop later tasks."""
+    results = []
+
+    async def bad():
+        raise RuntimeError("boom")
+
+    async def good():
+        results.append("ok")
+
+    queue.submit("bad", bad)
+    queue.submit("good", good)
+    await queue.join()
+
+    assert results == ["ok"]
+
+
+async def test_submit_when_full_raises():
+    """Test that submitting past maxsize raises TaskQueueFullError."""
+    q = BackgroundTaskQueue("full", workers=1, maxsize=1)
+    release = asyncio.Event()
+
+    async def task():
+        await release.wait()
+
+    try:
+        q.submit("1", task)
+        await asyncio.sleep(0)  # let the worker pick up the first task
+        q.submit("2", task)
+        with pytest.raises(TaskQueueFullError):
+            q.submit("3", task)
+    finally:
+        release.set()
+        await q.stop()
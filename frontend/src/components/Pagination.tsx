@@ -4,7 +4,8 @@ interface PaginationProps {
   currentPage: number;
   totalPages: number;
   perPage: number;
-  totalItems: number;
+  // null when the total is unknown; the current page is then full
+  totalItems: number | null;
   onPageChange: (page: number) => void;
 }
 
@@ -17,7 +18,10 @@ export default function Pagination({
 }: PaginationProps) {
   // Calculate item range
   const startItem = totalItems === 0 ? 0 : (currentPage - 1) * perPage + 1;
-  const endItem = Math.min(currentPage * perPage, totalItems);
+  const endItem =
+    totalItems === null
+      ? currentPage * perPage
+      : Math.min(currentPage * perPage, totalItems);
 
   // Generate page numbers with ellipsis logic
   const pageNumbers = useMemo(() => {
@@ -63,7 +67,9 @@ export default function Pagination({
     <div className="flex w-full flex-col items-center justify-between gap-4 sm:flex-row">
       {/* Item count display */}
       <div className="text-muted text-sm">
-        Showing {startItem}-{endItem} of {totalItems} items
+        {totalItems === null
+          ? `Showing ${startItem}-${endItem} items`
+          : `Showing ${startItem}-${endItem} of ${totalItems} items`}
       </div>
 
       {/* Pagination controls */}
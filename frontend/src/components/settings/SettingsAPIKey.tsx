@@ -29,7 +29,7 @@ export default function SettingsAPIKey() {
   }
 
   async function handleCopyKey() {
-    // Always copy the full key
+    // The full key is only returned right after (re)generation
     const keyToCopy = apiKeyData?.api_key_full;
     if (!keyToCopy) return;
 
@@ -97,19 +97,26 @@ export default function SettingsAPIKey() {
                 <div className="text-fg1 bg-bg2 flex-1 overflow-x-auto break-all rounded px-3 py-2 font-mono text-sm">
                   {displayKey}
                 </div>
-                <button
-                  onClick={handleCopyKey}
-                  className="bg-bg3 hover:bg-bg4 text-fg1 flex flex-shrink-0 cursor-pointer items-center gap-2 rounded px-3 py-2 transition-all duration-200 ease-in-out"
-                  title="Copy to clipboard"
-                >
-                  <i
-                    className={`bi-${copied ? 'check' : 'clipboard'} icon-sm`}
-                  />
-                  <span className="hidden sm:inline">
-                    {copied ? 'Copied' : 'Copy'}
-                  </span>
-                </button>
+                {apiKeyData.api_key_full && (
+                  <button
+                    onClick={handleCopyKey}
+                    className="bg-bg3 hover:bg-bg4 text-fg1 flex flex-shrink-0 cursor-pointer items-center gap-2 rounded px-3 py-2 transition-all duration-200 ease-in-out"
+                    title="Copy to clipboard"
+                  >
+                    <i
+                      className={`bi-${copied ? 'check' : 'clipboard'} icon-sm`}
+                    />
+                    <span className="hidden sm:inline">
+                      {copied ? 'Copied' : 'Copy'}
+                    </span>
+                  </button>
+                )}
               </div>
+              <p className="text-muted mt-2 text-xs">
+                {apiKeyData.api_key_full
+                  ? 'Copy this key now. It will not be shown again.'
+                  : 'Only a hash of your key is stored. Regenerate it if you need to copy it again.'}
+              </p>
             </div>
 
             {/* Regenerate Section */}
@@ -87,6 +87,7 @@ interface InterviewRoundsResponse {
   outcome_data: OutcomeData[];
   timeline_data: TimelineData[];
   candidate_progress: CandidateProgress[];
+  candidate_total: number;
 }
 
 export async function getInterviewRoundsData(
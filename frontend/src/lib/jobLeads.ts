@@ -12,9 +12,11 @@ interface JobLeadsParams {
 
 interface JobLeadsListResponse {
   items: JobLead[];
-  total: number;
+  // null when the count was skipped (include_total=false)
+  total: number | null;
   page: number;
   per_page: number;
+  next_cursor: string | null;
 }
 
 /**
@@ -24,6 +24,8 @@ export interface RoundMedia {
   id: string;
   file_path: string;
   media_type: string;
+  file_size: number | null;
+  checksum: string | null;
   uploaded_at: string;
 }
 
@@ -73,9 +75,11 @@ export interface Application {
 
 export interface ApplicationListResponse {
   items: Application[];
-  total: number;
+  // null when the count was skipped (include_total=false)
+  total: number | null;
   page: number;
   per_page: number;
+  next_cursor: string | null;
 }
 
 export interface ApplicationCreate {
@@ -21,7 +21,7 @@ export default function Applications() {
   const [searchParams, setSearchParams] = useSearchParams();
   const [applications, setApplications] = useState<Application[]>([]);
   const [statuses, setStatuses] = useState<Status[]>([]);
-  const [total, setTotal] = useState(0);
+  const [total, setTotal] = useState<number | null>(0);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [showCreateModal, setShowCreateModal] = useState(false);
@@ -72,7 +72,13 @@ export default function Applications() {
 
       const data = await listApplications(params);
       setApplications(data.items);
-      setTotal(data.total);
+      // Without a count, the last page still tells us the total
+      setTotal(
+        data.total ??
+          (data.next_cursor === null
+            ? (page - 1) * perPage + data.items.length
+            : null)
+      );
     } catch {
       const errorMsg = 'Failed to load applications';
       setError(errorMsg);
@@ -101,7 +107,8 @@ export default function Applications() {
     setSearchParams(newParams);
   }
 
-  const totalPages = Math.ceil(total / perPage);
+  // An unknown total means there is at least one more page
+  const totalPages = total === null ? page + 1 : Math.ceil(total / perPage);
 
   function formatDate(dateStr: string) {
     return new Date(dateStr).toLocaleDateString();
@@ -24,10 +24,13 @@ export default function Dashboard() {
     async function loadTotalApplications() {
       try {
         const data = await listApplications({ page: 1, per_page: 1 });
-        setTotalApplications(data.total);
+        // Only compared with zero, so a page of items stands in for a
+        // skipped count
+        const total = data.total ?? data.items.length;
+        setTotalApplications(total);
 
         // Show import prompt if no applications and user hasn't dismissed it
-        if (data.total === 0) {
+        if (total === 0) {
           const hasSeenPrompt = localStorage.getItem('import-prompt-seen');
           if (!hasSeenPrompt) {
             setShowImportPrompt(true);
@@ -57,7 +57,7 @@ export default function JobLeads() {
   const toast = useToastContext();
   const [searchParams, setSearchParams] = useSearchParams();
   const [jobLeads, setJobLeads] = useState<JobLead[]>([]);
-  const [total, setTotal] = useState(0);
+  const [total, setTotal] = useState<number | null>(0);
   const [loading, setLoading] = useState(true);
   const [perPage, setPerPage] = useState(25);
 
@@ -97,15 +97,21 @@ export default function JobLeads() {
         per_page: perPage,
       };
       if (statusFilter) params.status = statusFilter;
-      // Note: search, source, and sort are not yet implemented in the backend
-      // but we send them anyway for forward compatibility
       if (debouncedSearch) params.search = debouncedSearch;
+      // Note: source and sort are not yet implemented in the backend
+      // but we send them anyway for forward compatibility
       if (sourceFilter) params.source = sourceFilter;
       if (sortFilter) params.sort = sortFilter;
 
       const data = await getJobLeads(params);
       setJobLeads(data.items);
-      setTotal(data.total);
+      // Without a count, the last page still tells us the total
+      setTotal(
+        data.total ??
+          (data.next_cursor === null
+            ? (page - 1) * perPage + data.items.length
+            : null)
+      );
     } catch {
       toast.error('Failed to load job leads');
     } finally {
@@ -333,7 +339,9 @@ export default function JobLeads() {
             <div className="mt-6">
               <Pagination
                 currentPage={page}
-                totalPages={Math.ceil(total / perPage)}
+                totalPages={
+                  total === null ? page + 1 : Math.ceil(total / perPage)
+                }
                 perPage={perPage}
                 totalItems={total}
                 onPageChange={(newPage) =>